@@ -4,25 +4,29 @@ from datetime import datetime, timezone
 from config.logger import setup_logging
 from config.settings import (
     BINANCE_API_KEY, BINANCE_API_SECRET, OPENAI_API_KEY, TELEGRAM_BOT_TOKEN,
-    TELEGRAM_CHAT_ID, TELEGRAM_MESSAGE_DELAY, SYMBOLS_TO_MONITOR, BINANCE_TO_COINGECKO_SYMBOLS,
-    CANDLESTICK_INTERVAL
+    TELEGRAM_CHAT_ID, SYMBOLS_TO_MONITOR, BINANCE_TO_COINGECKO_SYMBOLS,
+    CANDLESTICK_INTERVAL, BINANCE_MAX_WORKERS, CANDLE_STORE_ENABLED, SQLITE3_DATABASE_FILE,
+    CHART_CACHE_ENABLED, TELEGRAM_DELIVERY_MODE
 )
-from utils.db_utils import insert_into_history
+from utils.db_utils import HistoryRepository, IndicatorSnapshotRepository
 from utils.utils import count_tokens, prepare_currency_data, split_reasoning_by_symbol
 from services.data_aggregator_service import DataAggregatorService
 from services.gpt_analysis_service import GPTAnalysisService
 from services.chart_generator_service import ChartGeneratorService
-from notifications.telegram_notifications import send_analysis_to_telegram_with_image
+from services.chart_cache import ChartCache
+from notifications.telegram_delivery import TelegramDeliveryQueue
 from data_fetching.binance_client import BinanceClient
+from utils.candle_store import CandleStore
 
 logger = setup_logging()
 
-async def analyze_top_cryptos(mode="full-analysis"):
+async def analyze_top_cryptos(mode="full-analysis", delivery_mode=TELEGRAM_DELIVERY_MODE):
     logger.info("Starting cryptocurrency analysis...")
-    BC = BinanceClient(BINANCE_API_KEY, BINANCE_API_SECRET)
+    candle_store = CandleStore(SQLITE3_DATABASE_FILE) if CANDLE_STORE_ENABLED else None
+    BC = BinanceClient(BINANCE_API_KEY, BINANCE_API_SECRET, candle_store=candle_store)
     gpt_service = GPTAnalysisService(api_key=OPENAI_API_KEY)
     data_aggregator_service = DataAggregatorService()
-    chart_generator_service = ChartGeneratorService()
+    chart_generator_service = ChartGeneratorService(chart_cache=ChartCache() if CHART_CACHE_ENABLED else None)
 
     try:
         global_metrics, bitcoin_sentiment, coingecko_data = None, None, None
@@ -33,6 +37,8 @@ async def analyze_top_cryptos(mode="full-analysis"):
         coingecko_data = data_aggregator_service.fetch_coingecko_data(SYMBOLS_TO_MONITOR, BINANCE_TO_COINGECKO_SYMBOLS)
 
         significant_symbols = gpt_service.analyze_symbols(SYMBOLS_TO_MONITOR, BC, coingecko_data)
+        with IndicatorSnapshotRepository(SQLITE3_DATABASE_FILE) as snapshots:
+            logger.info(f"Saved {snapshots.insert_many(significant_symbols)} indicator snapshots.")
         if not significant_symbols:
             logger.warning("No significant symbols to process.")
             if mode == "charts-only":
@@ -57,36 +63,49 @@ async def analyze_top_cryptos(mode="full-analysis"):
         else:
             reasoning = "Test reasoning for debugging purposes."
 
-        currency_data = prepare_currency_data(SYMBOLS_TO_MONITOR, BC, CANDLESTICK_INTERVAL)
+        currency_data = prepare_currency_data(
+            SYMBOLS_TO_MONITOR, BC, CANDLESTICK_INTERVAL, max_workers=BINANCE_MAX_WORKERS
+        )
+        logger.info(f"Binance request timings: {BC.timings.summary()}")
+        logger.info(f"Binance request cache: {BC.cache_stats()}")
 
-        for symbol, df in currency_data.items():
-            if not df.empty:
-                chart_file = chart_generator_service.generate_single_chart(symbol, df, CANDLESTICK_INTERVAL)
-                if chart_file:
+        reasoning_blocks = None
+        # Rows are buffered and written in a single transaction when the repository closes
+        with HistoryRepository(SQLITE3_DATABASE_FILE) as history:
+            delivery = None
+            if mode not in ["charts-only", "skip-telegram"]:
+                delivery = await TelegramDeliveryQueue(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, mode=delivery_mode).start()
+            try:
+                # Charts arrive as workers finish them and are queued for delivery while the rest still render
+                async for symbol, chart_file in chart_generator_service.generate_charts(
+                    currency_data, CANDLESTICK_INTERVAL
+                ):
+                    if not chart_file:
+                        continue
+                    if reasoning_blocks is None:
+                        reasoning_blocks = split_reasoning_by_symbol(reasoning, SYMBOLS_TO_MONITOR)
                     chart_files.append((symbol, chart_file))
+                    message = reasoning_blocks.get(symbol, f"No specific analysis for {symbol}.")
+                    current_datetime = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+                    message = f"{symbol} - {message}\n\n{current_datetime} (UTC)"
 
-        if chart_files:
-            reasoning_blocks = split_reasoning_by_symbol(reasoning, SYMBOLS_TO_MONITOR)
-            for symbol, chart_file in chart_files:
-                message = reasoning_blocks.get(symbol, f"No specific analysis for {symbol}.")
-                current_datetime = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-                message = f"{symbol} - {message}\n\n{current_datetime} (UTC)"
+                    history.add(symbol, message, chart_file)
 
-                insert_into_history(symbol, message, chart_file)
-                
-                if mode not in ["charts-only", "skip-telegram"]:
-                    try:
-                        await send_analysis_to_telegram_with_image(
-                            TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, message, chart_file
-                        )
-                        logger.info(f"Sent message for {symbol} to Telegram.")
-                    except Exception as e:
-                        logger.error(f"Failed to send message for {symbol}: {e}", exc_info=True)
-                    await asyncio.sleep(TELEGRAM_MESSAGE_DELAY)
+                    if delivery:
+                        delivery.submit(symbol, message, chart_file)
+            finally:
+                if delivery:
+                    await delivery.close()
+                    logger.info(f"Telegram delivery: {delivery.stats()}")
+        if chart_generator_service.chart_cache:
+            logger.info(f"Chart cache: {chart_generator_service.chart_cache.stats()}")
         logger.info("Program finished with no errors.")
 
     except Exception as e:
         logger.error(f"An error occurred during analysis: {e}", exc_info=True)
+    finally:
+        if candle_store:
+            candle_store.close()
 
 if __name__ == "__main__":
     asyncio.run(analyze_top_cryptos())
\ No newline at end of file
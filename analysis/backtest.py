@@ -0,0 +1,209 @@
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from config.settings import BACKTEST_WORKERS, CANDLE_ARCHIVE_DIR, SQLITE3_DATABASE_FILE
+from analysis.technical_indicators import IndicatorEngine
+from analysis.technical_indicators.indicator_engine import DEFAULT_INDICATORS
+from data_fetching.kline_parser import parse_klines
+from utils.candle_archive import CandleArchive
+from utils.candle_store import CandleStore
+import logging
+
+logger = logging.getLogger()
+
+SOURCES = ("archive", "store")
+
+DEFAULT_RULE_PARAMS = {
+    "rsi_oversold": 30.0,
+    "rsi_overbought": 70.0,
+}
+
+
+def _hold(enter, exit_):
+    # Long from an entry bar until the next exit bar; ffill of the last event, fully vectorized
+    events = np.where(enter, 1.0, np.where(exit_, 0.0, np.nan))
+    index = np.where(np.isnan(events), 0, np.arange(len(events)))
+    np.maximum.accumulate(index, out=index)
+    held = events[index]
+    return np.where(np.isnan(held), 0.0, held)
+
+
+def rsi_rule(close, indicators, params):
+    rsi = indicators["rsi"]
+    return _hold(rsi < params["rsi_oversold"], rsi > params["rsi_overbought"])
+
+
+def macd_rule(close, indicators, params):
+    return (indicators["macd"] > indicators["signal"]).astype(float)
+
+
+def bollinger_rule(close, indicators, params):
+    middle = (indicators["bollinger_upper"] + indicators["bollinger_lower"]) / 2
+    return _hold(close < indicators["bollinger_lower"], close > middle)
+
+
+def combined_rule(close, indicators, params):
+    # RSI and Bollinger must agree on an oversold entry; a bearish MACD cross or overbought RSI exits
+    enter = (indicators["rsi"] < params["rsi_oversold"]) & (close < indicators["bollinger_lower"])
+    exit_ = (indicators["macd"] < indicators["signal"]) | (indicators["rsi"] > params["rsi_overbought"])
+    return _hold(enter, exit_)
+
+
+RULES = {
+    "rsi": rsi_rule,
+    "macd": macd_rule,
+    "bollinger": bollinger_rule,
+    "combined": combined_rule,
+}
+
+# Only the indicators a rule reads are computed; rules missing here get the full set
+RULE_INDICATORS = {
+    "rsi": ("rsi",),
+    "macd": ("macd",),
+    "bollinger": ("bollinger",),
+    "combined": ("rsi", "macd", "bollinger"),
+}
+
+
+def run_backtest(data, rule="rsi", fee_bps=10.0, rule_params=None, **indicator_params):
+    if rule not in RULES:
+        raise ValueError(f"Unknown backtest rule: {rule}")
+    params = {**DEFAULT_RULE_PARAMS, **(rule_params or {})}
+    close = data["close"].to_numpy(dtype=float)
+    result = {"candles": len(close), "trades": 0, "pnl": 0.0, "max_drawdown": 0.0, "hit_rate": None, "exposure": 0.0}
+    if len(close) < 2:
+        return result
+
+    values = IndicatorEngine(RULE_INDICATORS.get(rule, DEFAULT_INDICATORS), **indicator_params).compute(data)
+    indicators = {column: values[column].to_numpy(dtype=float) for column in values}
+    position = RULES[rule](close, indicators, params)
+
+    # The position decided at a bar's close earns the next bar's return; fees are paid on every change
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bar_returns = np.nan_to_num(close[1:] / close[:-1] - 1)
+    held = position[:-1]
+    turnover = np.abs(np.diff(position, prepend=0.0))[:-1]
+    strategy_returns = held * bar_returns - turnover * fee_bps / 10_000
+
+    equity = np.cumprod(1 + strategy_returns)
+    drawdown = equity / np.maximum.accumulate(np.maximum(equity, 1.0)) - 1
+
+    # Each run of consecutive held bars is one trade; the bar that pays the exit fee belongs to it too
+    entries = (held != 0) & (np.concatenate(([0.0], held[:-1])) == 0)
+    in_trade = (held != 0) | (turnover > 0)
+    trade_ids = np.cumsum(entries)[in_trade] - 1
+    trade_returns = np.expm1(np.bincount(trade_ids, weights=np.log1p(strategy_returns[in_trade])))
+
+    result.update({
+        "trades": len(trade_returns),
+        "pnl": float(equity[-1] - 1),
+        "max_drawdown": float(drawdown.min()),
+        "hit_rate": float((trade_returns > 0).mean()) if len(trade_returns) else None,
+        "exposure": float((held != 0).mean()),
+    })
+    return result
+
+
+def load_candles(source, location, symbol, interval, start=None, end=None, limit=1_000_000):
+    if source == "archive":
+        return CandleArchive(location).read_frame(
+            symbol, interval, start=start, end=end, columns=["open_time", "open", "high", "low", "close", "volume"]
+        )
+    if source == "store":
+        with CandleStore(location) as store:
+            klines = store.load(symbol, interval, limit)
+        frame = parse_klines(klines)
+        if start is not None:
+            frame = frame[frame["open_time"] >= pd.Timestamp(start)]
+        if end is not None:
+            frame = frame[frame["open_time"] < pd.Timestamp(end)]
+        return frame.reset_index(drop=True)
+    raise ValueError(f"Unknown candle source: {source}")
+
+
+def _backtest_symbol(source, location, symbol, interval, start, end, rule, fee_bps, rule_params):
+    # Runs inside a worker process, which opens the local data itself instead of receiving it pickled
+    data = load_candles(source, location, symbol, interval, start=start, end=end)
+    return {"symbol": symbol, **run_backtest(data, rule=rule, fee_bps=fee_bps, rule_params=rule_params)}
+
+
+def backtest_symbols(symbols, interval, source="archive", location=None, start=None, end=None, rule="rsi",
+                     fee_bps=10.0, rule_params=None, max_workers=BACKTEST_WORKERS):
+    if source not in SOURCES:
+        raise ValueError(f"Unknown candle source: {source}")
+    if rule not in RULES:
+        raise ValueError(f"Unknown backtest rule: {rule}")
+    location = location or (CANDLE_ARCHIVE_DIR if source == "archive" else SQLITE3_DATABASE_FILE)
+    jobs = [(source, location, symbol, interval, start, end, rule, fee_bps, rule_params) for symbol in symbols]
+
+    results = []
+    if max_workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                results.append(_backtest_symbol(*job))
+            except Exception as e:
+                logger.error(f"Backtest failed for {job[2]}: {e}", exc_info=True)
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [(job[2], executor.submit(_backtest_symbol, *job)) for job in jobs]
+        for symbol, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Backtest failed for {symbol}: {e}", exc_info=True)
+    return results
+
+
+def summarize(results):
+    traded = [result for result in results if result["trades"]]
+    trades = sum(result["trades"] for result in results)
+    wins = sum(result["hit_rate"] * result["trades"] for result in traded)
+    return {
+        "symbols": len(results),
+        "candles": sum(result["candles"] for result in results),
+        "trades": trades,
+        "mean_pnl": float(np.mean([result["pnl"] for result in results])) if results else 0.0,
+        "worst_drawdown": min((result["max_drawdown"] for result in results), default=0.0),
+        "hit_rate": wins / trades if trades else None,
+    }
+
+
+def _format_rate(value):
+    return "n/a" if value is None else f"{value:.1%}"
+
+
+if __name__ == "__main__":
+    from config.settings import SYMBOLS_TO_MONITOR, CANDLESTICK_INTERVAL
+
+    parser = argparse.ArgumentParser(description="Backtest indicator rules against locally stored candles.")
+    parser.add_argument("--rule", type=str, default="rsi", choices=list(RULES))
+    parser.add_argument("--source", type=str, default="archive", choices=list(SOURCES))
+    parser.add_argument("--location", type=str, default=None, help="Archive directory or SQLite database file")
+    parser.add_argument("--interval", type=str, default=CANDLESTICK_INTERVAL)
+    parser.add_argument("--symbols", nargs="*", default=SYMBOLS_TO_MONITOR)
+    parser.add_argument("--start", type=str, default=None)
+    parser.add_argument("--end", type=str, default=None)
+    parser.add_argument("--fee-bps", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=BACKTEST_WORKERS)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = backtest_symbols(
+        args.symbols, args.interval, source=args.source, location=args.location, start=args.start, end=args.end,
+        rule=args.rule, fee_bps=args.fee_bps, max_workers=args.workers,
+    )
+    for result in sorted(results, key=lambda result: result["pnl"], reverse=True):
+        print(
+            f"{result['symbol']:<12} candles {result['candles']:>8}  trades {result['trades']:>5}  "
+            f"pnl {result['pnl']:>8.2%}  max drawdown {result['max_drawdown']:>8.2%}  "
+            f"hit rate {_format_rate(result['hit_rate']):>6}"
+        )
+    summary = summarize(results)
+    print(
+        f"{summary['symbols']} symbols, {summary['candles']} candles, {summary['trades']} trades in "
+        f"{time.perf_counter() - started:.1f}s: mean pnl {summary['mean_pnl']:.2%}, "
+        f"worst drawdown {summary['worst_drawdown']:.2%}, hit rate {_format_rate(summary['hit_rate'])}"
+    )
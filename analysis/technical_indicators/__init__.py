@@ -1,18 +1,53 @@
-from .momentum_indicators import calculate_rsi, calculate_macd, calculate_stochastic_oscillator
+from . import kernels
+from .momentum_indicators import (
+    calculate_rsi,
+    calculate_macd,
+    calculate_stochastic_oscillator,
+    calculate_stochastic_oscillator_multi,
+    calculate_williams_r,
+    calculate_williams_r_multi,
+)
 from .volume_indicators import calculate_vwap, calculate_obv, calculate_order_book_imbalance
-from .volatility_indicators import calculate_bollinger_bands, calculate_atr
+from .volatility_indicators import (
+    calculate_bollinger_bands,
+    calculate_atr,
+    calculate_donchian_channels,
+    calculate_donchian_channels_multi,
+)
 from .trend_indicators import calculate_adx
 from .price_indicators import calculate_bid_ask_spread
+from .indicator_engine import IndicatorEngine
+from .streaming_indicators import StreamingIndicators, StreamingPriceExtremes
+from .rolling import MultiPeriodExtremum, rolling_extrema, rolling_price_extremes
+from .panel import compute_panel, stack_frames
+from .sweep import calculate_rsi_multi, calculate_atr_multi, calculate_bollinger_bands_multi, calculate_adx_multi
 
 __all__ = [
     "calculate_rsi",
     "calculate_macd",
     "calculate_stochastic_oscillator",
+    "calculate_stochastic_oscillator_multi",
+    "calculate_williams_r",
+    "calculate_williams_r_multi",
     "calculate_vwap",
     "calculate_obv",
     "calculate_bollinger_bands",
     "calculate_atr",
+    "calculate_donchian_channels",
+    "calculate_donchian_channels_multi",
     "calculate_adx",
     "calculate_bid_ask_spread",
     "calculate_order_book_imbalance",
+    "IndicatorEngine",
+    "StreamingIndicators",
+    "StreamingPriceExtremes",
+    "MultiPeriodExtremum",
+    "rolling_extrema",
+    "rolling_price_extremes",
+    "compute_panel",
+    "stack_frames",
+    "calculate_rsi_multi",
+    "calculate_atr_multi",
+    "calculate_bollinger_bands_multi",
+    "calculate_adx_multi",
 ]
@@ -0,0 +1,225 @@
+import pandas as pd
+import numpy as np
+from . import kernels
+
+# Output columns produced by each indicator
+INDICATOR_COLUMNS = {
+    "rsi": ("rsi",),
+    "macd": ("macd", "signal"),
+    "bollinger": ("bollinger_upper", "bollinger_lower"),
+    "vwap": ("vwap",),
+    "atr": ("atr",),
+    "obv": ("obv",),
+    "stochastic": ("stochastic",),
+    "adx": ("adx",),
+}
+
+DEFAULT_INDICATORS = tuple(INDICATOR_COLUMNS)
+
+DEFAULT_PARAMS = {
+    "rsi_period": 14,
+    "macd_short_period": 12,
+    "macd_long_period": 26,
+    "macd_signal_period": 9,
+    "bollinger_window": 20,
+    "atr_period": 14,
+    "stochastic_period": 14,
+    "adx_period": 14,
+}
+
+RAW_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _indicator_dependencies(indicator, params):
+    if indicator == "rsi":
+        period = params["rsi_period"]
+        return (f"mean1:gain:{period}", f"mean1:loss:{period}")
+    if indicator == "macd":
+        return ("macd_line", f"ema:macd_line:{params['macd_signal_period']}")
+    if indicator == "bollinger":
+        window = params["bollinger_window"]
+        return (f"mean:close:{window}", f"std:close:{window}")
+    if indicator == "vwap":
+        return ("cum_price_volume", "cum_volume")
+    if indicator == "atr":
+        return (f"mean:true_range:{params['atr_period']}",)
+    if indicator == "obv":
+        return ("close_diff",)
+    if indicator == "stochastic":
+        period = params["stochastic_period"]
+        return (f"min:low:{period}", f"max:high:{period}")
+    if indicator == "adx":
+        return (f"mean:dx:{params['adx_period']}",)
+    raise ValueError(f"Unknown indicator: {indicator}")
+
+
+def _node_dependencies(node, params):
+    if node in RAW_COLUMNS:
+        return ()
+    if node in ("prev_close", "close_diff", "cum_volume"):
+        return ()
+    if node in ("gain", "loss"):
+        return ("close_diff",)
+    if node == "true_range":
+        return ("prev_close",)
+    if node in ("plus_dm", "minus_dm"):
+        return ()
+    if node == "cum_price_volume":
+        return ()
+    if node == "macd_line":
+        return (f"ema:close:{params['macd_short_period']}", f"ema:close:{params['macd_long_period']}")
+    if node == "dx":
+        period = params["adx_period"]
+        return (f"mean:true_range:{period}", f"mean:plus_dm:{period}", f"mean:minus_dm:{period}")
+    _, source, _ = node.split(":")
+    return (source,)
+
+
+def _compute_node(node, data, values, params):
+    # Intermediates are plain NumPy arrays; pandas is only used for rolling/ewm windows
+    if node in RAW_COLUMNS:
+        return data[node].to_numpy()
+    if node == "prev_close":
+        return data["close"].shift().to_numpy()
+    if node == "close_diff":
+        return data["close"].diff().to_numpy()
+    if node == "gain":
+        delta = values["close_diff"]
+        return np.where(delta > 0, delta, 0)
+    if node == "loss":
+        delta = values["close_diff"]
+        return np.where(delta < 0, -delta, 0)
+    if node == "true_range":
+        prev_close = values["prev_close"]
+        high = data["high"].to_numpy()
+        low = data["low"].to_numpy()
+        high_low = high - low
+        high_close = np.abs(high - prev_close)
+        low_close = np.abs(low - prev_close)
+        # fmax skips NaN like DataFrame.max(axis=1)
+        return np.fmax(np.fmax(high_low, high_close), low_close)
+    if node == "plus_dm":
+        move = data["high"].diff().to_numpy()
+        return np.where(move < 0, 0, move)
+    if node == "minus_dm":
+        move = (data["low"].shift() - data["low"]).to_numpy()
+        return np.where(move < 0, 0, move)
+    if node == "cum_price_volume":
+        return np.cumsum(data["volume"].to_numpy() * data["close"].to_numpy())
+    if node == "cum_volume":
+        return np.cumsum(data["volume"].to_numpy())
+    if node == "macd_line":
+        deps = _node_dependencies(node, params)
+        return values[deps[0]] - values[deps[1]]
+    if node == "dx":
+        atr, plus_mean, minus_mean = (values[dep] for dep in _node_dependencies(node, params))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = 100 * (plus_mean / atr)
+            minus_di = 100 * (minus_mean / atr)
+            return 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+
+    op, source, window = node.split(":")
+    window = int(window)
+    if kernels.USE_KERNELS:
+        return _compute_kernel_node(op, values[source], window)
+    series = pd.Series(values[source])
+    if op == "mean":
+        return series.rolling(window=window).mean().to_numpy()
+    if op == "mean1":
+        return series.rolling(window=window, min_periods=1).mean().to_numpy()
+    if op == "std":
+        return series.rolling(window=window).std().to_numpy()
+    if op == "min":
+        return series.rolling(window=window).min().to_numpy()
+    if op == "max":
+        return series.rolling(window=window).max().to_numpy()
+    if op == "ema":
+        return series.ewm(span=window, adjust=False).mean().to_numpy()
+    raise ValueError(f"Unknown intermediate: {node}")
+
+
+def _compute_kernel_node(op, source, window):
+    if op == "mean":
+        return kernels.rolling_mean(source, window)
+    if op == "mean1":
+        return kernels.rolling_mean(source, window, min_periods=1)
+    if op == "std":
+        return kernels.rolling_std(source, window)
+    if op == "min":
+        return kernels.rolling_min(source, window)
+    if op == "max":
+        return kernels.rolling_max(source, window)
+    if op == "ema":
+        return kernels.ema(source, window)
+    raise ValueError(f"Unknown intermediate: {op}:{window}")
+
+
+def _compute_indicator(indicator, data, values, params):
+    deps = [values[dep] for dep in _indicator_dependencies(indicator, params)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if indicator == "rsi":
+            avg_gain, avg_loss = deps
+            return (100 - (100 / (1 + avg_gain / avg_loss)),)
+        if indicator == "bollinger":
+            sma, std = deps
+            return sma + (2 * std), sma - (2 * std)
+        if indicator == "vwap":
+            cum_price_volume, cum_volume = deps
+            return (cum_price_volume / cum_volume,)
+        if indicator == "obv":
+            delta = deps[0][1:]
+            if len(delta) == 0:
+                return (np.zeros(len(data), dtype=int),)
+            direction = (delta > 0).astype(np.int8) - (delta < 0).astype(np.int8)
+            return (np.concatenate(([0], np.cumsum(direction * data["volume"].to_numpy()[1:]))),)
+        if indicator == "stochastic":
+            lowest_low, highest_high = deps
+            return ((data["close"].to_numpy() - lowest_low) / (highest_high - lowest_low) * 100,)
+    return tuple(deps)
+
+
+class IndicatorEngine:
+    def __init__(self, indicators=DEFAULT_INDICATORS, **params):
+        unknown = set(indicators) - set(INDICATOR_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown indicators: {sorted(unknown)}")
+        unknown_params = set(params) - set(DEFAULT_PARAMS)
+        if unknown_params:
+            raise ValueError(f"Unknown indicator parameters: {sorted(unknown_params)}")
+
+        self.indicators = tuple(indicators)
+        self.params = {**DEFAULT_PARAMS, **params}
+        self.plan = self._build_plan()
+
+    def _build_plan(self):
+        # Depth-first topological order; each shared intermediate appears once
+        plan, visited = [], set()
+
+        def visit(node):
+            if node in visited:
+                return
+            visited.add(node)
+            for dep in _node_dependencies(node, self.params):
+                visit(dep)
+            plan.append(node)
+
+        for indicator in self.indicators:
+            for dep in _indicator_dependencies(indicator, self.params):
+                visit(dep)
+        return plan
+
+    @property
+    def columns(self):
+        return [column for indicator in self.indicators for column in INDICATOR_COLUMNS[indicator]]
+
+    def compute(self, data):
+        values = {}
+        for node in self.plan:
+            values[node] = _compute_node(node, data, values, self.params)
+
+        result = {}
+        for indicator in self.indicators:
+            outputs = _compute_indicator(indicator, data, values, self.params)
+            for column, series in zip(INDICATOR_COLUMNS[indicator], outputs):
+                result[column] = series
+        return pd.DataFrame(result, index=data.index)
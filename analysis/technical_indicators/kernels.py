@@ -0,0 +1,168 @@
+import numpy as np
+from config.settings import INDICATOR_BACKEND
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # Without Numba the kernels stay plain Python; they are only selected when compiled
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# The pandas implementations remain the fallback whenever Numba is missing or disabled
+USE_KERNELS = NUMBA_AVAILABLE and INDICATOR_BACKEND != "pandas"
+
+
+@njit(cache=True)
+def _ema_kernel(values, alpha):
+    # Same recurrence as pandas ewm(adjust=False, ignore_na=False), including NaN gaps
+    n = len(values)
+    result = np.empty(n)
+    if n == 0:
+        return result
+    weighted = values[0]
+    nobs = 1 if weighted == weighted else 0
+    result[0] = weighted if nobs else np.nan
+    old_weight = 1.0
+    for i in range(1, n):
+        value = values[i]
+        is_observation = value == value
+        nobs += is_observation
+        if weighted == weighted:
+            old_weight *= 1.0 - alpha
+            if is_observation:
+                if weighted != value:
+                    weighted = (old_weight * weighted + alpha * value) / (old_weight + alpha)
+                old_weight = 1.0
+        elif is_observation:
+            weighted = value
+        result[i] = weighted if nobs else np.nan
+    return result
+
+
+@njit(cache=True)
+def _rolling_mean_kernel(values, window, min_periods):
+    n = len(values)
+    result = np.empty(n)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        value = values[i]
+        if value == value:
+            total += value
+            count += 1
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                total -= old
+                count -= 1
+                if count == 0:
+                    total = 0.0
+        result[i] = total / count if count >= min_periods and count > 0 else np.nan
+    return result
+
+
+@njit(cache=True)
+def _rolling_std_kernel(values, window, min_periods):
+    # Welford updates, as in StreamingIndicators' RollingWindow
+    n = len(values)
+    result = np.empty(n)
+    count = 0
+    mean = 0.0
+    ssqdm = 0.0
+    for i in range(n):
+        value = values[i]
+        if value == value:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            ssqdm += delta * (value - mean)
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    ssqdm = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    ssqdm -= delta * (old - mean)
+        if count >= min_periods and count > 1:
+            result[i] = np.sqrt(max(ssqdm, 0.0) / (count - 1))
+        else:
+            result[i] = np.nan
+    return result
+
+
+@njit(cache=True)
+def _rolling_extremum_kernel(values, window, min_periods, find_max):
+    # Monotonic deque of positions; each value enters and leaves it at most once
+    n = len(values)
+    result = np.empty(n)
+    candidates = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    count = 0
+    for i in range(n):
+        value = values[i]
+        if value == value:
+            count += 1
+            while tail > head and (
+                values[candidates[tail - 1]] <= value if find_max else values[candidates[tail - 1]] >= value
+            ):
+                tail -= 1
+            candidates[tail] = i
+            tail += 1
+        if i >= window and values[i - window] == values[i - window]:
+            count -= 1
+        while tail > head and candidates[head] <= i - window:
+            head += 1
+        result[i] = values[candidates[head]] if count >= min_periods and count > 0 and tail > head else np.nan
+    return result
+
+
+@njit(cache=True)
+def _obv_kernel(close, volume):
+    n = len(close)
+    result = np.zeros(n)
+    for i in range(1, n):
+        if close[i] > close[i - 1]:
+            result[i] = result[i - 1] + volume[i]
+        elif close[i] < close[i - 1]:
+            result[i] = result[i - 1] - volume[i]
+        else:
+            result[i] = result[i - 1]
+    return result
+
+
+def _as_float(values):
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def ema(values, span):
+    return _ema_kernel(_as_float(values), 2.0 / (span + 1.0))
+
+
+def rolling_mean(values, window, min_periods=None):
+    return _rolling_mean_kernel(_as_float(values), window, window if min_periods is None else min_periods)
+
+
+def rolling_std(values, window, min_periods=None):
+    return _rolling_std_kernel(_as_float(values), window, window if min_periods is None else min_periods)
+
+
+def rolling_min(values, window, min_periods=None):
+    return _rolling_extremum_kernel(_as_float(values), window, window if min_periods is None else min_periods, False)
+
+
+def rolling_max(values, window, min_periods=None):
+    return _rolling_extremum_kernel(_as_float(values), window, window if min_periods is None else min_periods, True)
+
+
+def obv(close, volume):
+    return _obv_kernel(_as_float(close), _as_float(volume))
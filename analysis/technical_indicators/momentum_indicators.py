@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 import logging
+from . import kernels
+from .rolling import rolling_price_extremes
 
 logger = logging.getLogger()
 
@@ -9,8 +11,12 @@ def calculate_rsi(data, period=14):
         delta = data["close"].diff()
         gain = np.where(delta > 0, delta, 0)
         loss = np.where(delta < 0, -delta, 0)
-        avg_gain = pd.Series(gain).rolling(window=period, min_periods=1).mean()
-        avg_loss = pd.Series(loss).rolling(window=period, min_periods=1).mean()
+        if kernels.USE_KERNELS:
+            avg_gain = pd.Series(kernels.rolling_mean(gain, period, min_periods=1))
+            avg_loss = pd.Series(kernels.rolling_mean(loss, period, min_periods=1))
+        else:
+            avg_gain = pd.Series(gain).rolling(window=period, min_periods=1).mean()
+            avg_loss = pd.Series(loss).rolling(window=period, min_periods=1).mean()
         rs = avg_gain / avg_loss
         return 100 - (100 / (1 + rs))
     except Exception as e:
@@ -19,6 +25,11 @@ def calculate_rsi(data, period=14):
 
 def calculate_macd(data, short_period=12, long_period=26, signal_period=9):
     try:
+        if kernels.USE_KERNELS:
+            close = data["close"].to_numpy()
+            macd = kernels.ema(close, short_period) - kernels.ema(close, long_period)
+            signal = kernels.ema(macd, signal_period)
+            return pd.Series(macd, index=data.index), pd.Series(signal, index=data.index)
         short_ema = data["close"].ewm(span=short_period, adjust=False).mean()
         long_ema = data["close"].ewm(span=long_period, adjust=False).mean()
         macd = short_ema - long_ema
@@ -30,10 +41,43 @@ def calculate_macd(data, short_period=12, long_period=26, signal_period=9):
     
 def calculate_stochastic_oscillator(data, period=14):
     try:
-        lowest_low = data["low"].rolling(window=period).min()
-        highest_high = data["high"].rolling(window=period).max()
+        if kernels.USE_KERNELS:
+            lowest_low = pd.Series(kernels.rolling_min(data["low"].to_numpy(), period), index=data.index)
+            highest_high = pd.Series(kernels.rolling_max(data["high"].to_numpy(), period), index=data.index)
+        else:
+            lowest_low = data["low"].rolling(window=period).min()
+            highest_high = data["high"].rolling(window=period).max()
         return (data["close"] - lowest_low) / (highest_high - lowest_low) * 100
     except Exception as e:
         logger.error(f"Error calculating Stochastic Oscillator: {e}")
         return None
 
+def calculate_stochastic_oscillator_multi(data, periods=(14, 50, 200), extremes=None):
+    try:
+        lows, highs = extremes or rolling_price_extremes(data, periods)
+        close = data["close"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return pd.DataFrame({
+                f"stochastic_{period}": (close - lows[period]) / (highs[period] - lows[period]) * 100
+                for period in periods
+            }, index=data.index)
+    except Exception as e:
+        logger.error(f"Error calculating Stochastic Oscillator: {e}")
+        return None
+
+def calculate_williams_r_multi(data, periods=(14, 50, 200), extremes=None):
+    try:
+        lows, highs = extremes or rolling_price_extremes(data, periods)
+        close = data["close"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return pd.DataFrame({
+                f"williams_r_{period}": (highs[period] - close) / (highs[period] - lows[period]) * -100
+                for period in periods
+            }, index=data.index)
+    except Exception as e:
+        logger.error(f"Error calculating Williams %R: {e}")
+        return None
+
+def calculate_williams_r(data, period=14):
+    result = calculate_williams_r_multi(data, (period,))
+    return None if result is None else result[f"williams_r_{period}"]
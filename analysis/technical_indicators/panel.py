@@ -0,0 +1,125 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .indicator_engine import INDICATOR_COLUMNS, DEFAULT_INDICATORS, DEFAULT_PARAMS, RAW_COLUMNS
+
+# Every function here works on 2D float arrays shaped (symbols, candles) and runs along axis 1
+
+
+def _shift(values):
+    shifted = np.full_like(values, np.nan)
+    shifted[:, 1:] = values[:, :-1]
+    return shifted
+
+
+def _windowed(values, window, reducer):
+    result = np.full_like(values, np.nan)
+    if values.shape[1] >= window:
+        result[:, window - 1:] = reducer(sliding_window_view(values, window, axis=1), axis=-1)
+    return result
+
+
+def rolling_mean(values, window, min_periods=None):
+    # Like pandas: NaNs are skipped and the mean needs at least min_periods valid values
+    min_periods = window if min_periods is None else min_periods
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0), axis=1)
+    counts = np.cumsum(valid, axis=1)
+    sums[:, window:] -= sums[:, :-window]
+    counts[:, window:] -= counts[:, :-window]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts >= max(min_periods, 1), sums / counts, np.nan)
+
+
+def rolling_std(values, window):
+    return _windowed(values, window, lambda windows, axis: windows.std(axis=axis, ddof=1))
+
+
+def rolling_min(values, window):
+    return _windowed(values, window, np.min)
+
+
+def rolling_max(values, window):
+    return _windowed(values, window, np.max)
+
+
+def ema(values, span):
+    # Matches ewm(span=span, adjust=False); the loop runs over candles, every symbol at once
+    alpha = 2 / (span + 1)
+    result = np.empty_like(values)
+    if values.shape[1] == 0:
+        return result
+    result[:, 0] = values[:, 0]
+    for i in range(1, values.shape[1]):
+        result[:, i] = alpha * values[:, i] + (1 - alpha) * result[:, i - 1]
+    return result
+
+
+def true_range(high, low, close):
+    prev_close = _shift(close)
+    return np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+
+def stack_frames(frames):
+    lengths = {len(frame) for frame in frames}
+    if len(lengths) > 1:
+        raise ValueError(f"Panel frames must have the same length, got {sorted(lengths)}")
+    return {
+        column: np.array([frame[column].to_numpy(dtype=float) for frame in frames]).reshape(len(frames), -1)
+        for column in RAW_COLUMNS
+    }
+
+
+def compute_panel(panel, indicators=DEFAULT_INDICATORS, **params):
+    unknown = set(indicators) - set(INDICATOR_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown indicators: {sorted(unknown)}")
+    unknown_params = set(params) - set(DEFAULT_PARAMS)
+    if unknown_params:
+        raise ValueError(f"Unknown indicator parameters: {sorted(unknown_params)}")
+    params = {**DEFAULT_PARAMS, **params}
+
+    high, low, close, volume = (
+        np.asarray(panel[column], dtype=float) for column in ("high", "low", "close", "volume")
+    )
+    close_diff = close - _shift(close)
+    result = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "rsi" in indicators:
+            period = params["rsi_period"]
+            avg_gain = rolling_mean(np.where(close_diff > 0, close_diff, 0), period, min_periods=1)
+            avg_loss = rolling_mean(np.where(close_diff < 0, -close_diff, 0), period, min_periods=1)
+            result["rsi"] = 100 - (100 / (1 + avg_gain / avg_loss))
+        if "macd" in indicators:
+            macd = ema(close, params["macd_short_period"]) - ema(close, params["macd_long_period"])
+            result["macd"] = macd
+            result["signal"] = ema(macd, params["macd_signal_period"])
+        if "bollinger" in indicators:
+            window = params["bollinger_window"]
+            sma, std = rolling_mean(close, window), rolling_std(close, window)
+            result["bollinger_upper"] = sma + (2 * std)
+            result["bollinger_lower"] = sma - (2 * std)
+        if "vwap" in indicators:
+            result["vwap"] = np.cumsum(volume * close, axis=1) / np.cumsum(volume, axis=1)
+        if "atr" in indicators or "adx" in indicators:
+            tr = true_range(high, low, close)
+        if "atr" in indicators:
+            result["atr"] = rolling_mean(tr, params["atr_period"])
+        if "obv" in indicators:
+            direction = (close_diff > 0).astype(np.int8) - (close_diff < 0).astype(np.int8)
+            result["obv"] = np.cumsum(np.where(np.isnan(close_diff), 0, direction * volume), axis=1)
+        if "stochastic" in indicators:
+            period = params["stochastic_period"]
+            lowest_low, highest_high = rolling_min(low, period), rolling_max(high, period)
+            result["stochastic"] = (close - lowest_low) / (highest_high - lowest_low) * 100
+        if "adx" in indicators:
+            period = params["adx_period"]
+            up_move = high - _shift(high)
+            down_move = _shift(low) - low
+            atr = rolling_mean(tr, period)
+            plus_di = 100 * (rolling_mean(np.where(up_move < 0, 0, up_move), period) / atr)
+            minus_di = 100 * (rolling_mean(np.where(down_move < 0, 0, down_move), period) / atr)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+            result["adx"] = rolling_mean(dx, period)
+
+    return {column: result[column] for indicator in indicators for column in INDICATOR_COLUMNS[indicator]}
@@ -0,0 +1,145 @@
+from bisect import bisect_right
+from collections import deque
+import numpy as np
+from . import kernels
+from .kernels import njit
+
+NAN = float("nan")
+EXTREMUM_MODES = ("min", "max")
+
+
+def _periods(periods):
+    periods = tuple(sorted({int(period) for period in periods}))
+    if not periods or periods[0] < 1:
+        raise ValueError(f"Rolling periods must be positive integers, got {periods}")
+    return periods
+
+
+class MultiPeriodExtremum:
+    def __init__(self, periods, mode="min", min_periods=None):
+        if mode not in EXTREMUM_MODES:
+            raise ValueError(f"Unknown extremum mode: {mode}")
+        self.periods = _periods(periods)
+        self.mode = mode
+        self.min_periods = min_periods
+        self._window = self.periods[-1]
+        # One monotonic deque sized for the longest period; positions and values both stay sorted,
+        # so every shorter period is a binary search away
+        self._positions = []
+        self._values = []
+        self._head = 0
+        self._valid_counts = deque([0], maxlen=self._window + 1)
+        self._position = -1
+
+    def _dominates(self, new, old):
+        return new <= old if self.mode == "min" else new >= old
+
+    def push(self, value):
+        value = float(value)
+        self._position += 1
+        is_valid = value == value
+        self._valid_counts.append(self._valid_counts[-1] + is_valid)
+
+        if is_valid:
+            while len(self._values) > self._head and self._dominates(value, self._values[-1]):
+                self._values.pop()
+                self._positions.pop()
+            self._positions.append(self._position)
+            self._values.append(value)
+        while self._head < len(self._positions) and self._positions[self._head] <= self._position - self._window:
+            self._head += 1
+        if self._head > self._window:
+            del self._positions[:self._head]
+            del self._values[:self._head]
+            self._head = 0
+
+    def _value(self, period):
+        counts = self._valid_counts
+        valid = counts[-1] - counts[max(0, len(counts) - 1 - period)]
+        min_periods = period if self.min_periods is None else self.min_periods
+        if valid < max(min_periods, 1):
+            return NAN
+        index = bisect_right(self._positions, self._position - period, lo=self._head)
+        return self._values[index] if index < len(self._values) else NAN
+
+    def value(self, period):
+        if period > self._window:
+            raise ValueError(f"Period {period} is longer than the tracked window {self._window}")
+        return self._value(period)
+
+    def values(self):
+        return {period: self._value(period) for period in self.periods}
+
+
+@njit(cache=True)
+def _rolling_extrema_kernel(values, periods, find_max):
+    n = len(values)
+    result = np.full((len(periods), n), np.nan)
+    window = periods[-1]
+    candidates = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+    for i in range(n):
+        value = values[i]
+        if value == value:
+            while tail > head and (
+                values[candidates[tail - 1]] <= value if find_max else values[candidates[tail - 1]] >= value
+            ):
+                tail -= 1
+            candidates[tail] = i
+            tail += 1
+        else:
+            last_nan = i
+        while tail > head and candidates[head] <= i - window:
+            head += 1
+        for j in range(len(periods)):
+            period = periods[j]
+            if i < period - 1 or last_nan > i - period:
+                continue
+            index = head + np.searchsorted(candidates[head:tail], i - period, side="right")
+            result[j, i] = values[candidates[index]]
+    return result
+
+
+def _doubling_extrema(values, periods, reduce):
+    # levels[k][i] holds the extremum of the 2**k values ending at i; any window is two overlapping lookups
+    n = len(values)
+    levels = [values]
+    width = 1
+    while width * 2 <= periods[-1]:
+        level = levels[-1].copy()
+        level[width:] = reduce(levels[-1][width:], levels[-1][:-width])
+        levels.append(level)
+        width *= 2
+
+    result = np.full((len(periods), n), np.nan)
+    for row, period in enumerate(periods):
+        if n < period:
+            continue
+        level = period.bit_length() - 1
+        width = 1 << level
+        table = levels[level]
+        result[row, period - 1:] = reduce(table[period - 1:], table[width - 1:n - period + width])
+    return result
+
+
+def rolling_extrema(values, periods, mode="min"):
+    # Matches rolling(period).min()/.max() for every period, sharing one pass over the data
+    if mode not in EXTREMUM_MODES:
+        raise ValueError(f"Unknown extremum mode: {mode}")
+    periods = _periods(periods)
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if kernels.USE_KERNELS:
+        result = _rolling_extrema_kernel(values, np.array(periods, dtype=np.int64), mode == "max")
+    else:
+        # np.minimum/np.maximum propagate NaN, so a window with a missing value stays NaN as in pandas
+        result = _doubling_extrema(values, periods, np.minimum if mode == "min" else np.maximum)
+    return dict(zip(periods, result))
+
+
+def rolling_price_extremes(data, periods):
+    return (
+        rolling_extrema(data["low"].to_numpy(), periods, "min"),
+        rolling_extrema(data["high"].to_numpy(), periods, "max"),
+    )
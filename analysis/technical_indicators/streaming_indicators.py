@@ -0,0 +1,283 @@
+import math
+from collections import deque
+import numpy as np
+from .rolling import MultiPeriodExtremum
+
+NAN = float("nan")
+
+
+def _is_nan(value):
+    return value != value
+
+
+def _divide(numerator, denominator):
+    # Follow NumPy semantics (inf / nan) instead of raising ZeroDivisionError
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class RollingWindow:
+    def __init__(self, window, min_periods=None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._values = deque()
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+
+    def _add(self, value):
+        self._nobs += 1
+        delta = value - self._mean
+        self._mean += delta / self._nobs
+        self._ssqdm += delta * (value - self._mean)
+
+    def _remove(self, value):
+        self._nobs -= 1
+        if self._nobs == 0:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._nobs
+        self._ssqdm -= delta * (value - self._mean)
+
+    def push(self, value):
+        value = float(value)
+        self._values.append(value)
+        if not _is_nan(value):
+            self._add(value)
+        if len(self._values) > self.window:
+            evicted = self._values.popleft()
+            if not _is_nan(evicted):
+                self._remove(evicted)
+
+    def mean(self):
+        if self._nobs < max(self.min_periods, 1):
+            return NAN
+        return self._mean
+
+    def std(self):
+        if self._nobs < max(self.min_periods, 2):
+            return NAN
+        return math.sqrt(max(self._ssqdm, 0.0) / (self._nobs - 1))
+
+
+class RollingExtremum(MultiPeriodExtremum):
+    def __init__(self, window, mode="min", min_periods=None):
+        super().__init__((window,), mode, min_periods)
+        self.window = window
+
+    def value(self):
+        return self._value(self.window)
+
+
+class EMA:
+    def __init__(self, span):
+        self.alpha = 2.0 / (span + 1.0)
+        self._value = None
+
+    def push(self, value):
+        value = float(value)
+        if _is_nan(value):
+            return self.value()
+        if self._value is None:
+            self._value = value
+        else:
+            self._value = (1.0 - self.alpha) * self._value + self.alpha * value
+        return self._value
+
+    def value(self):
+        return NAN if self._value is None else self._value
+
+
+class StreamingRSI:
+    def __init__(self, period=14):
+        self._prev_close = NAN
+        self._gains = RollingWindow(period, min_periods=1)
+        self._losses = RollingWindow(period, min_periods=1)
+
+    def update(self, candle):
+        close = float(candle["close"])
+        delta = close - self._prev_close
+        self._prev_close = close
+        self._gains.push(delta if delta > 0 else 0.0)
+        self._losses.push(-delta if delta < 0 else 0.0)
+        return 100 - _divide(100, 1 + _divide(self._gains.mean(), self._losses.mean()))
+
+
+class StreamingMACD:
+    def __init__(self, short_period=12, long_period=26, signal_period=9):
+        self._short = EMA(short_period)
+        self._long = EMA(long_period)
+        self._signal = EMA(signal_period)
+
+    def update(self, candle):
+        close = float(candle["close"])
+        macd = self._short.push(close) - self._long.push(close)
+        return macd, self._signal.push(macd)
+
+
+class StreamingBollingerBands:
+    def __init__(self, window=20):
+        self._closes = RollingWindow(window)
+
+    def update(self, candle):
+        self._closes.push(candle["close"])
+        sma, std = self._closes.mean(), self._closes.std()
+        return sma + (2 * std), sma - (2 * std)
+
+
+class StreamingVWAP:
+    def __init__(self):
+        self._price_volume = 0.0
+        self._volume = 0.0
+
+    def update(self, candle):
+        volume = float(candle["volume"])
+        self._price_volume += volume * float(candle["close"])
+        self._volume += volume
+        return _divide(self._price_volume, self._volume)
+
+
+class StreamingOBV:
+    def __init__(self):
+        self._prev_close = None
+        self._obv = 0.0
+
+    def update(self, candle):
+        close = float(candle["close"])
+        if self._prev_close is not None:
+            if close > self._prev_close:
+                self._obv += float(candle["volume"])
+            elif close < self._prev_close:
+                self._obv -= float(candle["volume"])
+        self._prev_close = close
+        return self._obv
+
+
+class _TrueRange:
+    def __init__(self):
+        self._prev_close = NAN
+
+    def update(self, candle):
+        high, low = float(candle["high"]), float(candle["low"])
+        ranges = [high - low, abs(high - self._prev_close), abs(low - self._prev_close)]
+        self._prev_close = float(candle["close"])
+        ranges = [value for value in ranges if not _is_nan(value)]
+        return max(ranges) if ranges else NAN
+
+
+class StreamingATR:
+    def __init__(self, period=14):
+        self._true_range = _TrueRange()
+        self._window = RollingWindow(period)
+
+    def update(self, candle):
+        self._window.push(self._true_range.update(candle))
+        return self._window.mean()
+
+
+class StreamingStochasticOscillator:
+    def __init__(self, period=14):
+        self.period = period
+        self._lows = MultiPeriodExtremum((period,), "min")
+        self._highs = MultiPeriodExtremum((period,), "max")
+
+    def update(self, candle):
+        self._lows.push(candle["low"])
+        self._highs.push(candle["high"])
+        lowest_low, highest_high = self._lows.value(self.period), self._highs.value(self.period)
+        return _divide(float(candle["close"]) - lowest_low, highest_high - lowest_low) * 100
+
+
+class StreamingPriceExtremes:
+    def __init__(self, periods=(14, 50, 200)):
+        # One pair of deques serves every period
+        self._lows = MultiPeriodExtremum(periods, "min")
+        self._highs = MultiPeriodExtremum(periods, "max")
+        self.periods = self._lows.periods
+        self._close = NAN
+
+    def update(self, candle):
+        self._lows.push(candle["low"])
+        self._highs.push(candle["high"])
+        self._close = float(candle["close"])
+        return self.values()
+
+    def stochastic(self, period):
+        lowest_low, highest_high = self._lows.value(period), self._highs.value(period)
+        return _divide(self._close - lowest_low, highest_high - lowest_low) * 100
+
+    def williams_r(self, period):
+        lowest_low, highest_high = self._lows.value(period), self._highs.value(period)
+        return _divide(highest_high - self._close, highest_high - lowest_low) * -100
+
+    def values(self):
+        result = {}
+        for period in self.periods:
+            result[f"stochastic_{period}"] = self.stochastic(period)
+            result[f"williams_r_{period}"] = self.williams_r(period)
+            result[f"donchian_upper_{period}"] = self._highs.value(period)
+            result[f"donchian_lower_{period}"] = self._lows.value(period)
+        return result
+
+
+class StreamingADX:
+    def __init__(self, period=14):
+        self._true_range = _TrueRange()
+        self._prev_high = NAN
+        self._prev_low = NAN
+        self._tr = RollingWindow(period)
+        self._plus_dm = RollingWindow(period)
+        self._minus_dm = RollingWindow(period)
+        self._dx = RollingWindow(period)
+
+    def update(self, candle):
+        high, low = float(candle["high"]), float(candle["low"])
+        self._tr.push(self._true_range.update(candle))
+        plus_move = high - self._prev_high
+        minus_move = self._prev_low - low
+        self._prev_high, self._prev_low = high, low
+        self._plus_dm.push(plus_move if _is_nan(plus_move) or plus_move >= 0 else 0.0)
+        self._minus_dm.push(minus_move if _is_nan(minus_move) or minus_move >= 0 else 0.0)
+
+        atr = self._tr.mean()
+        plus_di = 100 * _divide(self._plus_dm.mean(), atr)
+        minus_di = 100 * _divide(self._minus_dm.mean(), atr)
+        self._dx.push(100 * _divide(abs(plus_di - minus_di), plus_di + minus_di))
+        return self._dx.mean()
+
+
+class StreamingIndicators:
+    def __init__(self, rsi_period=14, macd_short_period=12, macd_long_period=26, macd_signal_period=9,
+                 bollinger_window=20, atr_period=14, stochastic_period=14, adx_period=14):
+        self._rsi = StreamingRSI(rsi_period)
+        self._macd = StreamingMACD(macd_short_period, macd_long_period, macd_signal_period)
+        self._bollinger = StreamingBollingerBands(bollinger_window)
+        self._vwap = StreamingVWAP()
+        self._atr = StreamingATR(atr_period)
+        self._obv = StreamingOBV()
+        self._stochastic = StreamingStochasticOscillator(stochastic_period)
+        self._adx = StreamingADX(adx_period)
+
+    def update(self, candle):
+        macd, signal = self._macd.update(candle)
+        upper_band, lower_band = self._bollinger.update(candle)
+        return {
+            "rsi": self._rsi.update(candle),
+            "macd": macd,
+            "signal": signal,
+            "bollinger_upper": upper_band,
+            "bollinger_lower": lower_band,
+            "vwap": self._vwap.update(candle),
+            "atr": self._atr.update(candle),
+            "obv": self._obv.update(candle),
+            "stochastic": self._stochastic.update(candle),
+            "adx": self._adx.update(candle),
+        }
+
+    def warm_up(self, data):
+        latest = None
+        for candle in data.to_dict("records"):
+            latest = self.update(candle)
+        return latest
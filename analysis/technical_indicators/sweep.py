@@ -0,0 +1,116 @@
+import pandas as pd
+import numpy as np
+import logging
+from . import kernels
+
+logger = logging.getLogger()
+
+# Each *_multi function returns one column per period (e.g. rsi_14) with the values the
+# single-period function gives for that period
+
+
+def _periods(periods):
+    periods = [int(period) for period in periods]
+    if not periods or min(periods) < 1:
+        raise ValueError(f"Periods must be positive integers, got {periods}")
+    return periods
+
+
+def _window_sums(cumulative, period):
+    # cumulative has a leading zero; windows shorter than period at the start sum what is there
+    n = len(cumulative) - 1
+    sums = np.empty(n)
+    head = min(period - 1, n)
+    sums[:head] = cumulative[1:head + 1]
+    sums[head:] = cumulative[head + 1:] - cumulative[:n - head]
+    return sums
+
+
+def _window_means(values, periods, min_periods=None):
+    # values is one series shared by every period, or one row per period; a single cumsum serves all windows
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    axis = values.ndim - 1
+    zero = np.zeros(values.shape[:-1] + (1,))
+    sums = np.concatenate((zero, np.cumsum(np.where(valid, values, 0.0), axis=axis)), axis=axis)
+    counts = np.concatenate((zero, np.cumsum(valid, axis=axis)), axis=axis)
+
+    result = np.empty((len(periods), values.shape[-1]))
+    for row, period in enumerate(periods):
+        row_sums, row_counts = (sums, counts) if values.ndim == 1 else (sums[row], counts[row])
+        window_counts = _window_sums(row_counts, period)
+        required = max(period if min_periods is None else min_periods, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[row] = np.where(window_counts >= required, _window_sums(row_sums, period) / window_counts, np.nan)
+    return result
+
+
+def _true_range(data):
+    high, low = data["high"].to_numpy(dtype=float), data["low"].to_numpy(dtype=float)
+    prev_close = data["close"].shift().to_numpy(dtype=float)
+    return np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+
+def _frame(prefix, periods, rows, index):
+    return pd.DataFrame({f"{prefix}_{period}": row for period, row in zip(periods, rows)}, index=index)
+
+
+def calculate_rsi_multi(data, periods):
+    try:
+        periods = _periods(periods)
+        delta = data["close"].diff().to_numpy(dtype=float)
+        gain = np.where(delta > 0, delta, 0)
+        loss = np.where(delta < 0, -delta, 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + _window_means(gain, periods, 1) / _window_means(loss, periods, 1)))
+        return _frame("rsi", periods, rsi, data.index)
+    except Exception as e:
+        logger.error(f"Error calculating RSI sweep: {e}")
+        return None
+
+
+def calculate_atr_multi(data, periods):
+    try:
+        periods = _periods(periods)
+        return _frame("atr", periods, _window_means(_true_range(data), periods), data.index)
+    except Exception as e:
+        logger.error(f"Error calculating ATR sweep: {e}")
+        return None
+
+
+def calculate_bollinger_bands_multi(data, windows):
+    try:
+        windows = _periods(windows)
+        close = data["close"].to_numpy(dtype=float)
+        sma = _window_means(close, windows)
+        # A cumsum of squares loses ~1e-6 relative precision at BTC price levels, so std stays per window
+        if kernels.USE_KERNELS:
+            std = [kernels.rolling_std(close, window) for window in windows]
+        else:
+            series = pd.Series(close)
+            std = [series.rolling(window=window).std().to_numpy() for window in windows]
+        std = np.array(std).reshape(sma.shape)
+        result = {}
+        for window, mean, deviation in zip(windows, sma, std):
+            result[f"bollinger_upper_{window}"] = mean + (2 * deviation)
+            result[f"bollinger_lower_{window}"] = mean - (2 * deviation)
+        return pd.DataFrame(result, index=data.index)
+    except Exception as e:
+        logger.error(f"Error calculating Bollinger Bands sweep: {e}")
+        return None
+
+
+def calculate_adx_multi(data, periods):
+    try:
+        periods = _periods(periods)
+        plus_dm = (data["high"] - data["high"].shift()).clip(lower=0).to_numpy(dtype=float)
+        minus_dm = (data["low"].shift() - data["low"]).clip(lower=0).to_numpy(dtype=float)
+        atr = _window_means(_true_range(data), periods)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = 100 * (_window_means(plus_dm, periods) / atr)
+            minus_di = 100 * (_window_means(minus_dm, periods) / atr)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        return _frame("adx", periods, _window_means(dx, periods), data.index)
+    except Exception as e:
+        logger.error(f"Error calculating ADX sweep: {e}")
+        return None
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import logging
+from . import kernels
 
 logger = logging.getLogger()
 
@@ -10,9 +11,16 @@ def calculate_adx(data, period=14):
         high_close = np.abs(data["high"] - data["close"].shift())
         low_close = np.abs(data["low"] - data["close"].shift())
         true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
         plus_dm = (data["high"] - data["high"].shift()).clip(lower=0)
         minus_dm = (data["low"].shift() - data["low"]).clip(lower=0)
+        if kernels.USE_KERNELS:
+            atr = kernels.rolling_mean(true_range.to_numpy(), period)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                plus_di = 100 * (kernels.rolling_mean(plus_dm.to_numpy(), period) / atr)
+                minus_di = 100 * (kernels.rolling_mean(minus_dm.to_numpy(), period) / atr)
+                dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+            return pd.Series(kernels.rolling_mean(dx, period), index=data.index)
+        atr = true_range.rolling(window=period).mean()
         plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
         minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
         dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
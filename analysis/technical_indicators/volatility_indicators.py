@@ -1,13 +1,20 @@
 import pandas as pd
 import numpy as np
 import logging
+from . import kernels
+from .rolling import rolling_price_extremes
 
 logger = logging.getLogger()
 
 def calculate_bollinger_bands(data, window=20):
     try:
-        sma = data["close"].rolling(window=window).mean()
-        std = data["close"].rolling(window=window).std()
+        if kernels.USE_KERNELS:
+            close = data["close"].to_numpy()
+            sma = pd.Series(kernels.rolling_mean(close, window), index=data.index)
+            std = pd.Series(kernels.rolling_std(close, window), index=data.index)
+        else:
+            sma = data["close"].rolling(window=window).mean()
+            std = data["close"].rolling(window=window).std()
         return sma + (2 * std), sma - (2 * std)
     except Exception as e:
         logger.error(f"Error calculating Bollinger Bands: {e}")
@@ -19,7 +26,27 @@ def calculate_atr(data, period=14):
         high_close = np.abs(data["high"] - data["close"].shift())
         low_close = np.abs(data["low"] - data["close"].shift())
         true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+        if kernels.USE_KERNELS:
+            return pd.Series(kernels.rolling_mean(true_range.to_numpy(), period), index=data.index)
         return true_range.rolling(window=period).mean()
     except Exception as e:
         logger.error(f"Error calculating ATR: {e}")
         return None
+
+def calculate_donchian_channels_multi(data, periods=(20, 55), extremes=None):
+    try:
+        lows, highs = extremes or rolling_price_extremes(data, periods)
+        result = {}
+        for period in periods:
+            result[f"donchian_upper_{period}"] = highs[period]
+            result[f"donchian_lower_{period}"] = lows[period]
+        return pd.DataFrame(result, index=data.index)
+    except Exception as e:
+        logger.error(f"Error calculating Donchian Channels: {e}")
+        return None
+
+def calculate_donchian_channels(data, period=20):
+    result = calculate_donchian_channels_multi(data, (period,))
+    if result is None:
+        return None, None
+    return result[f"donchian_upper_{period}"], result[f"donchian_lower_{period}"]
@@ -1,19 +1,22 @@
 import pandas as pd
 import numpy as np
 import logging
+from . import kernels
 
 logger = logging.getLogger()
 
 def calculate_obv(data):
     try:
-        obv = [0]
-        for i in range(1, len(data["close"])):
-            if data["close"][i] > data["close"][i - 1]:
-                obv.append(obv[-1] + data["volume"][i])
-            elif data["close"][i] < data["close"][i - 1]:
-                obv.append(obv[-1] - data["volume"][i])
-            else:
-                obv.append(obv[-1])
+        close = data["close"].to_numpy()
+        volume = data["volume"].to_numpy()
+        if len(close) == 0:
+            return pd.Series([], index=data.index, dtype=float)
+        if kernels.USE_KERNELS:
+            return pd.Series(kernels.obv(close, volume), index=data.index)
+        diff = np.diff(close)
+        # Comparisons rather than np.sign so NaN closes leave OBV unchanged
+        direction = (diff > 0).astype(np.int8) - (diff < 0).astype(np.int8)
+        obv = np.concatenate(([0], np.cumsum(direction * volume[1:])))
         return pd.Series(obv, index=data.index)
     except Exception as e:
         logger.error(f"Error calculating OBV: {e}")
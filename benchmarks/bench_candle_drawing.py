@@ -0,0 +1,40 @@
+import io
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from mplfinance.original_flavor import candlestick_ohlc
+from services.chart_template import draw_candles, draw_volume
+from benchmarks.common import make_candles, best_time, report
+
+
+def _axes():
+    fig = Figure(figsize=(12, 8))
+    return fig, fig.subplots(2, 1, sharex=True, gridspec_kw={'height_ratios': [4, 1]})
+
+
+def draw_legacy(df, x, width):
+    fig, (ax_candles, ax_volume) = _axes()
+    ohlc = df[["open", "high", "low", "close"]].copy()
+    ohlc.insert(0, "open_time", x)
+    candlestick_ohlc(ax_candles, ohlc.values, width=width, colorup='lime', colordown='red', alpha=0.9)
+    volume_colors = ['lime' if df['close'].iloc[i] >= df['open'].iloc[i] else 'red' for i in range(len(df))]
+    ax_volume.bar(x, df['volume'], color=volume_colors, alpha=0.7, width=width)
+    fig.savefig(io.BytesIO(), format="png")
+
+
+def draw_collections(df, x, width):
+    fig, (ax_candles, ax_volume) = _axes()
+    open_, close = df['open'].to_numpy(), df['close'].to_numpy()
+    draw_candles(ax_candles, x, open_, df['high'].to_numpy(), df['low'].to_numpy(), close, width)
+    draw_volume(ax_volume, x, df['volume'].to_numpy(), open_, close, width)
+    fig.savefig(io.BytesIO(), format="png")
+
+
+if __name__ == "__main__":
+    for rows in (30, 500, 2_000):
+        df = make_candles(rows)
+        x = mdates.date2num(df['open_time'])
+        width = (x.max() - x.min()) / rows / 2
+        report(f"draw + save {rows:,} candles", best_time(draw_legacy, df, x, width),
+               best_time(draw_collections, df, x, width))
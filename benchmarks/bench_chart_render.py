@@ -0,0 +1,30 @@
+import os
+import tempfile
+import time
+import matplotlib
+matplotlib.use("Agg")
+from services.chart_generator_service import ChartGeneratorService
+from benchmarks.common import make_candles
+
+
+def charts_per_second(render_mode, frames, output_dir):
+    service = ChartGeneratorService(output_dir=output_dir, max_workers=1, render_mode=render_mode)
+    start = time.perf_counter()
+    for symbol, df in frames.items():
+        service.generate_single_chart(symbol, df.copy(), "15m")
+    return len(frames) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    symbols = 100
+    frames = {f"SYM{i}USDT": make_candles(30, seed=i) for i in range(symbols)}
+    with tempfile.TemporaryDirectory() as output_dir:
+        # Warm up font caches and the per-process template before timing
+        for render_mode in ("standard", "template"):
+            ChartGeneratorService(output_dir=os.path.join(output_dir, "warmup"), max_workers=1,
+                                  render_mode=render_mode).generate_single_chart("WARMUP", make_candles(30), "15m")
+
+        standard = charts_per_second("standard", frames, output_dir)
+        template = charts_per_second("template", frames, output_dir)
+    print(f"{symbols} charts   standard {standard:6.1f} charts/s   template {template:6.1f} charts/s   "
+          f"speedup {template / standard:5.1f}x")
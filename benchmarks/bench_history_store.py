@@ -0,0 +1,71 @@
+import os
+import sqlite3
+import tempfile
+import time
+from unittest.mock import patch
+from database.migrate import apply_migrations
+from utils.db_utils import HistoryRepository, insert_into_history
+from benchmarks.common import best_time, report
+
+ROWS = 1_000_000
+SYMBOLS = [f"SYM{i}USDT" for i in range(100)]
+
+
+def make_rows(count, start=0):
+    # Timestamps spread one row per second so date filters select a realistic slice
+    base = time.mktime((2024, 1, 1, 0, 0, 0, 0, 0, 0))
+    return [
+        (SYMBOLS[i % len(SYMBOLS)], f"analysis {i}", f"charts/{i}.png",
+         time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(base + i)))
+        for i in range(start, start + count)
+    ]
+
+
+def load(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany("INSERT INTO history (symbol, analysis, img, timestamp) VALUES (?, ?, ?, ?)", rows)
+    conn.close()
+
+
+def legacy_inserts(db_path, rows):
+    with patch("utils.db_utils.SQLITE3_DATABASE_FILE", db_path):
+        for symbol, analysis, img, _ in rows:
+            insert_into_history(symbol, analysis, img)
+
+
+def repository_inserts(db_path, rows):
+    repository = HistoryRepository(db_path)
+    for symbol, analysis, img, _ in rows:
+        repository.add(symbol, analysis, img)
+    repository.close()
+
+
+def range_query(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT id, symbol, analysis, img FROM history WHERE symbol = ? AND timestamp >= ? AND timestamp < ?",
+        ("SYM7USDT", "2024-01-05 00:00:00", "2024-01-06 00:00:00"),
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db, indexed_db = os.path.join(tmp, "legacy.db"), os.path.join(tmp, "indexed.db")
+        conn = sqlite3.connect(legacy_db)
+        conn.execute("CREATE TABLE history (id INTEGER PRIMARY KEY, symbol TEXT, analysis TEXT, img TEXT, "
+                     "timestamp DATETIME DEFAULT CURRENT_TIMESTAMP)")
+        conn.close()
+        apply_migrations(indexed_db)
+
+        rows = make_rows(ROWS)
+        load(legacy_db, rows)
+        load(indexed_db, rows)
+
+        run = make_rows(500, start=ROWS)
+        report("insert 500 rows (one run)", best_time(legacy_inserts, legacy_db, run, repeat=1),
+               best_time(repository_inserts, indexed_db, run, repeat=1))
+        report(f"symbol+day query, {ROWS:,} rows", best_time(range_query, legacy_db, repeat=5),
+               best_time(range_query, indexed_db, repeat=5))
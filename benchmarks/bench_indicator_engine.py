@@ -0,0 +1,37 @@
+from analysis.technical_indicators import (
+    IndicatorEngine,
+    calculate_rsi,
+    calculate_macd,
+    calculate_stochastic_oscillator,
+    calculate_vwap,
+    calculate_obv,
+    calculate_bollinger_bands,
+    calculate_atr,
+    calculate_adx,
+)
+from benchmarks.common import make_candles, best_time, report
+
+
+def compute_per_function(data):
+    calculate_rsi(data)
+    calculate_macd(data)
+    calculate_bollinger_bands(data)
+    calculate_vwap(data)
+    calculate_atr(data)
+    calculate_obv(data)
+    calculate_stochastic_oscillator(data)
+    calculate_adx(data)
+
+
+def compute_many(func, frames):
+    for frame in frames:
+        func(frame)
+
+
+if __name__ == "__main__":
+    engine = IndicatorEngine()
+    for rows, symbols in ((50, 200), (1_000, 50), (100_000, 1)):
+        frames = [make_candles(rows, seed=i) for i in range(symbols)]
+        baseline = best_time(compute_many, compute_per_function, frames)
+        candidate = best_time(compute_many, engine.compute, frames)
+        report(f"{symbols} symbols x {rows:,} rows", baseline, candidate)
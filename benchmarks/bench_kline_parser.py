@@ -0,0 +1,37 @@
+import json
+import pandas as pd
+from data_fetching.kline_parser import parse_klines, parse_kline_arrays
+from benchmarks.common import best_time, report
+
+
+def make_raw_klines(rows):
+    klines = [
+        [1_700_000_000_000 + i * 900_000, f"{100 + i * 0.01:.8f}", f"{101 + i * 0.01:.8f}",
+         f"{99 + i * 0.01:.8f}", f"{100.5 + i * 0.01:.8f}", f"{10 + i % 7:.8f}",
+         1_700_000_000_000 + i * 900_000 + 899_999, "1234.56780000", 42, "5.00000000", "500.00000000", "0"]
+        for i in range(rows)
+    ]
+    # Round-trip through JSON so the input matches what requests hands the parser
+    return json.loads(json.dumps(klines))
+
+
+def parse_legacy(data):
+    df = pd.DataFrame(data, columns=[
+        "open_time", "open", "high", "low", "close", "volume",
+        "close_time", "quote_asset_volume", "number_of_trades",
+        "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore"
+    ])
+    df["open_time"] = pd.to_datetime(df["open_time"], unit="ms")
+    df["close_time"] = pd.to_datetime(df["close_time"], unit="ms")
+    df[["open", "high", "low", "close", "volume"]] = df[["open", "high", "low", "close", "volume"]].astype(float)
+    return df
+
+
+if __name__ == "__main__":
+    for rows in (50, 1_000, 100_000):
+        data = make_raw_klines(rows)
+        repeat = 20 if rows < 100_000 else 3
+        baseline = best_time(parse_legacy, data, repeat=repeat)
+        report(f"frame {rows:,} klines", baseline, best_time(parse_klines, data, repeat=repeat))
+        report(f"close-only arrays {rows:,} klines", baseline,
+               best_time(parse_kline_arrays, data, columns=("open_time", "close"), repeat=repeat))
@@ -0,0 +1,25 @@
+import pandas as pd
+from analysis.technical_indicators.volume_indicators import calculate_obv
+from benchmarks.common import make_candles, best_time, report
+
+
+def calculate_obv_loop(data):
+    obv = [0]
+    for i in range(1, len(data["close"])):
+        if data["close"][i] > data["close"][i - 1]:
+            obv.append(obv[-1] + data["volume"][i])
+        elif data["close"][i] < data["close"][i - 1]:
+            obv.append(obv[-1] - data["volume"][i])
+        else:
+            obv.append(obv[-1])
+    return pd.Series(obv, index=data.index)
+
+
+if __name__ == "__main__":
+    for rows in (1_000, 100_000, 1_000_000):
+        data = make_candles(rows)
+        assert calculate_obv(data).equals(calculate_obv_loop(data))
+        repeat = 3 if rows < 1_000_000 else 1
+        baseline = best_time(calculate_obv_loop, data, repeat=repeat)
+        candidate = best_time(calculate_obv, data, repeat=repeat)
+        report(f"OBV {rows:,} rows", baseline, candidate)
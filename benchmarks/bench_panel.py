@@ -0,0 +1,20 @@
+from analysis.technical_indicators import IndicatorEngine, compute_panel, stack_frames
+from benchmarks.common import make_candles, best_time, report
+
+
+def compute_one_by_one(engine, frames):
+    for frame in frames:
+        engine.compute(frame).iloc[-1]
+
+
+def compute_stacked(frames):
+    compute_panel(stack_frames(frames))
+
+
+if __name__ == "__main__":
+    engine = IndicatorEngine()
+    for symbols, rows in ((50, 30), (500, 1_000)):
+        frames = [make_candles(rows, seed=i) for i in range(symbols)]
+        baseline = best_time(compute_one_by_one, engine, frames)
+        candidate = best_time(compute_stacked, frames)
+        report(f"{symbols} symbols x {rows:,} candles", baseline, candidate)
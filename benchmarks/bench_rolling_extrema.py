@@ -0,0 +1,17 @@
+import pandas as pd
+from analysis.technical_indicators import rolling_extrema
+from benchmarks.common import make_candles, best_time, report
+
+
+def rolling_per_period(values, periods):
+    series = pd.Series(values)
+    for period in periods:
+        series.rolling(window=period).min()
+
+
+if __name__ == "__main__":
+    for rows, periods in ((1_000, (14, 50, 200)), (100_000, (14, 50, 200)), (100_000, tuple(range(5, 205, 5)))):
+        lows = make_candles(rows)["low"].to_numpy()
+        baseline = best_time(rolling_per_period, lows, periods)
+        candidate = best_time(rolling_extrema, lows, periods)
+        report(f"{len(periods)} periods x {rows:,} rows", baseline, candidate)
@@ -0,0 +1,33 @@
+from analysis.technical_indicators import (
+    calculate_rsi,
+    calculate_atr,
+    calculate_adx,
+    calculate_bollinger_bands,
+    calculate_rsi_multi,
+    calculate_atr_multi,
+    calculate_adx_multi,
+    calculate_bollinger_bands_multi,
+)
+from benchmarks.common import make_candles, best_time, report
+
+SWEEPS = (
+    ("RSI", calculate_rsi, calculate_rsi_multi),
+    ("ATR", calculate_atr, calculate_atr_multi),
+    ("ADX", calculate_adx, calculate_adx_multi),
+    ("Bollinger", calculate_bollinger_bands, calculate_bollinger_bands_multi),
+)
+
+
+def loop_of_calls(func, data, periods):
+    for period in periods:
+        func(data, period)
+
+
+if __name__ == "__main__":
+    periods = list(range(5, 65))
+    for rows in (1_000, 100_000):
+        data = make_candles(rows)
+        for name, single, multi in SWEEPS:
+            baseline = best_time(loop_of_calls, single, data, periods)
+            candidate = best_time(multi, data, periods)
+            report(f"{name} {len(periods)} periods x {rows:,}", baseline, candidate)
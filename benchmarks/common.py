@@ -0,0 +1,34 @@
+import time
+import numpy as np
+import pandas as pd
+
+
+def make_candles(rows, seed=42, start="2024-01-01", freq="15min"):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, rows))
+    open_ = close + rng.normal(0, 0.2, rows)
+    high = np.maximum(open_, close) + rng.random(rows)
+    low = np.minimum(open_, close) - rng.random(rows)
+    volume = rng.random(rows) * 1000
+    return pd.DataFrame({
+        "open_time": pd.date_range(start, periods=rows, freq=freq),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+    })
+
+
+def best_time(func, *args, repeat=3, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label, baseline, candidate):
+    speedup = baseline / candidate if candidate else float("inf")
+    print(f"{label:<32} baseline {baseline * 1000:10.2f} ms   new {candidate * 1000:10.2f} ms   speedup {speedup:8.1f}x")
@@ -20,6 +20,19 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
 CANDLESTICK_INTERVAL = os.getenv("CANDLESTICK_INTERVAL", "15m")
-TELEGRAM_MESSAGE_DELAY = float(os.getenv("TELEGRAM_MESSAGE_DELAY", 1.0))
+TELEGRAM_CHAT_RATE = float(os.getenv("TELEGRAM_CHAT_RATE", 1.0))
+TELEGRAM_GLOBAL_RATE = float(os.getenv("TELEGRAM_GLOBAL_RATE", 30))
+TELEGRAM_DELIVERY_MODE = os.getenv("TELEGRAM_DELIVERY_MODE", "message")
+BINANCE_MAX_WORKERS = int(os.getenv("BINANCE_MAX_WORKERS", 8))
+BINANCE_CACHE_TTL = float(os.getenv("BINANCE_CACHE_TTL", 300))
 
 SQLITE3_DATABASE_FILE = os.getenv("SQLITE3_DATABASE_FILE", "crypto_analysis.db")
+CHART_RENDER_WORKERS = int(os.getenv("CHART_RENDER_WORKERS", os.cpu_count() or 1))
+CHART_RENDER_MODE = os.getenv("CHART_RENDER_MODE", "standard")
+CHART_CACHE_ENABLED = os.getenv("CHART_CACHE_ENABLED", "true").lower() == "true"
+CHART_CACHE_MAX_AGE = float(os.getenv("CHART_CACHE_MAX_AGE", 7 * 24 * 3600))
+CHART_CACHE_MAX_BYTES = int(os.getenv("CHART_CACHE_MAX_BYTES", 500 * 1024 * 1024))
+BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", os.cpu_count() or 1))
+INDICATOR_BACKEND = os.getenv("INDICATOR_BACKEND", "auto")
+CANDLE_ARCHIVE_DIR = os.getenv("CANDLE_ARCHIVE_DIR", "database/archive")
+CANDLE_STORE_ENABLED = os.getenv("CANDLE_STORE_ENABLED", "true").lower() == "true"
@@ -1,39 +1,122 @@
+import json
+import sqlite3
+import time
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
 import logging
+from config.settings import BINANCE_MAX_WORKERS, BINANCE_CACHE_TTL
+from data_fetching.request_cache import RequestCache
+from data_fetching.kline_parser import DEFAULT_KLINE_COLUMNS, parse_klines
+from utils.candle_store import INTERVAL_MS
+from utils.timing import StageTimer
 
 logger = logging.getLogger()
 
 class BinanceClient:
     BASE_URL = "https://api.binance.com/api/v3"
 
-    def __init__(self, api_key, api_secret):
+    def __init__(self, api_key, api_secret, base_url=None, max_workers=BINANCE_MAX_WORKERS,
+                 cache_ttl=BINANCE_CACHE_TTL, candle_store=None):
         self.api_key = api_key
         self.api_secret = api_secret
         self.headers = {"X-MBX-APIKEY": self.api_key}
+        if base_url:
+            self.BASE_URL = base_url
+        self.max_workers = max_workers
+        self.timings = StageTimer()
+        self.cache = RequestCache(ttl=cache_ttl) if cache_ttl > 0 else None
+        self.candle_store = candle_store
+
+        # One pooled session shared by all worker threads, sized to the concurrency cap
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def _fetch_data(self, endpoint, params):
+        if self.cache is not None:
+            return self.cache.get_or_fetch(endpoint, params, lambda: self._request(endpoint, params))
+        return self._request(endpoint, params)
+
+    def cache_stats(self):
+        if self.cache is None:
+            return {"hits": 0, "misses": 0, "hit_rate": 0.0}
+        return self.cache.stats()
+
+    def _request(self, endpoint, params):
         try:
             url = f"{self.BASE_URL}{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            with self.timings.measure(endpoint):
+                response = self.session.get(url, headers=self.headers, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching data from Binance endpoint {endpoint}: {e}")
             return None
 
-    def fetch_historical_data(self, symbol, interval="15m", limit=50):
+    def fetch_historical_data(self, symbol, interval="15m", limit=50, columns=DEFAULT_KLINE_COLUMNS):
         logger.info(f"Fetching historical data for {symbol} (Interval: {interval}, Limit: {limit}).")
-        data = self._fetch_data("/klines", {"symbol": symbol, "interval": interval, "limit": limit})
+        if self.candle_store is not None and interval in INTERVAL_MS:
+            data = self._fetch_klines_with_store(symbol, interval, limit)
+        else:
+            data = self._fetch_data("/klines", {"symbol": symbol, "interval": interval, "limit": limit})
         if data:
-            return self._parse_historical_data(data)
+            return self._parse_historical_data(data, columns=columns)
         return None
 
+    def _fetch_klines_with_store(self, symbol, interval, limit):
+        params = {"symbol": symbol, "interval": interval, "limit": limit}
+        now_ms = int(time.time() * 1000)
+        step = INTERVAL_MS[interval]
+
+        try:
+            last_open_time = self.candle_store.last_open_time(symbol, interval)
+            if last_open_time is not None:
+                # The newest stored candle is downloaded again in case it was still open when stored
+                missing = (now_ms - last_open_time) // step + 1
+                stored_needed = limit - missing
+                if stored_needed > 0 and self.candle_store.count_between(
+                    symbol, interval, last_open_time - stored_needed * step, last_open_time
+                ) == stored_needed:
+                    params = {"symbol": symbol, "interval": interval, "startTime": last_open_time, "limit": missing + 1}
+        except sqlite3.Error as e:
+            logger.warning(f"Candle store unavailable for {symbol}; fetching the full window: {e}")
+            return self._fetch_data("/klines", params)
+
+        data = self._fetch_data("/klines", params)
+        if not data:
+            return data
+
+        closed = [kline for kline in data if kline[6] < now_ms]
+        still_open = [kline for kline in data if kline[6] >= now_ms]
+        try:
+            self.candle_store.upsert(symbol, interval, closed)
+            stored = self.candle_store.load(symbol, interval, limit - len(still_open))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update candle store for {symbol}: {e}")
+            return data[-limit:]
+
+        logger.info(f"Downloaded {len(data)} candles for {symbol}; serving {limit} from the local candle store.")
+        return (stored + still_open)[-limit:]
+
     def fetch_volume(self, symbol):
         logger.info(f"Fetching 24-hour trading volume for {symbol}.")
         data = self._fetch_data("/ticker/24hr", {"symbol": symbol})
         return float(data.get("volume", 0)) if data else 0
 
+    def fetch_volumes(self, symbols, batch_size=100):
+        logger.info(f"Fetching 24-hour trading volume for {len(symbols)} symbols in bulk.")
+        volumes = {}
+        for i in range(0, len(symbols), batch_size):
+            batch = symbols[i:i + batch_size]
+            data = self._fetch_data("/ticker/24hr", {"symbols": json.dumps(batch, separators=(",", ":"))})
+            if not data:
+                logger.warning(f"No bulk ticker data received for {batch}.")
+                continue
+            for ticker in data:
+                volumes[ticker["symbol"]] = float(ticker.get("volume", 0))
+        return volumes
+
     def fetch_liquidity(self, symbol):
         logger.info(f"Fetching liquidity (bid/ask spread) for {symbol}.")
         data = self._fetch_data("/depth", {"symbol": symbol, "limit": 5})
@@ -51,21 +134,13 @@ class BinanceClient:
         logger.info(f"Fetching order book for {symbol}.")
         return self._fetch_data("/depth", {"symbol": symbol, "limit": 10})
 
-    def _parse_historical_data(self, data):
+    def _parse_historical_data(self, data, columns=DEFAULT_KLINE_COLUMNS):
         if not data:
             logger.warning("No data received for parsing.")
             return None
 
         try:
-            df = pd.DataFrame(data, columns=[
-                "open_time", "open", "high", "low", "close", "volume",
-                "close_time", "quote_asset_volume", "number_of_trades",
-                "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore"
-            ])
-            df["open_time"] = pd.to_datetime(df["open_time"], unit="ms")
-            df["close_time"] = pd.to_datetime(df["close_time"], unit="ms")
-            df[["open", "high", "low", "close", "volume"]] = df[["open", "high", "low", "close", "volume"]].astype(float)
-            return df
+            return parse_klines(data, columns=columns)
         except Exception as e:
             logger.error(f"Error parsing historical data: {e}")
             return None
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+KLINE_COLUMNS = (
+    "open_time", "open", "high", "low", "close", "volume",
+    "close_time", "quote_asset_volume", "number_of_trades",
+    "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore",
+)
+
+# Columns used by the analyzer and the charts
+DEFAULT_KLINE_COLUMNS = ("open_time", "open", "high", "low", "close", "volume", "close_time")
+
+TIME_COLUMNS = ("open_time", "close_time")
+INTEGER_COLUMNS = ("number_of_trades",)
+
+_POSITIONS = {column: position for position, column in enumerate(KLINE_COLUMNS)}
+
+
+def parse_kline_arrays(data, columns=DEFAULT_KLINE_COLUMNS):
+    arrays = {}
+    for column in columns:
+        if column not in _POSITIONS or column == "ignore":
+            raise ValueError(f"Unsupported kline column: {column}")
+        position = _POSITIONS[column]
+        values = [row[position] for row in data]
+        if column in TIME_COLUMNS:
+            arrays[column] = np.array(values, dtype=np.int64).astype("datetime64[ms]").astype("datetime64[ns]")
+        elif column in INTEGER_COLUMNS:
+            arrays[column] = np.array(values, dtype=np.int64)
+        else:
+            # NumPy parses Binance's decimal strings straight into float64
+            arrays[column] = np.array(values, dtype=np.float64)
+    return arrays
+
+
+def parse_klines(data, columns=DEFAULT_KLINE_COLUMNS):
+    return pd.DataFrame(parse_kline_arrays(data, columns), copy=False)
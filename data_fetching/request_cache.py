@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import Future
+
+
+def _slice_depth(data, limit, params):
+    return {**data, "bids": data.get("bids", [])[:limit], "asks": data.get("asks", [])[:limit]}
+
+
+def _slice_klines(data, limit, params):
+    # Binance counts `limit` candles forward from startTime, otherwise back from endTime or now
+    return data[:limit] if "startTime" in params else data[-limit:]
+
+
+# Endpoints where a response fetched with a larger `limit` can answer a smaller one
+LIMIT_SLICERS = {
+    "/depth": _slice_depth,
+    "/klines": _slice_klines,
+}
+
+
+class RequestCache:
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._inflight = {}
+
+    @staticmethod
+    def _make_key(endpoint, params):
+        params = params or {}
+        base = tuple(sorted((key, str(value)) for key, value in params.items() if key != "limit"))
+        limit = params.get("limit")
+        return (endpoint, base), int(limit) if limit is not None else None
+
+    def _lookup(self, endpoint, base_key, limit):
+        entries = self._entries.get(base_key)
+        if not entries:
+            return None
+
+        now = time.monotonic()
+        for cached_limit, (stored_at, _) in list(entries.items()):
+            if now - stored_at > self.ttl:
+                del entries[cached_limit]
+
+        if limit in entries:
+            return entries[limit][1]
+
+        slicer = LIMIT_SLICERS.get(endpoint)
+        if slicer is None or limit is None:
+            return None
+        deeper = [cached_limit for cached_limit in entries if cached_limit is not None and cached_limit >= limit]
+        if not deeper:
+            return None
+        _, params = base_key
+        return slicer(entries[min(deeper)][1], limit, dict(params))
+
+    def get_or_fetch(self, endpoint, params, fetch):
+        base_key, limit = self._make_key(endpoint, params)
+        inflight_key = (base_key, limit)
+
+        with self._lock:
+            cached = self._lookup(endpoint, base_key, limit)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            future = self._inflight.get(inflight_key)
+            if future is not None:
+                # Another worker is already fetching the same resource; wait for its result
+                self.hits += 1
+                owner = False
+            else:
+                future = Future()
+                self._inflight[inflight_key] = future
+                self.misses += 1
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            data = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(inflight_key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if data is not None:
+                self._entries.setdefault(base_key, {})[limit] = (time.monotonic(), data)
+            self._inflight.pop(inflight_key, None)
+        future.set_result(data)
+        return data
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
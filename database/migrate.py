@@ -6,20 +6,19 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import SQLITE3_DATABASE_FILE
+from database.schema import (
+    HISTORY_SCHEMA, CANDLES_SCHEMA, HISTORY_INDEXES, UPLOAD_LEDGER_SCHEMA, INDICATOR_SNAPSHOTS_SCHEMA
+)
 
-def apply_migrations():
-    conn = sqlite3.connect(SQLITE3_DATABASE_FILE)
+def apply_migrations(db_path=SQLITE3_DATABASE_FILE):
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS history (
-        id INTEGER PRIMARY KEY,
-        symbol TEXT,
-        analysis TEXT,
-        img TEXT,
-        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
+    cursor.execute(HISTORY_SCHEMA)
+    cursor.execute(CANDLES_SCHEMA)
+
+    for statement in HISTORY_INDEXES + UPLOAD_LEDGER_SCHEMA + INDICATOR_SNAPSHOTS_SCHEMA:
+        cursor.execute(statement)
 
     conn.commit()
     conn.close()
@@ -0,0 +1,84 @@
+# Table definitions shared by the migration script and the runtime code
+
+HISTORY_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS history (
+        id INTEGER PRIMARY KEY,
+        symbol TEXT,
+        analysis TEXT,
+        img TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    '''
+
+CANDLES_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS candles (
+        symbol TEXT NOT NULL,
+        interval TEXT NOT NULL,
+        open_time INTEGER NOT NULL,
+        open REAL,
+        high REAL,
+        low REAL,
+        close REAL,
+        volume REAL,
+        close_time INTEGER NOT NULL,
+        quote_asset_volume REAL,
+        number_of_trades INTEGER,
+        taker_buy_base_asset_volume REAL,
+        taker_buy_quote_asset_volume REAL,
+        PRIMARY KEY (symbol, interval, open_time)
+    ) WITHOUT ROWID
+    '''
+
+HISTORY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_history_symbol_timestamp ON history (symbol, timestamp)",
+)
+
+SNAPSHOT_COLUMNS = (
+    "price", "rsi", "macd", "signal", "bollinger_upper", "bollinger_lower", "vwap", "atr", "obv",
+    "stochastic", "adx", "volume", "liquidity", "order_book_imbalance", "bid_ask_spread",
+    "coingecko_price", "coingecko_market_cap",
+)
+
+INDICATOR_SNAPSHOTS_SCHEMA = (
+    f'''
+    CREATE TABLE IF NOT EXISTS indicator_snapshots (
+        id INTEGER PRIMARY KEY,
+        run_at DATETIME NOT NULL,
+        symbol TEXT NOT NULL,
+        {", ".join(f"{column} REAL" for column in SNAPSHOT_COLUMNS)}
+    )
+    ''',
+    "CREATE INDEX IF NOT EXISTS idx_indicator_snapshots_symbol_run_at ON indicator_snapshots (symbol, run_at)",
+    "CREATE INDEX IF NOT EXISTS idx_indicator_snapshots_run_at ON indicator_snapshots (run_at)",
+    "CREATE INDEX IF NOT EXISTS idx_indicator_snapshots_rsi ON indicator_snapshots (rsi, run_at)",
+)
+
+# Shared with the Supabase sync so a database created before the ledger existed still works
+UPLOAD_LEDGER_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS upload_ledger (
+        history_id INTEGER PRIMARY KEY,
+        rel_path TEXT NOT NULL,
+        public_url TEXT NOT NULL,
+        uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    "CREATE INDEX IF NOT EXISTS idx_upload_ledger_rel_path ON upload_ledger (rel_path)",
+    '''
+    CREATE TABLE IF NOT EXISTS manifest_shards (
+        id INTEGER PRIMARY KEY,
+        day TEXT NOT NULL,
+        path TEXT NOT NULL,
+        entries INTEGER NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    "CREATE INDEX IF NOT EXISTS idx_manifest_shards_day ON manifest_shards (day)",
+    '''
+    CREATE TABLE IF NOT EXISTS manifest_entries (
+        history_id INTEGER PRIMARY KEY,
+        shard_id INTEGER NOT NULL
+    )
+    ''',
+)
@@ -2,11 +2,12 @@ import asyncio
 import argparse
 from config.logger import setup_logging
 from analysis.analysis import analyze_top_cryptos
+from config.settings import TELEGRAM_DELIVERY_MODE
 
 logger = setup_logging()
 
-async def run(mode: str):
-    await analyze_top_cryptos(mode=mode)
+async def run(mode: str, delivery_mode: str):
+    await analyze_top_cryptos(mode=mode, delivery_mode=delivery_mode)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Cryptocurrency analysis tool.")
@@ -16,10 +17,16 @@ if __name__ == "__main__":
         default="full-analysis",
         choices=["full-analysis", "charts-only", "skip-telegram", "skip-gpt"],
     )
+    parser.add_argument(
+        "--delivery-mode",
+        type=str,
+        default=TELEGRAM_DELIVERY_MODE,
+        choices=["message", "album"],
+    )
     args = parser.parse_args()
 
     try:
-        asyncio.run(run(args.mode))
+        asyncio.run(run(args.mode, args.delivery_mode))
     except Exception as e:
         logger.exception("Analysis failed; skipping upload.")
     else:
@@ -0,0 +1,153 @@
+import asyncio
+import time
+import logging
+from telegram import Bot
+from telegram.error import RetryAfter
+from config.settings import TELEGRAM_CHAT_RATE, TELEGRAM_GLOBAL_RATE, TELEGRAM_DELIVERY_MODE
+from notifications.telegram_notifications import (
+    MAX_ALBUM_SIZE, retry_delay, send_analysis_album_to_telegram, send_analysis_to_telegram_with_image
+)
+
+logger = logging.getLogger()
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        await self._reserve(take=True)
+
+    async def wait(self):
+        # Blocks until a token is available without taking it
+        await self._reserve(take=False)
+
+    async def _reserve(self, take):
+        if not self.rate:
+            return
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    if take:
+                        self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+DELIVERY_MODES = ("message", "album")
+
+
+class TelegramDeliveryQueue:
+    def __init__(self, bot_token, chat_id, bot=None, chat_rate=TELEGRAM_CHAT_RATE, global_rate=TELEGRAM_GLOBAL_RATE,
+                 max_retries=3, mode=TELEGRAM_DELIVERY_MODE):
+        if mode not in DELIVERY_MODES:
+            raise ValueError(f"Unknown Telegram delivery mode: {mode}")
+        self.bot = bot or Bot(token=bot_token)
+        self.chat_id = chat_id
+        # Telegram allows roughly one message per second per chat (fewer in groups) and ~30 per second overall
+        self.chat_rate = chat_rate
+        self.max_retries = max_retries
+        self.mode = mode
+        self.sent = 0
+        self.failed = 0
+        self._global_bucket = TokenBucket(global_rate, capacity=max(1, int(global_rate or 1)))
+        self._chat_buckets = {}
+        self._queues = {}
+        self._workers = []
+
+    async def start(self):
+        await self.bot.initialize()
+        return self
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def submit(self, symbol, message, image_path, chat_id=None):
+        chat_id = chat_id or self.chat_id
+        if chat_id not in self._queues:
+            # One worker per chat keeps that chat's messages in submission order
+            self._queues[chat_id] = asyncio.Queue()
+            self._chat_buckets[chat_id] = TokenBucket(self.chat_rate)
+            self._workers.append(asyncio.create_task(self._worker(chat_id)))
+        self._queues[chat_id].put_nowait((symbol, message, image_path))
+
+    async def join(self):
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self):
+        try:
+            await self.join()
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers.clear()
+            await self.bot.shutdown()
+
+    async def _worker(self, chat_id):
+        queue = self._queues[chat_id]
+        while True:
+            batch = [await queue.get()]
+            try:
+                if self.mode == "album":
+                    # Whatever queues up while the chat is paced goes out as one album
+                    await self._chat_buckets[chat_id].wait()
+                    while len(batch) < MAX_ALBUM_SIZE and not queue.empty():
+                        batch.append(queue.get_nowait())
+                results = await self._deliver(chat_id, batch)
+                for (symbol, _, _), ok in zip(batch, results):
+                    if ok:
+                        self.sent += 1
+                        logger.info(f"Sent message for {symbol} to Telegram.")
+                    else:
+                        self.failed += 1
+            except Exception as e:
+                self.failed += len(batch)
+                symbols = ", ".join(symbol for symbol, _, _ in batch)
+                logger.error(f"Failed to send message for {symbols}: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _acquire(self, chat_id):
+        await self._chat_buckets[chat_id].acquire()
+        await self._global_bucket.acquire()
+
+    async def _send(self, chat_id, batch):
+        # Every request, including fallbacks and caption continuations, waits for both buckets
+        async def acquire():
+            await self._acquire(chat_id)
+
+        if self.mode == "album":
+            items = [(message, image_path) for _, message, image_path in batch]
+            return await send_analysis_album_to_telegram(None, chat_id, items, bot=self.bot, acquire=acquire)
+        _, message, image_path = batch[0]
+        return [await send_analysis_to_telegram_with_image(
+            None, chat_id, message, image_path, bot=self.bot, acquire=acquire
+        )]
+
+    async def _deliver(self, chat_id, batch):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._send(chat_id, batch)
+            except RetryAfter as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = max(retry_delay(e), 2 ** attempt)
+                logger.warning(f"Telegram rate limit hit for chat {chat_id}, retrying in {delay}s.")
+                await asyncio.sleep(delay)
+
+    def stats(self):
+        return {"sent": self.sent, "failed": self.failed}
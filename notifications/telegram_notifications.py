@@ -1,38 +1,148 @@
+import asyncio
 import logging
-from telegram import Bot
-from telegram.error import TelegramError
+from contextlib import ExitStack
+from telegram import Bot, InputMediaPhoto
+from telegram.error import TelegramError, RetryAfter
 
 logger = logging.getLogger()
 
-async def send_analysis_to_telegram_with_image(bot_token, chat_id, message, image_path):
-    bot = Bot(token=bot_token)
+MAX_ALBUM_SIZE = 10
+CAPTION_LIMIT = 1024
+MESSAGE_LIMIT = 4096
+
+
+def retry_delay(error):
+    retry_after = error.retry_after
+    return retry_after.total_seconds() if hasattr(retry_after, "total_seconds") else float(retry_after)
+
+
+def split_text(text, limit):
+    if len(text) <= limit:
+        return text, ""
+    # Prefer breaking on a line or word boundary when one is reasonably close to the limit
+    cut = max(text.rfind("\n", 0, limit), text.rfind(" ", 0, limit))
+    if cut < limit // 2:
+        cut = limit
+    return text[:cut], text[cut:].lstrip()
+
+
+async def _no_wait():
+    pass
+
+async def send_analysis_to_telegram_with_image(bot_token, chat_id, message, image_path, bot=None, acquire=None):
+    bot = bot or Bot(token=bot_token)
+    # acquire is awaited before every request, so callers can pace fallbacks like the first send
+    acquire = acquire or _no_wait
     try:
+        await acquire()
         with open(image_path, 'rb') as image_file:
             await bot.send_photo(chat_id=chat_id, photo=image_file, caption=message)
             logger.info(f"Successfully sent image to Telegram chat {chat_id}.")
             return True
+    except RetryAfter:
+        # Rate limited: let the caller wait and retry instead of falling back to text
+        raise
     except TelegramError as e:
         logger.error(f"Telegram API error while sending image to chat {chat_id}: {e}")
         try:
+            await acquire()
             await bot.send_message(chat_id=chat_id, text=message)
             logger.info(f"Sent text-only fallback message to Telegram chat {chat_id}.")
             return True
+        except RetryAfter:
+            raise
         except TelegramError as te:
             logger.error(f"Failed to send fallback message to Telegram chat {chat_id}: {te}")
             return False
     except FileNotFoundError:
         logger.error(f"Image file not found: {image_path}.")
         try:
+            await acquire()
             await bot.send_message(chat_id=chat_id, text=f"{message}\n\n⚠️ Image file not found: {image_path}")
             return True
+        except RetryAfter:
+            raise
         except TelegramError as te:
             logger.error(f"Failed to send fallback message about missing image to Telegram chat {chat_id}: {te}")
             return False
     except Exception as e:
         logger.error(f"Unexpected error while sending image to Telegram chat {chat_id}: {e}", exc_info=True)
         try:
+            await acquire()
             await bot.send_message(chat_id=chat_id, text=f"{message}\n\n⚠️ An unexpected error occurred.")
             return True
+        except RetryAfter:
+            raise
         except TelegramError as te:
             logger.error(f"Failed to send fallback message about unexpected error to Telegram chat {chat_id}: {te}")
-            return False
\ No newline at end of file
+            return False
+
+
+async def send_analysis_album_to_telegram(bot_token, chat_id, items, bot=None, acquire=None):
+    bot = bot or Bot(token=bot_token)
+    acquire = acquire or _no_wait
+    results = []
+    for start in range(0, len(items), MAX_ALBUM_SIZE):
+        results.extend(await _send_album(bot, chat_id, items[start:start + MAX_ALBUM_SIZE], acquire))
+    return results
+
+
+async def _send_album(bot, chat_id, items, acquire):
+    if len(items) == 1:
+        message, image_path = items[0]
+        return [
+            await send_analysis_to_telegram_with_image(None, chat_id, message, image_path, bot=bot, acquire=acquire)
+        ]
+
+    captions = [split_text(message, CAPTION_LIMIT) for message, _ in items]
+    try:
+        await acquire()
+        with ExitStack() as stack:
+            media = [
+                InputMediaPhoto(stack.enter_context(open(image_path, 'rb')), caption=caption)
+                for (caption, _), (_, image_path) in zip(captions, items)
+            ]
+            await bot.send_media_group(chat_id=chat_id, media=media)
+    except RetryAfter:
+        raise
+    except (TelegramError, OSError) as e:
+        logger.error(f"Failed to send album of {len(items)} images to Telegram chat {chat_id}, sending individually: {e}")
+        return [await _send_individually(bot, chat_id, message, image_path, acquire) for message, image_path in items]
+    logger.info(f"Successfully sent album of {len(items)} images to Telegram chat {chat_id}.")
+
+    # Captions are capped at 1024 characters; whatever did not fit follows as plain text
+    return [await _send_continuation(bot, chat_id, rest, acquire) for _, rest in captions]
+
+
+async def _send_continuation(bot, chat_id, text, acquire, max_retries=3):
+    # The album is already out, so a rate limit retries the chunk rather than the whole album
+    while text:
+        chunk, text = split_text(text, MESSAGE_LIMIT)
+        for attempt in range(max_retries + 1):
+            await acquire()
+            try:
+                await bot.send_message(chat_id=chat_id, text=chunk)
+                break
+            except RetryAfter as e:
+                if attempt == max_retries:
+                    logger.error(f"Giving up on caption continuation for Telegram chat {chat_id}: {e}")
+                    return False
+                await asyncio.sleep(retry_delay(e))
+            except TelegramError as te:
+                logger.error(f"Failed to send caption continuation to Telegram chat {chat_id}: {te}")
+                return False
+    return True
+
+
+async def _send_individually(bot, chat_id, message, image_path, acquire, max_retries=3):
+    # Items of a failed album are retried one by one, so a rate limit must not restart the whole album
+    for attempt in range(max_retries + 1):
+        try:
+            return await send_analysis_to_telegram_with_image(
+                None, chat_id, message, image_path, bot=bot, acquire=acquire
+            )
+        except RetryAfter as e:
+            if attempt == max_retries:
+                logger.error(f"Giving up on image {image_path} for Telegram chat {chat_id}: {e}")
+                return False
+            await asyncio.sleep(retry_delay(e))
@@ -0,0 +1,112 @@
+import os
+import json
+import time
+import hashlib
+import numpy as np
+from config.settings import CHART_CACHE_MAX_AGE, CHART_CACHE_MAX_BYTES
+import logging
+
+logger = logging.getLogger()
+
+# Bump whenever the chart styling changes so stale renders are not served
+STYLE_VERSION = 1
+
+KEY_COLUMNS = ("open_time", "open", "high", "low", "close", "volume")
+
+
+def _column_bytes(df, column):
+    if column not in df:
+        return b""
+    values = df[column].to_numpy()
+    if column == "open_time":
+        if np.issubdtype(values.dtype, np.datetime64):
+            values = values.astype("datetime64[ms]").astype(np.int64)
+        return np.ascontiguousarray(values, dtype=np.int64).tobytes()
+    return np.ascontiguousarray(values, dtype=np.float64).tobytes()
+
+
+class ChartCache:
+    def __init__(self, output_dir="charts", max_age=CHART_CACHE_MAX_AGE, max_bytes=CHART_CACHE_MAX_BYTES):
+        self.index_path = os.path.join(output_dir, ".chart_cache.json")
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable chart cache index {self.index_path}: {e}")
+            return {}
+
+    def _save_index(self):
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(self._entries, file)
+        os.replace(tmp_path, self.index_path)
+
+    def key(self, symbol, candlestick_interval, df, **style):
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            [symbol, candlestick_interval, STYLE_VERSION, sorted(style.items())], default=str
+        ).encode("utf-8"))
+        for column in KEY_COLUMNS:
+            digest.update(column.encode("utf-8"))
+            digest.update(_column_bytes(df, column))
+        return digest.hexdigest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry and os.path.exists(entry["path"]) and time.time() - entry["created"] <= self.max_age:
+            self.hits += 1
+            return entry["path"]
+        if entry:
+            self._entries.pop(key)
+        self.misses += 1
+        return None
+
+    def put(self, key, path):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        self._entries[key] = {"path": path, "size": size, "created": time.time()}
+        self._evict()
+        try:
+            self._save_index()
+        except OSError as e:
+            logger.warning(f"Failed to save chart cache index: {e}")
+
+    def _evict(self):
+        cutoff = time.time() - self.max_age
+        expired = [key for key, entry in self._entries.items() if entry["created"] < cutoff]
+        by_age = sorted((key for key in self._entries if key not in expired), key=lambda k: self._entries[k]["created"])
+
+        total = sum(self._entries[key]["size"] for key in by_age)
+        while by_age and total > self.max_bytes:
+            oldest = by_age.pop(0)
+            total -= self._entries[oldest]["size"]
+            expired.append(oldest)
+
+        for key in expired:
+            entry = self._entries.pop(key)
+            try:
+                os.remove(entry["path"])
+            except OSError:
+                pass
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": sum(entry["size"] for entry in self._entries.values()),
+        }
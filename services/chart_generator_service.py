@@ -1,24 +1,142 @@
 import os
-import pandas as pd
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from mplfinance.original_flavor import candlestick_ohlc
 from datetime import datetime
 from scipy.stats import linregress
+from config.settings import CHART_RENDER_WORKERS, CHART_RENDER_MODE
+from services.chart_template import ChartTemplate, draw_candles, draw_volume
 import logging
 
 logger = logging.getLogger()
 
+RENDER_MODES = ("standard", "template")
+
+# Built lazily, once per process, for the "template" render mode
+_chart_template = None
+
+
+def _get_chart_template():
+    global _chart_template
+    if _chart_template is None:
+        _chart_template = ChartTemplate()
+    return _chart_template
+
+
+def time_axis(open_time):
+    # One vectorized conversion to Matplotlib date numbers; accepts datetimes or epoch milliseconds
+    values = np.asarray(open_time)
+    if not np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype(np.int64).astype("datetime64[ms]")
+    return mdates.date2num(values)
+
+
+def _render_chart(output_dir, symbol, df, candlestick_interval, projection_points, rendered_at, render_mode):
+    # Runs inside a worker process; matplotlib state is never shared between processes
+    service = ChartGeneratorService(output_dir=output_dir, max_workers=1, render_mode=render_mode)
+    return symbol, service.generate_single_chart(
+        symbol, df, candlestick_interval, projection_points=projection_points, rendered_at=rendered_at
+    )
+
+
 class ChartGeneratorService:
-    def __init__(self, output_dir="charts"):
+    def __init__(self, output_dir="charts", max_workers=CHART_RENDER_WORKERS, render_mode=CHART_RENDER_MODE,
+                 chart_cache=None):
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"Unknown chart render mode: {render_mode}")
         self.output_dir = output_dir
-
-    def generate_single_chart(self, symbol, df, candlestick_interval, projection_points=5):
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        self.max_workers = max_workers
+        self.render_mode = render_mode
+        self.chart_cache = chart_cache
+
+    def generate_chart_from_source(self, symbol, candle_source, candlestick_interval, limit=30, projection_points=5):
+        df = candle_source.fetch_historical_data(symbol, interval=candlestick_interval, limit=limit)
+        if df is None or df.empty:
+            logger.warning(f"No candles available to chart {symbol}.")
+            return None
+        return self.generate_single_chart(symbol, df, candlestick_interval, projection_points=projection_points)
+
+    def _cache_key(self, symbol, df, candlestick_interval, projection_points, rendered_at):
+        if self.chart_cache is None:
+            return None
+        # The dated folder is part of the key so each day's upload still gets its own copy
+        return self.chart_cache.key(
+            symbol, candlestick_interval, df, projection_points=projection_points,
+            render_mode=self.render_mode, folder=rendered_at.strftime("%Y-%m-%d"),
+        )
+
+    async def generate_charts(self, currency_data, candlestick_interval, projection_points=5):
+        # One timestamp per batch keeps file names deterministic regardless of which worker renders them
+        rendered_at = datetime.now()
+        items = []
+        for symbol, df in currency_data.items():
+            if df.empty:
+                continue
+            key = self._cache_key(symbol, df, candlestick_interval, projection_points, rendered_at)
+            cached = self.chart_cache.get(key) if key else None
+            if cached:
+                logger.info(f"Reusing cached chart for {symbol}: {cached}")
+                yield symbol, cached
+            else:
+                items.append((symbol, df, key))
+
+        loop = asyncio.get_running_loop()
+        if self.max_workers <= 1 or len(items) <= 1:
+            for symbol, df, key in items:
+                # Rendering off the event loop lets deliveries of earlier charts proceed meanwhile
+                chart_file = await loop.run_in_executor(
+                    None, self._render, symbol, df, candlestick_interval, projection_points, rendered_at
+                )
+                if chart_file and key:
+                    self.chart_cache.put(key, chart_file)
+                yield symbol, chart_file
+            return
+
+        keys = {symbol: key for symbol, _, key in items}
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            pending = {
+                loop.run_in_executor(
+                    executor, _render_chart, self.output_dir, symbol, df,
+                    candlestick_interval, projection_points, rendered_at, self.render_mode
+                ): symbol
+                for symbol, df, _ in items
+            }
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    symbol = pending.pop(future)
+                    try:
+                        _, chart_file = future.result()
+                    except Exception as e:
+                        logger.error(f"Chart rendering worker failed for {symbol}: {e}", exc_info=True)
+                        continue
+                    if chart_file and keys[symbol]:
+                        self.chart_cache.put(keys[symbol], chart_file)
+                    yield symbol, chart_file
+
+    def generate_single_chart(self, symbol, df, candlestick_interval, projection_points=5, rendered_at=None,
+                              time_axis=None):
+        rendered_at = rendered_at or datetime.now()
+        key = self._cache_key(symbol, df, candlestick_interval, projection_points, rendered_at)
+        if key:
+            cached = self.chart_cache.get(key)
+            if cached:
+                logger.info(f"Reusing cached chart for {symbol}: {cached}")
+                return cached
+
+        chart_file = self._render(symbol, df, candlestick_interval, projection_points, rendered_at, time_axis)
+        if chart_file and key:
+            self.chart_cache.put(key, chart_file)
+        return chart_file
+
+    def _render(self, symbol, df, candlestick_interval, projection_points, rendered_at, x=None):
+        current_date = rendered_at.strftime("%Y-%m-%d")
         dated_folder = os.path.join(self.output_dir, current_date)
         os.makedirs(dated_folder, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%H-%M-%S")
+        timestamp = rendered_at.strftime("%H-%M-%S")
         output_file = os.path.join(dated_folder, f"{symbol}-{timestamp}.png")
 
         try:
@@ -26,9 +144,13 @@ class ChartGeneratorService:
                 logger.error(f"Missing 'open_time' column in data for {symbol}.")
                 return None
 
-            df['open_time'] = pd.to_datetime(df['open_time'], unit='ms').map(mdates.date2num)
+            # The caller's frame is never modified; the float time axis lives alongside it
+            x = time_axis(df['open_time']) if x is None else np.asarray(x, dtype=float)
+
+            if self.render_mode == "template":
+                return self._render_from_template(symbol, df, x, candlestick_interval, projection_points, output_file)
 
-            time_range = df['open_time'].max() - df['open_time'].min()
+            time_range = x.max() - x.min()
             candlestick_width = max(0.0005, time_range / len(df) / 2)
 
             fig = plt.figure(figsize=(12, 8), facecolor="black")
@@ -38,23 +160,23 @@ class ChartGeneratorService:
 
             symbol_title = symbol.replace("USD", " / USD") if "USD" in symbol else symbol
 
-            ohlc = df[["open_time", "open", "high", "low", "close"]].values
-            candlestick_ohlc(ax_candles, ohlc, width=candlestick_width, colorup='lime', colordown='red', alpha=0.9)
+            open_, close = df['open'].to_numpy(dtype=float), df['close'].to_numpy(dtype=float)
+            draw_candles(
+                ax_candles, x, open_, df['high'].to_numpy(dtype=float), df['low'].to_numpy(dtype=float),
+                close, candlestick_width,
+            )
             ax_candles.set_title(f"{symbol_title} - Last {len(df)} Candlesticks ({candlestick_interval} Interval)", color="white", fontsize=14)
             ax_candles.set_ylabel("Price", color="white")
             ax_candles.grid(color="gray", linestyle="--", linewidth=0.5, alpha=0.3)
             ax_candles.tick_params(axis='both', colors="white")
 
             avg_price = (df['high'] + df['low']) / 2
-            x_values = df['open_time']
-            slope, intercept, _, _, _ = linregress(x_values, avg_price)
-            trendline = slope * x_values + intercept
-            ax_candles.plot(df['open_time'], trendline, color='magenta', linestyle='--', linewidth=1, label='Trend Line')
-
-            last_time = df['open_time'].iloc[-1]
-            time_step = x_values.iloc[1] - x_values.iloc[0]
-            future_times = [last_time + i * time_step for i in range(1, projection_points + 1)]
-            future_trendline = [slope * t + intercept for t in future_times]
+            slope, intercept, _, _, _ = linregress(x, avg_price)
+            trendline = slope * x + intercept
+            ax_candles.plot(x, trendline, color='magenta', linestyle='--', linewidth=1, label='Trend Line')
+
+            future_times = x[-1] + (x[1] - x[0]) * np.arange(1, projection_points + 1)
+            future_trendline = slope * future_times + intercept
             ax_candles.plot(future_times, future_trendline, color='orange', linestyle='dotted', linewidth=1, label='Future Trend Line')
 
             current_price = df['close'].iloc[-1]
@@ -70,8 +192,7 @@ class ChartGeneratorService:
                 ax_candles.legend(loc='upper left', fontsize=8, facecolor="black", edgecolor="white", labelcolor="white")
 
             if "volume" in df:
-                volume_colors = ['lime' if df['close'].iloc[i] >= df['open'].iloc[i] else 'red' for i in range(len(df))]
-                ax_volume.bar(df['open_time'], df['volume'], color=volume_colors, alpha=0.7, width=candlestick_width)
+                draw_volume(ax_volume, x, df['volume'].to_numpy(dtype=float), open_, close, candlestick_width)
                 ax_volume.set_ylabel("Volume", color="white")
                 ax_volume.grid(color="gray", linestyle="--", linewidth=0.5, alpha=0.3)
                 ax_volume.tick_params(axis='both', colors="white")
@@ -88,4 +209,23 @@ class ChartGeneratorService:
 
         except Exception as e:
             logger.error(f"Error generating chart for {symbol}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _render_from_template(self, symbol, df, x, candlestick_interval, projection_points, output_file):
+        open_, high, low, close = (df[column].to_numpy(dtype=float) for column in ("open", "high", "low", "close"))
+        volume = df['volume'].to_numpy(dtype=float) if "volume" in df else None
+        candlestick_width = max(0.0005, (x.max() - x.min()) / len(x) / 2)
+
+        slope, intercept, _, _, _ = linregress(x, (high + low) / 2)
+        time_step = x[1] - x[0]
+        future_times = x[-1] + time_step * np.arange(1, projection_points + 1)
+
+        symbol_title = symbol.replace("USD", " / USD") if "USD" in symbol else symbol
+        title = f"{symbol_title} - Last {len(df)} Candlesticks ({candlestick_interval} Interval)"
+
+        _get_chart_template().render(
+            output_file, title, x, open_, high, low, close, volume, candlestick_width,
+            slope * x + intercept, future_times, slope * future_times + intercept,
+        )
+        logger.info(f"Chart saved for {symbol}: {output_file}")
+        return output_file
\ No newline at end of file
@@ -0,0 +1,120 @@
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+
+UP_COLOR = "lime"
+DOWN_COLOR = "red"
+
+
+def candle_colors(open_, close, alpha):
+    up = np.asarray(close) >= np.asarray(open_)
+    return np.where(up[:, None], to_rgba(UP_COLOR, alpha), to_rgba(DOWN_COLOR, alpha))
+
+
+def wick_segments(x, low, high):
+    return np.stack([np.column_stack([x, low]), np.column_stack([x, high])], axis=1)
+
+
+def bar_vertices(x, bottom, top, width):
+    left, right = x - width / 2, x + width / 2
+    return np.stack([
+        np.column_stack([left, bottom]),
+        np.column_stack([left, top]),
+        np.column_stack([right, top]),
+        np.column_stack([right, bottom]),
+    ], axis=1)
+
+
+def draw_candles(ax, x, open_, high, low, close, width, alpha=0.9):
+    colors = candle_colors(open_, close, alpha)
+    wicks = LineCollection(wick_segments(x, low, high), colors=colors, linewidths=0.5)
+    bodies = PolyCollection(
+        bar_vertices(x, np.minimum(open_, close), np.maximum(open_, close), width),
+        facecolors=colors, linewidths=0,
+    )
+    ax.add_collection(wicks)
+    ax.add_collection(bodies)
+    ax.autoscale_view()
+    return wicks, bodies
+
+
+def draw_volume(ax, x, volume, open_, close, width, alpha=0.7):
+    bars = PolyCollection(
+        bar_vertices(x, np.zeros_like(volume), volume, width),
+        facecolors=candle_colors(open_, close, alpha), linewidths=0,
+    )
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+class ChartTemplate:
+    def __init__(self):
+        # A bare Figure is not registered with pyplot, so it can be reused without plt.close()
+        self.fig = Figure(figsize=(12, 8), facecolor="black")
+        self.ax_candles, self.ax_volume = self.fig.subplots(
+            2, 1, sharex=True, gridspec_kw={'height_ratios': [4, 1]}
+        )
+        for ax in (self.ax_candles, self.ax_volume):
+            ax.set_facecolor("black")
+            ax.grid(color="gray", linestyle="--", linewidth=0.5, alpha=0.3)
+            ax.tick_params(axis='both', colors="white")
+
+        self.title = self.ax_candles.set_title("", color="white", fontsize=14)
+        self.ax_candles.set_ylabel("Price", color="white")
+        self.ax_volume.set_ylabel("Volume", color="white")
+
+        self.wicks = LineCollection([], linewidths=0.5)
+        self.bodies = PolyCollection([], linewidths=0)
+        self.volume_bars = PolyCollection([], linewidths=0)
+        self.ax_candles.add_collection(self.wicks)
+        self.ax_candles.add_collection(self.bodies)
+        self.ax_volume.add_collection(self.volume_bars)
+
+        self.trend_line, = self.ax_candles.plot([], [], color='magenta', linestyle='--', linewidth=1, label='Trend Line')
+        self.future_line, = self.ax_candles.plot(
+            [], [], color='orange', linestyle='dotted', linewidth=1, label='Future Trend Line'
+        )
+        self.price_line = self.ax_candles.axhline(0, color='cyan', linestyle='--', linewidth=1, label='Current Price')
+        self.legend = self.ax_candles.legend(
+            loc='upper left', fontsize=8, facecolor="black", edgecolor="white", labelcolor="white"
+        )
+
+        self.ax_candles.xaxis_date()
+        self.ax_candles.xaxis.set_major_locator(mdates.AutoDateLocator())
+        self.ax_candles.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        self.ax_volume.get_yaxis().get_major_formatter().set_scientific(False)
+        # Fixed margins replace tight_layout, which would re-measure every text artist per chart
+        self.fig.subplots_adjust(left=0.08, right=0.97, top=0.94, bottom=0.06, hspace=0.05)
+
+    def render(self, output_file, title, x, open_, high, low, close, volume, width,
+               trendline, future_times, future_trendline):
+        colors = candle_colors(open_, close, 0.9)
+        self.wicks.set_segments(wick_segments(x, low, high))
+        self.wicks.set_color(colors)
+        self.bodies.set_verts(bar_vertices(x, np.minimum(open_, close), np.maximum(open_, close), width))
+        self.bodies.set_facecolor(colors)
+
+        self.trend_line.set_data(x, trendline)
+        self.future_line.set_data(future_times, future_trendline)
+        current_price = close[-1]
+        self.price_line.set_ydata([current_price, current_price])
+        self.legend.get_texts()[2].set_text(f'Current Price: {current_price:.2f}')
+        self.title.set_text(title)
+
+        self.volume_bars.set_visible(volume is not None)
+        if volume is not None:
+            self.volume_bars.set_verts(bar_vertices(x, np.zeros_like(volume), volume, width))
+            self.volume_bars.set_facecolor(candle_colors(open_, close, 0.7))
+            self.ax_volume.set_ylim(0, volume.max() * 1.1)
+
+        # Data limits are set explicitly since the reused axes never autoscale
+        low_bound = min(low.min(), trendline.min(), min(future_trendline, default=np.inf))
+        high_bound = max(high.max(), trendline.max(), max(future_trendline, default=-np.inf))
+        margin = (high_bound - low_bound) * 0.05 or abs(high_bound) * 0.01 or 1
+        self.ax_candles.set_ylim(low_bound - margin, high_bound + margin)
+        self.ax_candles.set_xlim(x[0] - width, max([x[-1], *future_times]) + width)
+
+        self.fig.savefig(output_file, facecolor="black")
@@ -1,4 +1,7 @@
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import BINANCE_MAX_WORKERS
 from services.symbol_analysis_service import SymbolAnalysisService
 from data_fetching.openai_client import OpenAIClient
 import logging
@@ -6,17 +9,27 @@ import logging
 logger = logging.getLogger()
 
 class GPTAnalysisService:
-    def __init__(self, api_key):
+    def __init__(self, api_key, max_workers=BINANCE_MAX_WORKERS):
         self.openai_client = OpenAIClient(api_key)
+        self.max_workers = max_workers
 
     def analyze_symbols(self, symbols, binance_client, coingecko_data):
         significant_symbols = []
-        symbol_analysis_service = SymbolAnalysisService(binance_client, coingecko_data)
+        symbol_analysis_service = SymbolAnalysisService(binance_client, coingecko_data, max_workers=self.max_workers)
+        started = time.perf_counter()
+        symbol_analysis_service.prefetch(symbols)
 
-        for symbol in symbols:
+        logger.info(f"Analyzing {len(symbols)} symbols with up to {self.max_workers} concurrent workers.")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (symbol, executor.submit(symbol_analysis_service.analyze_symbol, symbol))
+                for symbol in symbols
+            ]
+
+        # Results are collected in submission order so the GPT prompt stays stable
+        for symbol, future in futures:
             try:
-                logger.info(f"Analyzing symbol: {symbol}")
-                data = symbol_analysis_service.analyze_symbol(symbol)
+                data = future.result()
                 if data:
                     logger.info(f"Analysis complete for {symbol}: {data}")
                     significant_symbols.append(data)
@@ -26,6 +39,10 @@ class GPTAnalysisService:
                 logger.error(f"Error analyzing {symbol}: {e}", exc_info=True)
 
         logger.info(f"Completed analysis. Found {len(significant_symbols)} significant symbols.")
+        logger.info(
+            f"Symbol analysis took {time.perf_counter() - started:.2f}s "
+            f"with {self.max_workers} workers; stage timings: {symbol_analysis_service.timings.summary()}"
+        )
         return significant_symbols
 
     def prepare_gpt_input(self, global_metrics, bitcoin_sentiment, significant_symbols):
@@ -1,43 +1,94 @@
-from config.settings import BINANCE_TO_COINGECKO_SYMBOLS
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import BINANCE_TO_COINGECKO_SYMBOLS, BINANCE_MAX_WORKERS
 from analysis.technical_indicators import (
-    calculate_rsi,
-    calculate_macd,
-    calculate_bollinger_bands,
-    calculate_vwap,
-    calculate_atr,
-    calculate_obv,
-    calculate_stochastic_oscillator,
-    calculate_adx,
+    IndicatorEngine,
+    compute_panel,
+    stack_frames,
     calculate_order_book_imbalance,
     calculate_bid_ask_spread
 )
+from utils.timing import StageTimer
+import logging
+
+logger = logging.getLogger()
 
 class SymbolAnalysisService:
-    def __init__(self, binance_client, coingecko_data):
+    def __init__(self, binance_client, coingecko_data, candle_source=None, max_workers=BINANCE_MAX_WORKERS):
         self.binance_client = binance_client
         self.coingecko_data = coingecko_data
+        # Any object with fetch_historical_data (e.g. CandleArchive) can replace Binance for candles
+        self.candle_source = candle_source or binance_client
+        self.timings = StageTimer()
+        self.max_workers = max_workers
+        self.volumes = {}
+        self.histories = {}
+        self.panel_indicators = {}
+        self.indicator_engine = IndicatorEngine()
+
+    def prefetch(self, symbols):
+        with self.timings.measure("volume_bulk"):
+            self.volumes = self.binance_client.fetch_volumes(symbols) or {}
+        with self.timings.measure("klines_bulk"):
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                histories = dict(zip(symbols, executor.map(self._fetch_history, symbols)))
+        self.histories = {symbol: df for symbol, df in histories.items() if df is not None and not df.empty}
+        with self.timings.measure("indicators_panel"):
+            self.panel_indicators = self._compute_panel_indicators(self.histories)
+
+    def _fetch_history(self, symbol):
+        try:
+            return self.candle_source.fetch_historical_data(symbol)
+        except Exception as e:
+            # analyze_symbol fetches it again and reports the error for this symbol
+            logger.warning(f"Prefetching candles for {symbol} failed: {e}")
+            return None
+
+    def _compute_panel_indicators(self, histories):
+        # Symbols with the same candle count share one panel so every indicator runs once for all of them
+        groups = {}
+        for symbol, df in histories.items():
+            groups.setdefault(len(df), []).append(symbol)
+
+        latest = {}
+        for group in groups.values():
+            try:
+                values = compute_panel(
+                    stack_frames([histories[symbol] for symbol in group]),
+                    self.indicator_engine.indicators, **self.indicator_engine.params,
+                )
+            except Exception as e:
+                logger.warning(f"Panel indicators failed for {len(group)} symbols, computing them one by one: {e}")
+                continue
+            for row, symbol in enumerate(group):
+                latest[symbol] = {column: series[row, -1] for column, series in values.items()}
+        return latest
 
     def analyze_symbol(self, symbol):
         try:
-            historical_data = self.binance_client.fetch_historical_data(symbol)
+            historical_data = self.histories.get(symbol)
             if historical_data is None:
-                return None
+                with self.timings.measure("klines"):
+                    historical_data = self.candle_source.fetch_historical_data(symbol)
+                if historical_data is None:
+                    return None
 
-            historical_data["RSI"] = calculate_rsi(historical_data)
-            macd, signal = calculate_macd(historical_data)
-            upper_band, lower_band = calculate_bollinger_bands(historical_data)
-            historical_data["VWAP"] = calculate_vwap(historical_data)
-            historical_data["ATR"] = calculate_atr(historical_data)
-            historical_data["OBV"] = calculate_obv(historical_data)
-            historical_data["Stochastic"] = calculate_stochastic_oscillator(historical_data)
-            historical_data["ADX"] = calculate_adx(historical_data)
+            indicators = self.panel_indicators.get(symbol)
+            if indicators is None:
+                with self.timings.measure("indicators"):
+                    indicators = self.indicator_engine.compute(historical_data).iloc[-1]
 
-            order_book = self.binance_client.fetch_order_book(symbol)
+            with self.timings.measure("order_book"):
+                order_book = self.binance_client.fetch_order_book(symbol)
             bid_ask_spread = calculate_bid_ask_spread(order_book)
             order_book_imbalance = calculate_order_book_imbalance(order_book)
 
-            volume = self.binance_client.fetch_volume(symbol)
-            liquidity = self.binance_client.fetch_liquidity(symbol)
+            if symbol in self.volumes:
+                volume = self.volumes[symbol]
+            else:
+                with self.timings.measure("volume"):
+                    volume = self.binance_client.fetch_volume(symbol)
+            with self.timings.measure("liquidity"):
+                liquidity = self.binance_client.fetch_liquidity(symbol)
 
             coingecko_symbol = BINANCE_TO_COINGECKO_SYMBOLS.get(symbol)
             coingecko_entry = self.coingecko_data.get(coingecko_symbol, {})
@@ -45,16 +96,16 @@ class SymbolAnalysisService:
             return {
                 "symbol": symbol,
                 "price": historical_data["close"].iloc[-1],
-                "rsi": historical_data["RSI"].iloc[-1],
-                "macd": macd.iloc[-1],
-                "signal": signal.iloc[-1],
-                "bollinger_upper": upper_band.iloc[-1],
-                "bollinger_lower": lower_band.iloc[-1],
-                "vwap": historical_data["VWAP"].iloc[-1],
-                "atr": historical_data["ATR"].iloc[-1],
-                "obv": historical_data["OBV"].iloc[-1],
-                "stochastic": historical_data["Stochastic"].iloc[-1],
-                "adx": historical_data["ADX"].iloc[-1],
+                "rsi": indicators["rsi"],
+                "macd": indicators["macd"],
+                "signal": indicators["signal"],
+                "bollinger_upper": indicators["bollinger_upper"],
+                "bollinger_lower": indicators["bollinger_lower"],
+                "vwap": indicators["vwap"],
+                "atr": indicators["atr"],
+                "obv": indicators["obv"],
+                "stochastic": indicators["stochastic"],
+                "adx": indicators["adx"],
                 "volume": volume,
                 "liquidity": liquidity,
                 "order_book_imbalance": order_book_imbalance,
@@ -2,16 +2,22 @@ import os
 import json
 import sqlite3
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from storage3 import SyncStorageClient
+from database.schema import HISTORY_INDEXES, UPLOAD_LEDGER_SCHEMA
 
 load_dotenv()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 BUCKET = "charts"
+UPLOAD_WORKERS = int(os.getenv("SUPABASE_UPLOAD_WORKERS", 8))
+# "full" rewrites <date>/history.json, "sharded" uploads only this run's entries plus a small index, "both" does both
+MANIFEST_MODE = os.getenv("SUPABASE_MANIFEST_MODE", "full")
+MANIFEST_MODES = ("full", "sharded", "both")
 TZ = ZoneInfo("Asia/Tbilisi")
 
 
@@ -51,7 +57,148 @@ def _upload_with_retries(storage_from, rel_path, data, headers, max_retries=3):
             time.sleep(backoff)
 
 
-def sync_to_supabase(db_path="database/crypto_analysis.db"):
+def _today_bounds():
+    now = datetime.now(TZ)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    # history.timestamp is stored by SQLite as UTC text, so compare against Tbilisi midnight in UTC
+    since = midnight.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return now.strftime("%Y-%m-%d"), since
+
+
+def _ensure_ledger(conn):
+    for statement in HISTORY_INDEXES + UPLOAD_LEDGER_SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+
+
+def _pending_rows(conn, since):
+    return conn.execute(
+        """
+        SELECT h.id, h.symbol, h.img FROM history h
+        WHERE h.timestamp >= ?
+          AND NOT EXISTS (SELECT 1 FROM upload_ledger u WHERE u.history_id = h.id)
+        ORDER BY h.id
+        """,
+        (since,),
+    ).fetchall()
+
+
+def _uploaded_paths(conn, today_str):
+    # A range over the "<date>/" prefix ('0' sorts right after '/') keeps the rel_path index usable
+    rows = conn.execute(
+        "SELECT rel_path, public_url FROM upload_ledger WHERE rel_path >= ? AND rel_path < ?",
+        (f"{today_str}/", f"{today_str}0"),
+    ).fetchall()
+    return dict(rows)
+
+
+def _record_uploads(conn, history_ids, rel_path, public_url):
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO upload_ledger (history_id, rel_path, public_url) VALUES (?, ?, ?)",
+            [(history_id, rel_path, public_url) for history_id in history_ids],
+        )
+
+
+def _manifest_rows(conn, since):
+    rows = conn.execute(
+        """
+        SELECT h.symbol, h.analysis, u.public_url FROM history h
+        JOIN upload_ledger u ON u.history_id = h.id
+        WHERE h.timestamp >= ?
+        ORDER BY h.id
+        """,
+        (since,),
+    ).fetchall()
+    return [{"symbol": symbol, "analysis": analysis, "img": public_url} for symbol, analysis, public_url in rows]
+
+
+def _public_url(rel_path):
+    return f"{SUPABASE_URL}/storage/v1/object/public/{BUCKET}/{rel_path}"
+
+
+def _upload_json(storage_from, rel_path, payload):
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return _upload_with_retries(
+        storage_from, rel_path, data, {"content-type": "application/json", "x-upsert": "true"}
+    )
+
+
+def _publish_full_manifest(conn, storage_from, today_str, since):
+    manifest = _manifest_rows(conn, since)
+    if not manifest:
+        print(f"ℹ️  No records for {today_str}")
+        return
+
+    manifest_path = f"{today_str}/history.json"
+    if _upload_json(storage_from, manifest_path, manifest):
+        print(f"📄 Manifest saved: {_public_url(manifest_path)}")
+    else:
+        print(f"❌ Failed to save manifest: {manifest_path}")
+
+
+def _unsharded_rows(conn, since):
+    # Uploaded rows not yet published in any shard; a shard that failed to upload is retried next run
+    return conn.execute(
+        """
+        SELECT h.id, h.symbol, h.analysis, u.public_url FROM history h
+        JOIN upload_ledger u ON u.history_id = h.id
+        WHERE h.timestamp >= ?
+          AND NOT EXISTS (SELECT 1 FROM manifest_entries m WHERE m.history_id = h.id)
+        ORDER BY h.id
+        """,
+        (since,),
+    ).fetchall()
+
+
+def _publish_manifest_shard(conn, storage_from, today_str, since):
+    rows = _unsharded_rows(conn, since)
+    if not rows:
+        print(f"ℹ️  No new records for {today_str}; manifest index unchanged")
+        return
+
+    shard_number = conn.execute("SELECT COUNT(*) FROM manifest_shards WHERE day = ?", (today_str,)).fetchone()[0] + 1
+    shard_path = f"{today_str}/manifest/{shard_number:04d}-{datetime.now(TZ).strftime('%H%M%S')}.json"
+    shard = [{"symbol": symbol, "analysis": analysis, "img": public_url} for _, symbol, analysis, public_url in rows]
+    if not _upload_json(storage_from, shard_path, shard):
+        print(f"❌ Failed to save manifest shard: {shard_path}")
+        return
+    print(f"📄 Manifest shard saved: {_public_url(shard_path)}")
+
+    # The index only lists shards, so the web page fetches it and then just the shards it has not seen yet
+    shards = conn.execute(
+        "SELECT path, entries FROM manifest_shards WHERE day = ? ORDER BY id", (today_str,)
+    ).fetchall() + [(shard_path, len(rows))]
+    index = {
+        "date": today_str,
+        "total": sum(entries for _, entries in shards),
+        "shards": [{"path": path, "url": _public_url(path), "entries": entries} for path, entries in shards],
+    }
+    index_path = f"{today_str}/manifest/index.json"
+    if not _upload_json(storage_from, index_path, index):
+        # The rows stay unsharded, so the next run uploads them again together with a fresh index
+        print(f"❌ Failed to save manifest index: {index_path}")
+        return
+    print(f"📄 Manifest index saved: {_public_url(index_path)}")
+
+    with conn:
+        shard_id = conn.execute(
+            "INSERT INTO manifest_shards (day, path, entries) VALUES (?, ?, ?)", (today_str, shard_path, len(rows))
+        ).lastrowid
+        conn.executemany(
+            "INSERT OR REPLACE INTO manifest_entries (history_id, shard_id) VALUES (?, ?)",
+            [(history_id, shard_id) for history_id, _, _, _ in rows],
+        )
+
+
+def _upload_chart(storage_from, img_path, rel_path):
+    with open(img_path, "rb") as f:
+        return _upload_with_retries(storage_from, rel_path, f, {"content-type": "image/png", "x-upsert": "true"})
+
+
+def sync_to_supabase(db_path="database/crypto_analysis.db", max_workers=UPLOAD_WORKERS, manifest_mode=MANIFEST_MODE):
+    if manifest_mode not in MANIFEST_MODES:
+        raise ValueError(f"Unknown manifest mode: {manifest_mode}")
     if not SUPABASE_URL or not SERVICE_KEY:
         print("SUPABASE_URL or SUPABASE_SERVICE_KEY not configured; skipping upload to Supabase.")
         return
@@ -59,16 +206,15 @@ def sync_to_supabase(db_path="database/crypto_analysis.db"):
     # Allow overriding DB path via env var when executed in CI/workflow
     db_path = os.getenv("SQLITE3_DATABASE_FILE", db_path)
 
-    storage = _make_storage_client()
-    today_str = datetime.now(TZ).strftime("%Y-%m-%d")
+    # One client (and HTTP connection pool) shared by every upload worker
+    storage_from = _make_storage_client().from_(BUCKET)
+    today_str, since = _today_bounds()
 
     conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("SELECT id, symbol, analysis, img FROM history")
-    rows = cur.fetchall()
+    _ensure_ledger(conn)
 
-    manifest = []
-    for _, symbol, analysis, img_path in rows:
+    pending = {}
+    for history_id, symbol, img_path in _pending_rows(conn, since):
         if not img_path or not os.path.exists(img_path):
             print(f"⚠️  Skipping {symbol} — image not found: {img_path}")
             continue
@@ -78,39 +224,44 @@ def sync_to_supabase(db_path="database/crypto_analysis.db"):
             # only upload today's files
             continue
 
-        file_name = os.path.basename(img_path)
-        rel_path = f"{today_str}/{file_name}"
+        rel_path = f"{today_str}/{os.path.basename(img_path)}"
+        # Rows sharing a chart (e.g. a cached render) upload it once
+        pending.setdefault(rel_path, (img_path, []))[1].append((history_id, symbol))
 
-        try:
-            with open(img_path, "rb") as f:
-                ok = _upload_with_retries(
-                    storage.from_(BUCKET), rel_path, f, {"content-type": "image/png", "x-upsert": "true"}
-                )
-            if not ok:
-                print(f"❌ Giving up on {symbol} upload: {rel_path}")
-                continue
-
-            public_url = f"{SUPABASE_URL}/storage/v1/object/public/{BUCKET}/{rel_path}"
-            manifest.append({"symbol": symbol, "analysis": analysis, "img": public_url})
-
-            print(f"✅ Uploaded {symbol} → {public_url}")
-        except Exception as e:
-            print(f"❌ Exception while uploading {img_path}: {e}")
+    already_uploaded = _uploaded_paths(conn, today_str)
+    for rel_path in [rel_path for rel_path in pending if rel_path in already_uploaded]:
+        _, entries = pending.pop(rel_path)
+        _record_uploads(conn, [history_id for history_id, _ in entries], rel_path, already_uploaded[rel_path])
+        print(f"↩️  Already uploaded {rel_path}; skipping.")
 
-    if manifest:
-        manifest_path = f"{today_str}/history.json"
-        data = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            futures = {
+                executor.submit(_upload_chart, storage_from, img_path, rel_path): rel_path
+                for rel_path, (img_path, _) in pending.items()
+            }
+            for future in as_completed(futures):
+                rel_path = futures[future]
+                img_path, entries = pending[rel_path]
+                symbols = ", ".join(symbol for _, symbol in entries)
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    print(f"❌ Exception while uploading {img_path}: {e}")
+                    continue
+                if not ok:
+                    print(f"❌ Giving up on {symbols} upload: {rel_path}")
+                    continue
 
-        ok = _upload_with_retries(
-            storage.from_(BUCKET), manifest_path, data, {"content-type": "application/json", "x-upsert": "true"}
-        )
+                public_url = _public_url(rel_path)
+                # Only the main thread touches SQLite; workers just upload
+                _record_uploads(conn, [history_id for history_id, _ in entries], rel_path, public_url)
+                print(f"✅ Uploaded {symbols} → {public_url}")
 
-        if ok:
-            print(f"📄 Manifest saved: {SUPABASE_URL}/storage/v1/object/public/{BUCKET}/{manifest_path}")
-        else:
-            print(f"❌ Failed to save manifest: {manifest_path}")
-    else:
-        print(f"ℹ️  No records for {today_str}")
+    if manifest_mode in ("full", "both"):
+        _publish_full_manifest(conn, storage_from, today_str, since)
+    if manifest_mode in ("sharded", "both"):
+        _publish_manifest_shard(conn, storage_from, today_str, since)
 
     conn.close()
 
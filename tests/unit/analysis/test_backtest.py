@@ -0,0 +1,140 @@
+import os
+import glob
+import pytest
+import numpy as np
+import pandas as pd
+from analysis import backtest
+from analysis.backtest import run_backtest, backtest_symbols, load_candles, summarize
+from database.migrate import apply_migrations
+from utils.candle_archive import CandleArchive
+from utils.candle_store import CandleStore
+
+def make_candles(rows, seed=0, start="2024-01-01"):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame({
+        "open_time": pd.date_range(start, periods=rows, freq="15min"),
+        "open": close * (1 + rng.normal(0, 0.002, rows)),
+        "high": close * 1.01,
+        "low": close * 0.99,
+        "close": close,
+        "volume": rng.random(rows) * 1000,
+    })
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    archive = CandleArchive(str(tmp_path / "archive"))
+    for seed, symbol in enumerate(["BTCUSDT", "ETHUSDT", "SOLUSDT"]):
+        archive.write(symbol, "15m", make_candles(500, seed=seed))
+    return archive.root
+
+def test_hold_keeps_position_between_entry_and_exit():
+    enter = np.array([False, True, False, False, False, True, False])
+    exit_ = np.array([True, False, False, True, False, False, False])
+    np.testing.assert_array_equal(backtest._hold(enter, exit_), [0, 1, 1, 0, 0, 1, 1])
+
+def test_run_backtest_reports_pnl_drawdown_and_hit_rate(monkeypatch):
+    position = np.array([0, 1, 1, 0, 1, 0], dtype=float)
+    monkeypatch.setitem(backtest.RULES, "fixed", lambda close, indicators, params: position)
+    data = pd.DataFrame({
+        "open": 1.0, "high": 1.0, "low": 1.0, "volume": 1.0,
+        "close": [100.0, 100.0, 110.0, 99.0, 99.0, 89.1],
+    })
+
+    result = run_backtest(data, rule="fixed", fee_bps=0)
+
+    # Long for 100 -> 110 -> 99 (-1%), then for 99 -> 89.1 (-10%)
+    assert result["trades"] == 2
+    assert result["pnl"] == pytest.approx(0.99 * 0.9 - 1)
+    assert result["max_drawdown"] == pytest.approx(0.99 * 0.9 / 1.1 - 1)
+    assert result["hit_rate"] == 0.0
+    assert result["exposure"] == pytest.approx(3 / 5)
+
+def test_run_backtest_charges_fees_on_entry_and_exit(monkeypatch):
+    monkeypatch.setitem(backtest.RULES, "fixed", lambda close, indicators, params: np.array([1, 0, 0], dtype=float))
+    data = pd.DataFrame({"open": 1.0, "high": 1.0, "low": 1.0, "volume": 1.0, "close": [100.0, 100.0, 100.0]})
+
+    result = run_backtest(data, rule="fixed", fee_bps=10)
+
+    assert result["pnl"] == pytest.approx(0.999 * 0.999 - 1)
+    assert result["trades"] == 1
+    assert result["hit_rate"] == 0.0
+
+@pytest.mark.parametrize("rule", list(backtest.RULES))
+def test_every_rule_runs_on_random_candles(rule):
+    result = run_backtest(make_candles(300), rule=rule)
+    assert result["candles"] == 300
+    assert -1 <= result["max_drawdown"] <= 0
+    assert 0 <= result["exposure"] <= 1
+
+@pytest.mark.parametrize("rule", list(backtest.RULES))
+def test_run_backtest_computes_only_the_rule_indicators(rule, monkeypatch):
+    computed = []
+    engine = backtest.IndicatorEngine
+
+    def recording_engine(indicators, **params):
+        computed.append(tuple(indicators))
+        return engine(indicators, **params)
+
+    monkeypatch.setattr(backtest, "IndicatorEngine", recording_engine)
+    run_backtest(make_candles(100), rule=rule)
+    assert computed == [backtest.RULE_INDICATORS[rule]]
+
+def test_run_backtest_rejects_unknown_rule():
+    with pytest.raises(ValueError, match="Unknown backtest rule"):
+        run_backtest(make_candles(10), rule="moon")
+
+def test_backtest_symbols_in_processes_matches_serial_run(archive_dir):
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    serial = backtest_symbols(symbols, "15m", location=archive_dir, rule="combined", max_workers=1)
+    parallel = backtest_symbols(symbols, "15m", location=archive_dir, rule="combined", max_workers=2)
+
+    assert [result["symbol"] for result in parallel] == symbols
+    assert parallel == serial
+    assert summarize(parallel)["candles"] == 1500
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_backtest_symbols_skips_failing_symbols(archive_dir, max_workers):
+    # A truncated partition file makes the ETHUSDT worker raise while loading its candles
+    for path in glob.glob(os.path.join(archive_dir, "**", "*ETHUSDT*", "**", "close.npy"), recursive=True):
+        with open(path, "wb") as f:
+            f.write(b"not a numpy file")
+
+    results = backtest_symbols(
+        ["BTCUSDT", "ETHUSDT", "SOLUSDT"], "15m", location=archive_dir, max_workers=max_workers
+    )
+    assert [result["symbol"] for result in results] == ["BTCUSDT", "SOLUSDT"]
+    assert all(result["candles"] == 500 for result in results)
+
+def test_store_and_archive_sources_give_the_same_candles(tmp_path):
+    frame = make_candles(50)
+    db_path = str(tmp_path / "candles.db")
+    apply_migrations(db_path)
+    store = CandleStore(db_path)
+    open_ms = frame["open_time"].to_numpy().astype("datetime64[ms]").astype(np.int64)
+    store.upsert("BTCUSDT", "15m", [
+        [t, o, h, l, c, v, t + 899_999, 0.0, 0, 0.0, 0.0, "0"]
+        for t, o, h, l, c, v in zip(open_ms, frame["open"], frame["high"], frame["low"], frame["close"], frame["volume"])
+    ])
+    store.close()
+    archive = CandleArchive(str(tmp_path / "archive"))
+    archive.write("BTCUSDT", "15m", frame)
+
+    start, end = "2024-01-01 02:00", "2024-01-01 08:00"
+    from_store = load_candles("store", db_path, "BTCUSDT", "15m", start=start, end=end)
+    from_archive = load_candles("archive", archive.root, "BTCUSDT", "15m", start=start, end=end)
+
+    assert len(from_store) == 24
+    for column in ("open_time", "open", "high", "low", "close", "volume"):
+        np.testing.assert_array_equal(from_store[column].to_numpy(), from_archive[column].to_numpy())
+
+def test_summarize_weights_hit_rate_by_trades():
+    results = [
+        {"candles": 10, "trades": 3, "pnl": 0.1, "max_drawdown": -0.05, "hit_rate": 1 / 3},
+        {"candles": 10, "trades": 1, "pnl": -0.2, "max_drawdown": -0.3, "hit_rate": 1.0},
+        {"candles": 10, "trades": 0, "pnl": 0.0, "max_drawdown": 0.0, "hit_rate": None},
+    ]
+    summary = summarize(results)
+    assert summary["hit_rate"] == pytest.approx(0.5)
+    assert summary["worst_drawdown"] == -0.3
+    assert summary["mean_pnl"] == pytest.approx(-0.1 / 3)
@@ -0,0 +1,103 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import pytest
+
+
+def make_klines(count, start_ms=1_700_000_000_000, step_ms=900_000):
+    klines = []
+    for i in range(count):
+        open_time = start_ms + i * step_ms
+        price = 100 + i
+        klines.append([
+            open_time, f"{price:.2f}", f"{price + 2:.2f}", f"{price - 2:.2f}", f"{price + 1:.2f}", "10.0",
+            open_time + step_ms - 1, "1000.0", 5, "5.0", "500.0", "0"
+        ])
+    return klines
+
+
+class MockBinanceServer:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+        self.klines = {}
+        self.now_ms = None
+
+    def set_klines(self, symbol, count, start_ms, step_ms=900_000):
+        self.klines[symbol] = make_klines(count, start_ms=start_ms, step_ms=step_ms)
+
+    def count(self, path):
+        return sum(1 for request_path, _ in self.requests if request_path == path)
+
+    def handle(self, path, query):
+        with self._lock:
+            self.requests.append((path, query))
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return self._respond(path, query)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _respond(self, path, query):
+        if path == "/api/v3/klines":
+            klines = self.klines.get(query["symbol"], make_klines(50))
+            if self.now_ms is not None:
+                klines = [kline for kline in klines if kline[0] <= self.now_ms]
+            if "startTime" in query:
+                klines = [kline for kline in klines if kline[0] >= int(query["startTime"])]
+                return klines[:int(query.get("limit", 500))]
+            return klines[-int(query.get("limit", 500)):]
+        if path == "/api/v3/depth":
+            limit = int(query.get("limit", 100))
+            return {
+                "bids": [[f"{100 - i}.0", "1.0"] for i in range(limit)],
+                "asks": [[f"{101 + i}.0", "2.0"] for i in range(limit)],
+            }
+        if path == "/api/v3/ticker/24hr":
+            if "symbols" in query:
+                return [{"symbol": symbol, "volume": "1234.5"} for symbol in json.loads(query["symbols"])]
+            return {"symbol": query["symbol"], "volume": "1234.5"}
+        if path == "/api/v3/ping":
+            return {}
+        return None
+
+
+@pytest.fixture
+def binance_server():
+    mock = MockBinanceServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+            body = mock.handle(parsed.path, query)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mock.base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v3"
+    yield mock
+    server.shutdown()
+    server.server_close()
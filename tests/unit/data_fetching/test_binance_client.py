@@ -0,0 +1,97 @@
+import time
+from unittest.mock import patch
+from data_fetching.binance_client import BinanceClient
+from services.gpt_analysis_service import GPTAnalysisService
+from database.migrate import apply_migrations
+from utils.candle_store import CandleStore
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "XRPUSDT", "ADAUSDT", "SOLUSDT", "DOTUSDT", "DOGEUSDT"]
+
+def test_fetch_historical_data_from_mock_server(binance_server):
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url)
+    df = client.fetch_historical_data("BTCUSDT", limit=20)
+    assert len(df) == 20
+    assert df["close"].dtype == float
+    assert binance_server.requests[0] == ("/api/v3/klines", {"symbol": "BTCUSDT", "interval": "15m", "limit": "20"})
+
+def test_fetch_records_stage_timings(binance_server):
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url)
+    client.fetch_order_book("BTCUSDT")
+    client.fetch_volume("BTCUSDT")
+    summary = client.timings.summary()
+    assert summary["/depth"]["count"] == 1
+    assert summary["/ticker/24hr"]["count"] == 1
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {})
+def test_analyze_symbols_runs_concurrently(binance_server):
+    binance_server.delay = 0.05
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url, max_workers=4)
+    service = GPTAnalysisService(api_key="test", max_workers=4)
+
+    started = time.perf_counter()
+    result = service.analyze_symbols(SYMBOLS, client, {})
+    elapsed = time.perf_counter() - started
+
+    assert [data["symbol"] for data in result] == SYMBOLS
+    assert 1 < binance_server.max_active <= 4
+    # Sequential execution would need at least 8 symbols * 4 requests * 50ms
+    assert elapsed < len(SYMBOLS) * 4 * binance_server.delay
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {})
+def test_request_cache_removes_duplicate_round_trips(binance_server):
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url)
+    service = GPTAnalysisService(api_key="test")
+    service.analyze_symbols(SYMBOLS[:2], client, {})
+    for symbol in SYMBOLS[:2]:
+        client.fetch_historical_data(symbol, interval="15m", limit=50)
+
+    # One klines download and one depth snapshot per symbol
+    assert binance_server.count("/api/v3/klines") == 2
+    assert binance_server.count("/api/v3/depth") == 2
+    assert client.cache_stats()["hits"] == 4
+
+def test_request_cache_can_be_disabled(binance_server):
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url, cache_ttl=0)
+    client.fetch_order_book("BTCUSDT")
+    client.fetch_liquidity("BTCUSDT")
+    assert binance_server.count("/api/v3/depth") == 2
+
+def test_fetch_volumes_uses_one_request_per_batch(binance_server):
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url)
+    volumes = client.fetch_volumes(SYMBOLS, batch_size=5)
+    assert volumes == {symbol: 1234.5 for symbol in SYMBOLS}
+    assert binance_server.count("/api/v3/ticker/24hr") == 2
+    assert binance_server.requests[0][1]["symbols"] == '["BTCUSDT","ETHUSDT","BNBUSDT","XRPUSDT","ADAUSDT"]'
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {})
+def test_analyze_symbols_uses_bulk_volumes(binance_server):
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url)
+    result = GPTAnalysisService(api_key="test").analyze_symbols(SYMBOLS, client, {})
+    assert all(data["volume"] == 1234.5 for data in result)
+    assert binance_server.count("/api/v3/ticker/24hr") == 1
+
+def test_candle_store_downloads_only_missing_range(binance_server, tmp_path):
+    step = 900_000
+    start = 1_700_000_000_000
+    binance_server.set_klines("BTCUSDT", 100, start_ms=start, step_ms=step)
+    db_path = str(tmp_path / "candles.db")
+    apply_migrations(db_path)
+    store = CandleStore(db_path)
+    client = BinanceClient("key", "secret", base_url=binance_server.base_url, cache_ttl=0, candle_store=store)
+
+    with patch("data_fetching.binance_client.time.time") as mock_time:
+        binance_server.now_ms = start + 60 * step + 1
+        mock_time.return_value = binance_server.now_ms / 1000
+        first = client.fetch_historical_data("BTCUSDT", limit=50)
+
+        binance_server.now_ms = start + 62 * step + 1
+        mock_time.return_value = binance_server.now_ms / 1000
+        second = client.fetch_historical_data("BTCUSDT", limit=50)
+
+    assert "startTime" not in binance_server.requests[0][1]
+    assert binance_server.requests[1][1]["startTime"] == str(start + 59 * step)
+    assert len(first) == len(second) == 50
+    expected_open_times = [start + i * step for i in range(13, 63)]
+    assert [int(ts.timestamp() * 1000) for ts in second["open_time"]] == expected_open_times
+    assert store.last_open_time("BTCUSDT", "15m") == start + 61 * step
+    store.close()
@@ -0,0 +1,35 @@
+import pytest
+import numpy as np
+from data_fetching.kline_parser import KLINE_COLUMNS, parse_klines, parse_kline_arrays
+
+@pytest.fixture
+def raw_klines():
+    return [
+        [1700000000000, "100.5", "101.0", "99.5", "100.8", "12.5", 1700000899999, "1250.0", 7, "6.0", "600.0", "0"],
+        [1700000900000, "100.8", "102.0", "100.1", "101.7", "8.25", 1700001799999, "830.0", 4, "3.0", "300.0", "0"],
+    ]
+
+def test_parse_klines_returns_typed_default_columns(raw_klines):
+    df = parse_klines(raw_klines)
+    assert list(df.columns) == ["open_time", "open", "high", "low", "close", "volume", "close_time"]
+    assert df["open_time"].dtype == "datetime64[ns]"
+    assert df["close_time"].dtype == "datetime64[ns]"
+    assert df["close"].dtype == np.float64
+    assert df["close"].tolist() == [100.8, 101.7]
+    assert str(df["open_time"].iloc[1]) == "2023-11-14 22:28:20"
+
+def test_parse_kline_arrays_projection(raw_klines):
+    arrays = parse_kline_arrays(raw_klines, columns=("close", "number_of_trades"))
+    assert set(arrays) == {"close", "number_of_trades"}
+    assert arrays["number_of_trades"].dtype == np.int64
+    assert arrays["number_of_trades"].tolist() == [7, 4]
+
+def test_parse_klines_all_columns(raw_klines):
+    columns = [column for column in KLINE_COLUMNS if column != "ignore"]
+    df = parse_klines(raw_klines, columns=columns)
+    assert list(df.columns) == columns
+    assert df["taker_buy_quote_asset_volume"].tolist() == [600.0, 300.0]
+
+def test_parse_klines_rejects_unknown_columns(raw_klines):
+    with pytest.raises(ValueError, match="Unsupported kline column"):
+        parse_kline_arrays(raw_klines, columns=("close", "ignore"))
@@ -0,0 +1,93 @@
+import threading
+import time
+from unittest.mock import MagicMock
+from data_fetching.request_cache import RequestCache
+
+def test_duplicate_requests_are_served_from_cache():
+    cache = RequestCache(ttl=60)
+    fetch = MagicMock(return_value={"volume": "1"})
+
+    first = cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+    second = cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+
+    assert first == second == {"volume": "1"}
+    fetch.assert_called_once()
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+def test_different_params_are_separate_entries():
+    cache = RequestCache(ttl=60)
+    fetch = MagicMock(return_value={"volume": "1"})
+    cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+    cache.get_or_fetch("/ticker/24hr", {"symbol": "ETHUSDT"}, fetch)
+    assert fetch.call_count == 2
+
+def test_deeper_order_book_answers_shallower_query():
+    cache = RequestCache(ttl=60)
+    book = {"bids": [[str(100 - i), "1"] for i in range(10)], "asks": [[str(101 + i), "1"] for i in range(10)]}
+    cache.get_or_fetch("/depth", {"symbol": "BTCUSDT", "limit": 10}, lambda: book)
+
+    fetch = MagicMock()
+    shallow = cache.get_or_fetch("/depth", {"symbol": "BTCUSDT", "limit": 5}, fetch)
+
+    fetch.assert_not_called()
+    assert shallow["bids"] == book["bids"][:5]
+    assert shallow["asks"] == book["asks"][:5]
+
+def test_shallower_book_does_not_answer_deeper_query():
+    cache = RequestCache(ttl=60)
+    cache.get_or_fetch("/depth", {"symbol": "BTCUSDT", "limit": 5}, lambda: {"bids": [], "asks": []})
+    fetch = MagicMock(return_value={"bids": [], "asks": []})
+    cache.get_or_fetch("/depth", {"symbol": "BTCUSDT", "limit": 10}, fetch)
+    fetch.assert_called_once()
+
+def test_longer_klines_window_answers_shorter_one():
+    cache = RequestCache(ttl=60)
+    klines = [[i] for i in range(50)]
+    cache.get_or_fetch("/klines", {"symbol": "BTCUSDT", "interval": "15m", "limit": 50}, lambda: klines)
+    result = cache.get_or_fetch("/klines", {"symbol": "BTCUSDT", "interval": "15m", "limit": 30}, MagicMock())
+    assert result == klines[-30:]
+
+def test_klines_from_start_time_keep_the_first_candles():
+    cache = RequestCache(ttl=60)
+    klines = [[i] for i in range(50)]
+    params = {"symbol": "BTCUSDT", "interval": "15m", "startTime": 1700000000000}
+    cache.get_or_fetch("/klines", {**params, "limit": 50}, lambda: klines)
+    result = cache.get_or_fetch("/klines", {**params, "limit": 30}, MagicMock())
+    assert result == klines[:30]
+
+def test_expired_entries_are_refetched():
+    cache = RequestCache(ttl=0.01)
+    fetch = MagicMock(return_value={"volume": "1"})
+    cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+    time.sleep(0.02)
+    cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+    assert fetch.call_count == 2
+
+def test_failed_fetches_are_not_cached():
+    cache = RequestCache(ttl=60)
+    fetch = MagicMock(return_value=None)
+    cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+    cache.get_or_fetch("/ticker/24hr", {"symbol": "BTCUSDT"}, fetch)
+    assert fetch.call_count == 2
+
+def test_concurrent_duplicates_are_coalesced():
+    cache = RequestCache(ttl=60)
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"volume": "1"}
+
+    threads = [
+        threading.Thread(target=cache.get_or_fetch, args=("/ticker/24hr", {"symbol": "BTCUSDT"}, slow_fetch))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 4
@@ -0,0 +1,71 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+
+class FakeTelegramServer:
+    def __init__(self):
+        self.calls = []
+        self.retry_after = {}
+        self.failures = {}
+        self._lock = threading.Lock()
+        self._message_id = 0
+
+    def methods(self):
+        return [method for method, _ in self.calls if method != "getMe"]
+
+    def rate_limit(self, method, times, retry_after=1):
+        self.retry_after[method] = (times, retry_after)
+
+    def fail(self, method, times, description="Bad Request: wrong file"):
+        self.failures[method] = (times, description)
+
+    def handle(self, method, body):
+        with self._lock:
+            self.calls.append((method, body))
+            if self.retry_after.get(method, (0,))[0] > 0:
+                times, retry_after = self.retry_after[method]
+                self.retry_after[method] = (times - 1, retry_after)
+                return 429, {
+                    "ok": False, "error_code": 429, "description": f"Too Many Requests: retry after {retry_after}",
+                    "parameters": {"retry_after": retry_after},
+                }
+            if self.failures.get(method, (0,))[0] > 0:
+                times, description = self.failures[method]
+                self.failures[method] = (times - 1, description)
+                return 400, {"ok": False, "error_code": 400, "description": description}
+            if method == "getMe":
+                return 200, {"ok": True, "result": {"id": 1, "is_bot": True, "first_name": "Fake", "username": "fake_bot"}}
+            self._message_id += 1
+            message = {"message_id": self._message_id, "date": 0, "chat": {"id": 1, "type": "private"}}
+            if method == "sendMediaGroup":
+                return 200, {"ok": True, "result": [message]}
+            return 200, {"ok": True, "result": message}
+
+
+@pytest.fixture
+def telegram_server():
+    fake = FakeTelegramServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            status, payload = fake.handle(self.path.rsplit("/", 1)[-1], body)
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fake.base_url = f"http://127.0.0.1:{server.server_address[1]}/bot"
+    yield fake
+    server.shutdown()
+    server.server_close()
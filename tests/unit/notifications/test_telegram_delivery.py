@@ -0,0 +1,167 @@
+import asyncio
+import time
+import pytest
+from telegram import Bot
+from notifications.telegram_delivery import TelegramDeliveryQueue, TokenBucket
+
+
+def _bot(server):
+    return Bot(token="123:TEST", base_url=server.base_url)
+
+
+@pytest.fixture
+def chart_file(tmp_path):
+    path = tmp_path / "BTCUSDT.png"
+    path.write_bytes(b"\x89PNG fake image")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_acquisitions():
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_delivery_reuses_one_bot_and_keeps_order(telegram_server, chart_file):
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100) as delivery:
+        for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+            delivery.submit(symbol, f"{symbol} analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 3, "failed": 0}
+    assert telegram_server.methods() == ["sendPhoto"] * 3
+    captions = [body for method, body in telegram_server.calls if method == "sendPhoto"]
+    assert b"BTCUSDT analysis" in captions[0] and b"SOLUSDT analysis" in captions[2]
+    # A single getMe from initialize(): the bot and its HTTP client are shared by every send
+    assert [method for method, _ in telegram_server.calls].count("getMe") == 1
+
+
+@pytest.mark.asyncio
+async def test_delivery_retries_after_rate_limit(telegram_server, chart_file):
+    telegram_server.rate_limit("sendPhoto", times=1, retry_after=1)
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100) as delivery:
+        delivery.submit("BTCUSDT", "BTCUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 1, "failed": 0}
+    # Retried the photo instead of degrading to a text message
+    assert telegram_server.methods() == ["sendPhoto", "sendPhoto"]
+
+
+@pytest.mark.asyncio
+async def test_delivery_falls_back_to_text(telegram_server, chart_file):
+    telegram_server.fail("sendPhoto", times=1)
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100) as delivery:
+        delivery.submit("BTCUSDT", "BTCUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 1, "failed": 0}
+    assert telegram_server.methods() == ["sendPhoto", "sendMessage"]
+
+
+def test_split_text_prefers_word_boundaries():
+    from notifications.telegram_notifications import split_text
+
+    assert split_text("short", 1024) == ("short", "")
+    head, rest = split_text("word " * 300, 1024)
+    assert len(head) <= 1024 and head.endswith("word") and rest.startswith("word")
+    assert (head + " " + rest).split() == ["word"] * 300
+
+
+@pytest.mark.asyncio
+async def test_album_mode_batches_up_to_ten_photos(telegram_server, chart_file):
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100, mode="album") as delivery:
+        for i in range(12):
+            delivery.submit(f"SYM{i}USDT", f"SYM{i}USDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 12, "failed": 0}
+    assert telegram_server.methods() == ["sendMediaGroup", "sendMediaGroup"]
+    album = next(body for method, body in telegram_server.calls if method == "sendMediaGroup")
+    assert b"SYM0USDT analysis" in album and b"SYM9USDT analysis" in album and b"SYM10USDT" not in album
+
+
+@pytest.mark.asyncio
+async def test_album_mode_moves_long_captions_to_follow_up_text(telegram_server, chart_file):
+    long_message = "BTCUSDT - " + "detail " * 300
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100, mode="album") as delivery:
+        delivery.submit("BTCUSDT", long_message, chart_file)
+        delivery.submit("ETHUSDT", "ETHUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 2, "failed": 0}
+    assert telegram_server.methods() == ["sendMediaGroup", "sendMessage"]
+
+
+@pytest.mark.asyncio
+async def test_album_mode_falls_back_per_item(telegram_server, chart_file):
+    telegram_server.fail("sendMediaGroup", times=1)
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100, mode="album") as delivery:
+        delivery.submit("BTCUSDT", "BTCUSDT analysis", chart_file)
+        delivery.submit("ETHUSDT", "ETHUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 2, "failed": 0}
+    assert telegram_server.methods() == ["sendMediaGroup", "sendPhoto", "sendPhoto"]
+
+
+@pytest.mark.asyncio
+async def test_album_mode_retries_rate_limited_caption_continuation(telegram_server, chart_file):
+    telegram_server.rate_limit("sendMessage", times=1, retry_after=1)
+    long_message = "BTCUSDT - " + "detail " * 300
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100, mode="album") as delivery:
+        delivery.submit("BTCUSDT", long_message, chart_file)
+        delivery.submit("ETHUSDT", "ETHUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 2, "failed": 0}
+    # Only the continuation chunk is retried; the album is not sent twice
+    assert telegram_server.methods() == ["sendMediaGroup", "sendMessage", "sendMessage"]
+
+
+@pytest.mark.asyncio
+async def test_album_mode_reports_lost_caption_continuation(telegram_server, chart_file):
+    telegram_server.fail("sendMessage", times=1)
+    long_message = "BTCUSDT - " + "detail " * 300
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100, mode="album") as delivery:
+        delivery.submit("BTCUSDT", long_message, chart_file)
+        delivery.submit("ETHUSDT", "ETHUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 1, "failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_album_fallback_sends_wait_for_the_buckets(telegram_server, chart_file):
+    telegram_server.fail("sendMediaGroup", times=1)
+
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=100, mode="album") as delivery:
+        delivery.submit("BTCUSDT", "BTCUSDT analysis", chart_file)
+        delivery.submit("ETHUSDT", "ETHUSDT analysis", chart_file)
+        bucket = delivery._chat_buckets["42"]
+        acquisitions = []
+        acquire = bucket.acquire
+
+        async def counting_acquire():
+            acquisitions.append(bucket)
+            await acquire()
+
+        bucket.acquire = counting_acquire
+
+    assert telegram_server.methods() == ["sendMediaGroup", "sendPhoto", "sendPhoto"]
+    assert len(acquisitions) == 3
+
+
+@pytest.mark.asyncio
+async def test_album_mode_batches_messages_queued_during_the_chat_wait(telegram_server, chart_file):
+    async with TelegramDeliveryQueue(None, "42", bot=_bot(telegram_server), chat_rate=5, mode="album") as delivery:
+        delivery.submit("BTCUSDT", "BTCUSDT analysis", chart_file)
+        await delivery.join()
+        delivery.submit("ETHUSDT", "ETHUSDT analysis", chart_file)
+        await asyncio.sleep(0.05)
+        delivery.submit("SOLUSDT", "SOLUSDT analysis", chart_file)
+
+    assert delivery.stats() == {"sent": 3, "failed": 0}
+    assert telegram_server.methods() == ["sendPhoto", "sendMediaGroup"]
@@ -0,0 +1,62 @@
+import os
+import pandas as pd
+from unittest.mock import patch
+from services.chart_cache import ChartCache
+from services.chart_generator_service import ChartGeneratorService
+
+
+def _candles(last_close=108):
+    return pd.DataFrame({
+        "open_time": [1660000000000, 1660003600000, 1660007200000],
+        "open": [100, 102, 105],
+        "high": [105, 107, 110],
+        "low": [95, 100, 103],
+        "close": [103, 106, last_close],
+        "volume": [1000, 1200, 900],
+    })
+
+
+def test_key_depends_on_candles_and_style(tmp_path):
+    cache = ChartCache(output_dir=str(tmp_path))
+    key = cache.key("BTCUSDT", "1h", _candles(), projection_points=5)
+
+    assert key == cache.key("BTCUSDT", "1h", _candles(), projection_points=5)
+    assert key != cache.key("BTCUSDT", "1h", _candles(last_close=109), projection_points=5)
+    assert key != cache.key("BTCUSDT", "1h", _candles(), projection_points=10)
+    assert key != cache.key("ETHUSDT", "1h", _candles(), projection_points=5)
+    # Datetime and epoch-millisecond open times describe the same candles
+    as_datetime = _candles().assign(open_time=pd.to_datetime(_candles()["open_time"], unit="ms"))
+    assert key == cache.key("BTCUSDT", "1h", as_datetime, projection_points=5)
+
+
+def test_generate_single_chart_reuses_cached_render(tmp_path):
+    chart_generator = ChartGeneratorService(
+        output_dir=str(tmp_path), max_workers=1, chart_cache=ChartCache(output_dir=str(tmp_path))
+    )
+    first = chart_generator.generate_single_chart("BTCUSDT", _candles(), "1h")
+
+    with patch.object(chart_generator, "_render") as mock_render:
+        second = chart_generator.generate_single_chart("BTCUSDT", _candles(), "1h")
+    mock_render.assert_not_called()
+    assert second == first
+
+    # The index survives a restart
+    reloaded = ChartCache(output_dir=str(tmp_path))
+    assert reloaded.get(reloaded.key("BTCUSDT", "1h", _candles(), projection_points=5, render_mode="standard",
+                                     folder=os.path.basename(os.path.dirname(first)))) == first
+
+
+def test_eviction_by_size_and_age(tmp_path):
+    cache = ChartCache(output_dir=str(tmp_path), max_bytes=150)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(b"x" * 60)
+        paths.append(path)
+        cache.put(name, str(path))
+
+    assert cache.get("a") is None and not paths[0].exists()
+    assert cache.get("b") == str(paths[1]) and cache.get("c") == str(paths[2])
+
+    cache.max_age = -1
+    assert cache.get("c") is None
@@ -0,0 +1,21 @@
+import numpy as np
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from services.chart_template import draw_candles, draw_volume
+
+
+def test_draw_candles_uses_one_collection_per_layer():
+    ax_candles, ax_volume = Figure().subplots(2, 1)
+    x = np.arange(500, dtype=float)
+    open_ = np.where(x % 2 == 0, 100.0, 102.0)
+    close = np.where(x % 2 == 0, 102.0, 100.0)
+
+    wicks, bodies = draw_candles(ax_candles, x, open_, close + 1, open_ - 1, close, width=0.4)
+    bars = draw_volume(ax_volume, x, np.full(500, 10.0), open_, close, width=0.4)
+
+    assert len(ax_candles.collections) == 2 and not ax_candles.patches and not ax_candles.lines
+    assert len(wicks.get_segments()) == 500
+    assert len(bodies.get_paths()) == 500 and len(bars.get_paths()) == 500
+    np.testing.assert_allclose(bodies.get_facecolor()[0], to_rgba("lime", 0.9))
+    np.testing.assert_allclose(bars.get_facecolor()[1], to_rgba("red", 0.7))
+    assert ax_volume.get_ylim()[1] >= 10
@@ -1,6 +1,10 @@
+import time
+import asyncio
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from services.chart_generator_service import ChartGeneratorService
 
 @patch("services.chart_generator_service.plt.savefig")
@@ -31,5 +35,161 @@ def test_generate_single_chart_success(mock_makedirs, mock_savefig):
     assert result is not None
     assert symbol in result
 
+@patch("services.chart_generator_service.plt.savefig")
+@patch("services.chart_generator_service.os.makedirs")
+def test_generate_chart_from_source(mock_makedirs, mock_savefig):
+    candle_source = MagicMock()
+    candle_source.fetch_historical_data.return_value = pd.DataFrame({
+        "open_time": [1660000000000, 1660003600000, 1660007200000],
+        "open": [100, 102, 105],
+        "high": [105, 107, 110],
+        "low": [95, 100, 103],
+        "close": [103, 106, 108],
+        "volume": [1000, 1200, 900],
+    })
+
+    chart_generator = ChartGeneratorService(output_dir="test_charts")
+    result = chart_generator.generate_chart_from_source("BTCUSD", candle_source, "1h", limit=3)
+
+    candle_source.fetch_historical_data.assert_called_once_with("BTCUSD", interval="1h", limit=3)
+    mock_savefig.assert_called_once()
+    assert "BTCUSD" in result
+
+@pytest.mark.asyncio
+async def test_generate_charts_process_pool(tmp_path):
+    df = pd.DataFrame({
+        "open_time": [1660000000000, 1660003600000, 1660007200000],
+        "open": [100, 102, 105],
+        "high": [105, 107, 110],
+        "low": [95, 100, 103],
+        "close": [103, 106, 108],
+        "volume": [1000, 1200, 900],
+    })
+    currency_data = {"BTCUSDT": df, "ETHUSDT": df.copy(), "EMPTYUSDT": pd.DataFrame()}
+
+    chart_generator = ChartGeneratorService(output_dir=str(tmp_path), max_workers=2)
+    results = [result async for result in chart_generator.generate_charts(currency_data, "1h")]
+
+    assert sorted(symbol for symbol, _ in results) == ["BTCUSDT", "ETHUSDT"]
+    files = dict(results)
+    # Both charts of a batch share the same timestamp suffix
+    assert files["BTCUSDT"].replace("BTCUSDT", "") == files["ETHUSDT"].replace("ETHUSDT", "")
+    for chart_file in files.values():
+        assert chart_file.startswith(str(tmp_path))
+
+
+def test_generate_single_chart_template_mode_reuses_figure(tmp_path):
+    from services import chart_generator_service
+
+    df = pd.DataFrame({
+        "open_time": [1660000000000, 1660003600000, 1660007200000],
+        "open": [100, 102, 105],
+        "high": [105, 107, 110],
+        "low": [95, 100, 103],
+        "close": [103, 106, 108],
+        "volume": [1000, 1200, 900],
+    })
+    chart_generator = ChartGeneratorService(output_dir=str(tmp_path), max_workers=1, render_mode="template")
+
+    first = chart_generator.generate_single_chart("BTCUSDT", df.copy(), "1h")
+    template = chart_generator_service._get_chart_template()
+    second = chart_generator.generate_single_chart("ETHUSDT", df.copy(), "1h")
+
+    assert chart_generator_service._get_chart_template() is template
+    assert template.title.get_text().startswith("ETH / USDT")
+    for chart_file in (first, second):
+        assert chart_file is not None and (tmp_path / chart_file[len(str(tmp_path)) + 1:]).stat().st_size > 0
+
+
+def test_unknown_render_mode_rejected():
+    with pytest.raises(ValueError):
+        ChartGeneratorService(render_mode="svg")
+
+
+def _converts_candles(call):
+    value = call.args[0]
+    return hasattr(value, "dtype") and np.issubdtype(value.dtype, np.datetime64)
+
+
+@patch("services.chart_generator_service.plt.savefig")
+def test_time_axis_converted_once_without_mutating_input(mock_savefig, tmp_path):
+    import matplotlib.dates as mdates
+    from services.chart_generator_service import time_axis
+
+    df = pd.DataFrame({
+        "open_time": pd.to_datetime([1660000000000, 1660003600000, 1660007200000], unit="ms"),
+        "open": [100, 102, 105],
+        "high": [105, 107, 110],
+        "low": [95, 100, 103],
+        "close": [103, 106, 108],
+        "volume": [1000, 1200, 900],
+    })
+    original = df.copy()
+    chart_generator = ChartGeneratorService(output_dir=str(tmp_path), max_workers=1)
+
+    with patch("services.chart_generator_service.mdates.date2num", wraps=mdates.date2num) as mock_date2num:
+        assert chart_generator.generate_single_chart("BTCUSD", df, "1h") is not None
+    # Matplotlib's own locators also call date2num; only conversions of our candles are counted
+    candle_calls = [c for c in mock_date2num.call_args_list if _converts_candles(c)]
+    # A single vectorized call for the whole column, never one per candle
+    assert len(candle_calls) == 1 and len(candle_calls[0].args[0]) == len(df)
+    assert not any(isinstance(c.args[0], pd.Timestamp) for c in mock_date2num.call_args_list)
+    pd.testing.assert_frame_equal(df, original)
+
+    precomputed = time_axis(df["open_time"])
+    with patch("services.chart_generator_service.mdates.date2num", wraps=mdates.date2num) as mock_date2num:
+        chart_generator.generate_single_chart("BTCUSD", df, "1h", time_axis=precomputed)
+    assert not any(_converts_candles(c) for c in mock_date2num.call_args_list)
+
+@pytest.mark.asyncio
+async def test_generate_charts_logs_failed_worker_symbol(tmp_path):
+    df = pd.DataFrame({
+        "open_time": [1660000000000, 1660003600000, 1660007200000],
+        "open": [100, 102, 105],
+        "high": [105, 107, 110],
+        "low": [95, 100, 103],
+        "close": [103, 106, 108],
+        "volume": [1000, 1200, 900],
+    })
+
+    def render_or_fail(output_dir, symbol, *args):
+        if symbol == "ETHUSDT":
+            raise RuntimeError("worker died")
+        return symbol, f"{output_dir}/{symbol}.png"
+
+    chart_generator = ChartGeneratorService(output_dir=str(tmp_path), max_workers=2)
+    with patch("services.chart_generator_service.ProcessPoolExecutor", ThreadPoolExecutor), \
+            patch("services.chart_generator_service._render_chart", side_effect=render_or_fail), \
+            patch("services.chart_generator_service.logger.error") as mock_error:
+        results = [result async for result in chart_generator.generate_charts({"BTCUSDT": df, "ETHUSDT": df}, "1h")]
+
+    assert results == [("BTCUSDT", f"{tmp_path}/BTCUSDT.png")]
+    mock_error.assert_called_once()
+    assert "ETHUSDT" in mock_error.call_args.args[0]
+
+@pytest.mark.asyncio
+async def test_generate_charts_serial_path_lets_other_tasks_run(tmp_path):
+    df = pd.DataFrame({"open_time": [1660000000000], "open": [1], "high": [1], "low": [1], "close": [1], "volume": [1]})
+    events = []
+
+    def slow_render(symbol, *args):
+        time.sleep(0.1)
+        events.append(f"rendered {symbol}")
+        return f"{tmp_path}/{symbol}.png"
+
+    async def deliver(symbol):
+        events.append(f"delivered {symbol}")
+
+    chart_generator = ChartGeneratorService(output_dir=str(tmp_path), max_workers=1)
+    deliveries = []
+    with patch.object(chart_generator, "_render", side_effect=slow_render):
+        async for symbol, _ in chart_generator.generate_charts({"BTCUSDT": df, "ETHUSDT": df, "SOLUSDT": df}, "1h"):
+            deliveries.append(asyncio.create_task(deliver(symbol)))
+        await asyncio.gather(*deliveries)
+
+    # Each chart is delivered while the next one is still rendering
+    assert events.index("delivered BTCUSDT") < events.index("rendered ETHUSDT")
+    assert events.index("delivered ETHUSDT") < events.index("rendered SOLUSDT")
+
 if __name__ == "__main__":
-    pytest.main()
\ No newline at end of file
+    pytest.main()
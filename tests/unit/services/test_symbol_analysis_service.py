@@ -2,31 +2,18 @@ import pytest
 import pandas as pd
 from unittest.mock import MagicMock, patch
 from services.symbol_analysis_service import SymbolAnalysisService
+from analysis.technical_indicators import IndicatorEngine
 from data_fetching.binance_client import BinanceClient
 from data_fetching.coingecko_client import CoinGeckoClient
 
 @patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {"BTCUSDT": "bitcoin"})
-@patch("services.symbol_analysis_service.calculate_rsi")
-@patch("services.symbol_analysis_service.calculate_macd")
-@patch("services.symbol_analysis_service.calculate_bollinger_bands")
-@patch("services.symbol_analysis_service.calculate_vwap")
-@patch("services.symbol_analysis_service.calculate_atr")
-@patch("services.symbol_analysis_service.calculate_obv")
-@patch("services.symbol_analysis_service.calculate_stochastic_oscillator")
-@patch("services.symbol_analysis_service.calculate_adx")
+@patch("services.symbol_analysis_service.IndicatorEngine")
 @patch("services.symbol_analysis_service.calculate_bid_ask_spread")
 @patch("services.symbol_analysis_service.calculate_order_book_imbalance")
 def test_analyze_symbol_success(
     mock_order_book_imbalance,
     mock_bid_ask_spread,
-    mock_adx,
-    mock_stochastic,
-    mock_obv,
-    mock_atr,
-    mock_vwap,
-    mock_bollinger_bands,
-    mock_macd,
-    mock_rsi
+    mock_indicator_engine
 ):
     mock_binance_client = MagicMock(spec=BinanceClient)
     historical_data = pd.DataFrame({
@@ -43,14 +30,18 @@ def test_analyze_symbol_success(
 
     coingecko_data = {"bitcoin": {"usd": 45000, "usd_market_cap": 800_000_000}}
 
-    mock_rsi.return_value = pd.Series([30, 40])
-    mock_macd.return_value = (pd.Series([1, 2]), pd.Series([1.5, 2.5]))
-    mock_bollinger_bands.return_value = (pd.Series([110, 120]), pd.Series([90, 100]))
-    mock_vwap.return_value = pd.Series([102, 105])
-    mock_atr.return_value = pd.Series([10, 12])
-    mock_obv.return_value = pd.Series([1000, 1200])
-    mock_stochastic.return_value = pd.Series([50, 60])
-    mock_adx.return_value = pd.Series([25, 30])
+    mock_indicator_engine.return_value.compute.return_value = pd.DataFrame({
+        "rsi": [30, 40],
+        "macd": [1, 2],
+        "signal": [1.5, 2.5],
+        "bollinger_upper": [110, 120],
+        "bollinger_lower": [90, 100],
+        "vwap": [102, 105],
+        "atr": [10, 12],
+        "obv": [1000, 1200],
+        "stochastic": [50, 60],
+        "adx": [25, 30],
+    })
     mock_bid_ask_spread.return_value = 2
     mock_order_book_imbalance.return_value = 0.6
 
@@ -94,4 +85,91 @@ def test_analyze_symbol_exception():
 
     service = SymbolAnalysisService(mock_binance_client, {})
     with pytest.raises(RuntimeError, match="Error analyzing symbol BTCUSDT: Some error"):
-        service.analyze_symbol("BTCUSDT")
\ No newline at end of file
+        service.analyze_symbol("BTCUSDT")
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {"BTCUSDT": "bitcoin"})
+def test_analyze_symbol_uses_prefetched_volume():
+    mock_binance_client = MagicMock(spec=BinanceClient)
+    mock_binance_client.fetch_historical_data.return_value = pd.DataFrame({
+        "open": [100.0, 102.0],
+        "high": [105.0, 110.0],
+        "low": [95.0, 100.0],
+        "close": [103.0, 106.0],
+        "volume": [1000.0, 2000.0]
+    })
+    mock_binance_client.fetch_order_book.return_value = {"bids": [["100", "1"]], "asks": [["102", "1"]]}
+    mock_binance_client.fetch_volumes.return_value = {"BTCUSDT": 4321.0}
+
+    service = SymbolAnalysisService(mock_binance_client, {})
+    service.prefetch(["BTCUSDT"])
+    result = service.analyze_symbol("BTCUSDT")
+
+    assert result["volume"] == 4321.0
+    mock_binance_client.fetch_volumes.assert_called_once_with(["BTCUSDT"])
+    mock_binance_client.fetch_volume.assert_not_called()
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {})
+def test_analyze_symbol_reads_candles_from_candle_source():
+    mock_binance_client = MagicMock(spec=BinanceClient)
+    mock_binance_client.fetch_order_book.return_value = {"bids": [["100", "1"]], "asks": [["102", "1"]]}
+    mock_binance_client.fetch_volume.return_value = 1000
+    candle_source = MagicMock()
+    candle_source.fetch_historical_data.return_value = pd.DataFrame({
+        "open": [100.0, 102.0],
+        "high": [105.0, 110.0],
+        "low": [95.0, 100.0],
+        "close": [103.0, 106.0],
+        "volume": [1000.0, 2000.0]
+    })
+
+    service = SymbolAnalysisService(mock_binance_client, {}, candle_source=candle_source)
+    result = service.analyze_symbol("BTCUSDT")
+
+    assert result["price"] == 106.0
+    candle_source.fetch_historical_data.assert_called_once_with("BTCUSDT")
+    mock_binance_client.fetch_historical_data.assert_not_called()
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {})
+def test_prefetch_computes_indicators_for_all_symbols_at_once():
+    frames = {
+        symbol: pd.DataFrame({
+            "open": [100.0 + i, 102.0, 101.0, 104.0],
+            "high": [105.0, 110.0 + i, 106.0, 108.0],
+            "low": [95.0, 100.0, 97.0 - i, 99.0],
+            "close": [103.0, 106.0, 102.0 + i, 107.0],
+            "volume": [1000.0, 2000.0, 1500.0, 1200.0 + i],
+        })
+        for i, symbol in enumerate(["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+    }
+    mock_binance_client = MagicMock(spec=BinanceClient)
+    mock_binance_client.fetch_order_book.return_value = {"bids": [["100", "1"]], "asks": [["102", "1"]]}
+    mock_binance_client.fetch_volumes.return_value = {}
+    mock_binance_client.fetch_volume.return_value = 1000
+    candle_source = MagicMock()
+    candle_source.fetch_historical_data.side_effect = lambda symbol: frames[symbol]
+
+    service = SymbolAnalysisService(mock_binance_client, {}, candle_source=candle_source, max_workers=2)
+    service.prefetch(list(frames))
+    with patch.object(service.indicator_engine, "compute") as mock_compute:
+        results = [service.analyze_symbol(symbol) for symbol in frames]
+
+    mock_compute.assert_not_called()
+    assert candle_source.fetch_historical_data.call_count == 3
+    for result in results:
+        expected = IndicatorEngine().compute(frames[result["symbol"]]).iloc[-1]
+        for column in ("rsi", "macd", "signal", "vwap", "obv"):
+            assert result[column] == pytest.approx(expected[column])
+
+@patch("services.symbol_analysis_service.BINANCE_TO_COINGECKO_SYMBOLS", {})
+def test_prefetch_falls_back_when_a_history_fails():
+    mock_binance_client = MagicMock(spec=BinanceClient)
+    mock_binance_client.fetch_volumes.return_value = {}
+    candle_source = MagicMock()
+    candle_source.fetch_historical_data.side_effect = Exception("Some error")
+
+    service = SymbolAnalysisService(mock_binance_client, {}, candle_source=candle_source)
+    service.prefetch(["BTCUSDT"])
+
+    assert service.histories == {}
+    with pytest.raises(RuntimeError, match="Error analyzing symbol BTCUSDT: Some error"):
+        service.analyze_symbol("BTCUSDT")
@@ -0,0 +1,197 @@
+import json
+import sqlite3
+import threading
+from email import policy
+from email.parser import BytesParser
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from database.migrate import apply_migrations
+from services import upload_to_supabase_service as upload_service
+
+
+class StubStorage:
+    def __init__(self):
+        self.uploads = []
+        self.objects = {}
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def paths(self):
+        return [path for path, _ in self.uploads]
+
+
+def _uploaded_file(content_type, body):
+    message = BytesParser(policy=policy.default).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+    )
+    return next(part.get_content() for part in message.iter_parts() if part.get_filename())
+
+
+@pytest.fixture
+def storage_server(monkeypatch):
+    stub = StubStorage()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            path = self.path.split("/object/charts/", 1)[-1]
+            with stub._lock:
+                stub.uploads.append((path, body))
+                failed = stub.failures > 0
+                if failed:
+                    stub.failures -= 1
+                else:
+                    stub.objects[path] = _uploaded_file(self.headers["Content-Type"], body)
+            data = json.dumps({"message": "boom"} if failed else {"Key": f"charts/{path}"}).encode("utf-8")
+            self.send_response(500 if failed else 200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(upload_service, "SUPABASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(upload_service, "SERVICE_KEY", "service-key")
+    monkeypatch.delenv("SQLITE3_DATABASE_FILE", raising=False)
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    apply_migrations(db_path)
+    today = datetime.now(upload_service.TZ).strftime("%Y-%m-%d")
+    chart_dir = tmp_path / "charts" / today
+    chart_dir.mkdir(parents=True)
+
+    def add(symbol, timestamp=None, img=None):
+        if img is None:
+            img = chart_dir / f"{symbol}.png"
+            img.write_bytes(f"png-{symbol}".encode("utf-8"))
+        conn = sqlite3.connect(db_path)
+        with conn:
+            if timestamp:
+                conn.execute("INSERT INTO history (symbol, analysis, img, timestamp) VALUES (?, ?, ?, ?)",
+                             (symbol, f"{symbol} analysis", str(img), timestamp))
+            else:
+                conn.execute("INSERT INTO history (symbol, analysis, img) VALUES (?, ?, ?)",
+                             (symbol, f"{symbol} analysis", str(img)))
+        conn.close()
+        return str(img)
+
+    add.db_path = db_path
+    add.today = today
+    return add
+
+
+def test_uploads_today_then_skips_on_rerun(storage_server, history_db):
+    history_db("BTCUSDT")
+    history_db("ETHUSDT")
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=2)).strftime("%Y-%m-%d %H:%M:%S")
+    history_db("OLDUSDT", timestamp=yesterday)
+
+    upload_service.sync_to_supabase(db_path=history_db.db_path, max_workers=4)
+
+    today = history_db.today
+    assert sorted(storage_server.paths()) == sorted(
+        [f"{today}/BTCUSDT.png", f"{today}/ETHUSDT.png", f"{today}/history.json"]
+    )
+    manifest = json.loads(storage_server.objects[f"{today}/history.json"])
+    assert [entry["symbol"] for entry in manifest] == ["BTCUSDT", "ETHUSDT"]
+
+    storage_server.uploads.clear()
+    history_db("SOLUSDT")
+    upload_service.sync_to_supabase(db_path=history_db.db_path, max_workers=4)
+
+    # Only the new chart and the manifest go out on the second run
+    assert sorted(storage_server.paths()) == [f"{today}/SOLUSDT.png", f"{today}/history.json"]
+    manifest = json.loads(storage_server.objects[f"{today}/history.json"])
+    assert [entry["symbol"] for entry in manifest] == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+
+def test_shared_chart_uploaded_once(storage_server, history_db):
+    img = history_db("BTCUSDT")
+    history_db("BTCUSDT", img=img)
+
+    upload_service.sync_to_supabase(db_path=history_db.db_path)
+
+    assert storage_server.paths().count(f"{history_db.today}/BTCUSDT.png") == 1
+    conn = sqlite3.connect(history_db.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM upload_ledger").fetchone()[0] == 2
+    conn.close()
+
+
+def test_failed_upload_is_retried_on_next_run(storage_server, history_db, monkeypatch):
+    monkeypatch.setattr(upload_service.time, "sleep", lambda seconds: None)
+    history_db("BTCUSDT")
+    storage_server.failures = 3
+
+    upload_service.sync_to_supabase(db_path=history_db.db_path)
+    conn = sqlite3.connect(history_db.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM upload_ledger").fetchone()[0] == 0
+
+    upload_service.sync_to_supabase(db_path=history_db.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM upload_ledger").fetchone()[0] == 1
+    conn.close()
+
+
+def test_sharded_manifest_uploads_only_the_delta(storage_server, history_db):
+    history_db("BTCUSDT")
+    history_db("ETHUSDT")
+    upload_service.sync_to_supabase(db_path=history_db.db_path, manifest_mode="sharded")
+
+    today = history_db.today
+    index = json.loads(storage_server.objects[f"{today}/manifest/index.json"])
+    assert index["total"] == 2 and len(index["shards"]) == 1
+    first_shard = json.loads(storage_server.objects[index["shards"][0]["path"]])
+    assert [entry["symbol"] for entry in first_shard] == ["BTCUSDT", "ETHUSDT"]
+    assert f"{today}/history.json" not in storage_server.objects
+
+    history_db("SOLUSDT")
+    upload_service.sync_to_supabase(db_path=history_db.db_path, manifest_mode="sharded")
+
+    index = json.loads(storage_server.objects[f"{today}/manifest/index.json"])
+    assert index["total"] == 3 and [shard["entries"] for shard in index["shards"]] == [2, 1]
+    second_shard = json.loads(storage_server.objects[index["shards"][1]["path"]])
+    assert [entry["symbol"] for entry in second_shard] == ["SOLUSDT"]
+
+    # Nothing new: neither a shard nor the index is uploaded again
+    storage_server.uploads.clear()
+    upload_service.sync_to_supabase(db_path=history_db.db_path, manifest_mode="sharded")
+    assert storage_server.paths() == []
+
+
+def test_sharded_manifest_republishes_index_after_failed_upload(storage_server, history_db, monkeypatch):
+    history_db("BTCUSDT")
+    upload_json = upload_service._upload_json
+    failed = []
+
+    def fail_index_once(storage_from, rel_path, payload):
+        if rel_path.endswith("/index.json") and not failed:
+            failed.append(rel_path)
+            return False
+        return upload_json(storage_from, rel_path, payload)
+
+    monkeypatch.setattr(upload_service, "_upload_json", fail_index_once)
+    upload_service.sync_to_supabase(db_path=history_db.db_path, manifest_mode="sharded")
+
+    today = history_db.today
+    assert failed and f"{today}/manifest/index.json" not in storage_server.objects
+    conn = sqlite3.connect(history_db.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM manifest_entries").fetchone()[0] == 0
+
+    upload_service.sync_to_supabase(db_path=history_db.db_path, manifest_mode="sharded")
+
+    index = json.loads(storage_server.objects[f"{today}/manifest/index.json"])
+    assert index["total"] == 1 and len(index["shards"]) == 1
+    shard = json.loads(storage_server.objects[index["shards"][0]["path"]])
+    assert [entry["symbol"] for entry in shard] == ["BTCUSDT"]
+    assert conn.execute("SELECT COUNT(*) FROM manifest_entries").fetchone()[0] == 1
+    conn.close()
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+import pandas as pd
+from analysis.technical_indicators import (
+    IndicatorEngine,
+    calculate_rsi,
+    calculate_macd,
+    calculate_stochastic_oscillator,
+    calculate_vwap,
+    calculate_obv,
+    calculate_bollinger_bands,
+    calculate_atr,
+    calculate_adx,
+)
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, 60))
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.3, 60),
+        "high": close + rng.random(60) + 0.5,
+        "low": close - rng.random(60) - 0.5,
+        "close": close,
+        "volume": rng.random(60) * 1000,
+    })
+
+def test_engine_matches_individual_indicator_functions(sample_data):
+    result = IndicatorEngine().compute(sample_data)
+    macd, signal = calculate_macd(sample_data)
+    upper_band, lower_band = calculate_bollinger_bands(sample_data)
+    expected = {
+        "rsi": calculate_rsi(sample_data),
+        "macd": macd,
+        "signal": signal,
+        "bollinger_upper": upper_band,
+        "bollinger_lower": lower_band,
+        "vwap": calculate_vwap(sample_data),
+        "atr": calculate_atr(sample_data),
+        "obv": calculate_obv(sample_data),
+        "stochastic": calculate_stochastic_oscillator(sample_data),
+        "adx": calculate_adx(sample_data),
+    }
+    assert list(result.columns) == list(expected)
+    for column, series in expected.items():
+        np.testing.assert_array_equal(result[column].to_numpy(), series.to_numpy(), err_msg=column)
+
+def test_engine_shares_true_range_between_atr_and_adx():
+    plan = IndicatorEngine(indicators=("atr", "adx")).plan
+    assert plan.count("true_range") == 1
+    assert plan.count("mean:true_range:14") == 1
+    assert plan.index("true_range") < plan.index("mean:true_range:14") < plan.index("dx")
+
+def test_engine_computes_only_requested_indicators(sample_data):
+    engine = IndicatorEngine(indicators=("rsi", "vwap"), rsi_period=7)
+    result = engine.compute(sample_data)
+    assert list(result.columns) == ["rsi", "vwap"]
+    assert "true_range" not in engine.plan
+    np.testing.assert_array_equal(result["rsi"].to_numpy(), calculate_rsi(sample_data, period=7).to_numpy())
+
+def test_engine_keeps_input_index(sample_data):
+    sample_data.index = sample_data.index + 100
+    result = IndicatorEngine().compute(sample_data)
+    assert result.index.equals(sample_data.index)
+
+def test_engine_rejects_unknown_indicators_and_params():
+    with pytest.raises(ValueError, match="Unknown indicators"):
+        IndicatorEngine(indicators=("rsi", "ichimoku"))
+    with pytest.raises(ValueError, match="Unknown indicator parameters"):
+        IndicatorEngine(rsi_window=7)
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+import pandas as pd
+from analysis.technical_indicators import (
+    kernels,
+    IndicatorEngine,
+    calculate_rsi,
+    calculate_macd,
+    calculate_stochastic_oscillator,
+    calculate_obv,
+    calculate_bollinger_bands,
+    calculate_atr,
+    calculate_adx,
+)
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(0, 1, 80))
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.3, 80),
+        "high": close + rng.random(80) + 0.5,
+        "low": close - rng.random(80) - 0.5,
+        "close": close,
+        "volume": rng.random(80) * 1000,
+    })
+
+@pytest.fixture
+def values_with_gaps():
+    rng = np.random.default_rng(3)
+    values = 50 + np.cumsum(rng.normal(0, 1, 60))
+    values[[0, 7, 8, 9, 30]] = np.nan
+    return values
+
+def both_backends(monkeypatch, func, *args, **kwargs):
+    monkeypatch.setattr(kernels, "USE_KERNELS", False)
+    expected = func(*args, **kwargs)
+    monkeypatch.setattr(kernels, "USE_KERNELS", True)
+    return expected, func(*args, **kwargs)
+
+def assert_series_close(expected, actual):
+    assert list(actual.index) == list(expected.index)
+    assert np.allclose(actual.to_numpy(dtype=float), expected.to_numpy(dtype=float), equal_nan=True)
+
+@pytest.mark.parametrize("window, min_periods", [(3, None), (5, 1), (5, 3), (100, 1)])
+def test_rolling_kernels_match_pandas(values_with_gaps, window, min_periods):
+    rolling = pd.Series(values_with_gaps).rolling(window=window, min_periods=min_periods)
+    assert np.allclose(kernels.rolling_mean(values_with_gaps, window, min_periods), rolling.mean(), equal_nan=True)
+    assert np.allclose(kernels.rolling_std(values_with_gaps, window, min_periods), rolling.std(), equal_nan=True)
+    assert np.allclose(kernels.rolling_min(values_with_gaps, window, min_periods), rolling.min(), equal_nan=True)
+    assert np.allclose(kernels.rolling_max(values_with_gaps, window, min_periods), rolling.max(), equal_nan=True)
+
+@pytest.mark.parametrize("span", [1, 9, 26])
+def test_ema_kernel_matches_pandas(values_with_gaps, span):
+    expected = pd.Series(values_with_gaps).ewm(span=span, adjust=False).mean()
+    assert np.allclose(kernels.ema(values_with_gaps, span), expected, equal_nan=True)
+
+def test_kernels_handle_empty_input():
+    empty = np.array([])
+    for kernel in (kernels.rolling_mean, kernels.rolling_std, kernels.rolling_min, kernels.rolling_max, kernels.ema):
+        assert len(kernel(empty, 3)) == 0
+    assert len(kernels.obv(empty, empty)) == 0
+
+@pytest.mark.parametrize("func", [
+    calculate_rsi, calculate_stochastic_oscillator, calculate_obv, calculate_atr, calculate_adx,
+])
+def test_single_output_indicators_agree_across_backends(monkeypatch, sample_data, func):
+    expected, actual = both_backends(monkeypatch, func, sample_data)
+    assert_series_close(expected, actual)
+
+@pytest.mark.parametrize("func", [calculate_macd, calculate_bollinger_bands])
+def test_paired_indicators_agree_across_backends(monkeypatch, sample_data, func):
+    expected, actual = both_backends(monkeypatch, func, sample_data)
+    for expected_series, actual_series in zip(expected, actual):
+        assert_series_close(expected_series, actual_series)
+
+def test_indicator_engine_agrees_across_backends(monkeypatch, sample_data):
+    expected, actual = both_backends(monkeypatch, IndicatorEngine().compute, sample_data)
+    for column in expected:
+        assert_series_close(expected[column], actual[column])
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+import pandas as pd
+from analysis.technical_indicators import IndicatorEngine, compute_panel, stack_frames
+from analysis.technical_indicators.panel import rolling_mean
+
+def make_frame(rows, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.3, rows),
+        "high": close + rng.random(rows) + 0.5,
+        "low": close - rng.random(rows) - 0.5,
+        "close": close,
+        "volume": rng.random(rows) * 1000,
+    })
+
+@pytest.mark.parametrize("rows", [1, 10, 60])
+def test_panel_matches_indicator_engine(rows):
+    frames = [make_frame(rows, seed) for seed in range(4)]
+    panel = compute_panel(stack_frames(frames))
+    engine = IndicatorEngine()
+
+    for row, frame in enumerate(frames):
+        expected = engine.compute(frame)
+        for column in engine.columns:
+            assert np.allclose(panel[column][row], expected[column].to_numpy(dtype=float), equal_nan=True), column
+
+def test_panel_respects_custom_periods():
+    frames = [make_frame(40, seed) for seed in range(2)]
+    params = {"rsi_period": 5, "bollinger_window": 10, "stochastic_period": 7, "macd_signal_period": 4}
+    panel = compute_panel(stack_frames(frames), indicators=("rsi", "bollinger", "stochastic", "macd"), **params)
+    expected = IndicatorEngine(indicators=("rsi", "bollinger", "stochastic", "macd"), **params).compute(frames[1])
+
+    assert list(panel) == list(expected.columns)
+    for column in expected:
+        assert np.allclose(panel[column][1], expected[column].to_numpy(dtype=float), equal_nan=True)
+
+def test_rolling_mean_skips_nan_like_pandas():
+    values = np.array([[1.0, np.nan, 3.0, 4.0, np.nan, 6.0]])
+    expected = pd.Series(values[0]).rolling(window=3, min_periods=2).mean().to_numpy()
+    assert np.allclose(rolling_mean(values, 3, min_periods=2)[0], expected, equal_nan=True)
+
+def test_stack_frames_rejects_different_lengths():
+    with pytest.raises(ValueError, match="same length"):
+        stack_frames([make_frame(10, 0), make_frame(12, 1)])
+
+def test_compute_panel_rejects_unknown_indicator():
+    with pytest.raises(ValueError, match="Unknown indicators"):
+        compute_panel(stack_frames([make_frame(10, 0)]), indicators=("rsi", "foo"))
@@ -0,0 +1,113 @@
+import pytest
+import numpy as np
+import pandas as pd
+from analysis.technical_indicators import (
+    kernels,
+    MultiPeriodExtremum,
+    StreamingPriceExtremes,
+    rolling_extrema,
+    rolling_price_extremes,
+    calculate_stochastic_oscillator,
+    calculate_stochastic_oscillator_multi,
+    calculate_williams_r,
+    calculate_williams_r_multi,
+    calculate_donchian_channels,
+    calculate_donchian_channels_multi,
+)
+
+PERIODS = (1, 3, 14, 50)
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(5)
+    values = 100 + np.cumsum(rng.normal(0, 1, 120))
+    values[40:45] = values[39]
+    values[[10, 70, 71]] = np.nan
+    return values
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(9)
+    close = 100 + np.cumsum(rng.normal(0, 1, 120))
+    return pd.DataFrame({
+        "high": close + rng.random(120) + 0.5,
+        "low": close - rng.random(120) - 0.5,
+        "close": close,
+    })
+
+@pytest.mark.parametrize("use_kernels", [False, True])
+@pytest.mark.parametrize("mode", ["min", "max"])
+def test_rolling_extrema_matches_pandas_for_every_period(monkeypatch, values, use_kernels, mode):
+    monkeypatch.setattr(kernels, "USE_KERNELS", use_kernels)
+    result = rolling_extrema(values, PERIODS + (500,), mode)
+    assert sorted(result) == sorted(PERIODS + (500,))
+    for period, extrema in result.items():
+        expected = getattr(pd.Series(values).rolling(window=period), mode)()
+        np.testing.assert_array_equal(extrema, expected.to_numpy(), err_msg=str(period))
+
+def test_rolling_extrema_rejects_invalid_periods(values):
+    with pytest.raises(ValueError, match="positive integers"):
+        rolling_extrema(values, [0, 14])
+    with pytest.raises(ValueError, match="Unknown extremum mode"):
+        rolling_extrema(values, [14], "median")
+
+@pytest.mark.parametrize("mode", ["min", "max"])
+def test_multi_period_extremum_streams_every_period(values, mode):
+    extremum = MultiPeriodExtremum(PERIODS, mode)
+    streamed = {period: [] for period in PERIODS}
+    for value in values:
+        extremum.push(value)
+        for period, latest in extremum.values().items():
+            streamed[period].append(latest)
+
+    for period in PERIODS:
+        expected = getattr(pd.Series(values).rolling(window=period), mode)()
+        np.testing.assert_array_equal(streamed[period], expected.to_numpy(), err_msg=str(period))
+
+def test_multi_period_extremum_respects_min_periods():
+    extremum = MultiPeriodExtremum((3,), "max", min_periods=1)
+    values = [2.0, np.nan, 1.0, np.nan, np.nan, np.nan]
+    results = []
+    for value in values:
+        extremum.push(value)
+        results.append(extremum.value(3))
+    expected = pd.Series(values).rolling(window=3, min_periods=1).max()
+    np.testing.assert_array_equal(results, expected.to_numpy())
+
+def test_multi_period_features_match_single_period_functions(sample_data):
+    periods = (14, 50)
+    extremes = rolling_price_extremes(sample_data, periods)
+    stochastic = calculate_stochastic_oscillator_multi(sample_data, periods, extremes=extremes)
+    williams_r = calculate_williams_r_multi(sample_data, periods, extremes=extremes)
+    donchian = calculate_donchian_channels_multi(sample_data, periods, extremes=extremes)
+
+    for period in periods:
+        lows = sample_data["low"].rolling(window=period).min()
+        highs = sample_data["high"].rolling(window=period).max()
+        expected_williams = (highs - sample_data["close"]) / (highs - lows) * -100
+        pd.testing.assert_series_equal(
+            stochastic[f"stochastic_{period}"], calculate_stochastic_oscillator(sample_data, period), check_names=False
+        )
+        pd.testing.assert_series_equal(williams_r[f"williams_r_{period}"], expected_williams, check_names=False)
+        pd.testing.assert_series_equal(
+            calculate_williams_r(sample_data, period), expected_williams, check_names=False
+        )
+        upper, lower = calculate_donchian_channels(sample_data, period)
+        pd.testing.assert_series_equal(upper, highs, check_names=False)
+        pd.testing.assert_series_equal(donchian[f"donchian_lower_{period}"], lows, check_names=False)
+
+def test_streaming_price_extremes_match_batch(sample_data):
+    periods = (3, 14)
+    streaming = StreamingPriceExtremes(periods)
+    result = pd.DataFrame([streaming.update(candle) for candle in sample_data.to_dict("records")])
+    expected = pd.concat([
+        calculate_stochastic_oscillator_multi(sample_data, periods),
+        calculate_williams_r_multi(sample_data, periods),
+        calculate_donchian_channels_multi(sample_data, periods),
+    ], axis=1)
+    for column in expected:
+        np.testing.assert_allclose(result[column], expected[column], equal_nan=True, err_msg=column)
+
+def test_multi_period_features_log_missing_columns():
+    assert calculate_williams_r(pd.DataFrame({"close": [1.0]})) is None
+    assert calculate_donchian_channels(pd.DataFrame({"close": [1.0]})) == (None, None)
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+import pandas as pd
+from analysis.technical_indicators import IndicatorEngine, StreamingIndicators
+from analysis.technical_indicators.streaming_indicators import RollingWindow, RollingExtremum, StreamingOBV
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(0, 1, 300))
+    close[150:160] = close[150]
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.3, 300),
+        "high": close + rng.random(300) + 0.5,
+        "low": close - rng.random(300) - 0.5,
+        "close": close,
+        "volume": rng.random(300) * 1000,
+    })
+
+def test_streaming_matches_batch_indicators(sample_data):
+    expected = IndicatorEngine().compute(sample_data)
+    streaming = StreamingIndicators()
+    result = pd.DataFrame([streaming.update(candle) for candle in sample_data.to_dict("records")])
+    for column in expected.columns:
+        np.testing.assert_allclose(
+            result[column].to_numpy(), expected[column].to_numpy(),
+            rtol=1e-8, atol=1e-8, equal_nan=True, err_msg=column
+        )
+
+def test_warm_up_then_update_matches_batch(sample_data):
+    streaming = StreamingIndicators()
+    streaming.warm_up(sample_data.iloc[:-1])
+    latest = streaming.update(sample_data.iloc[-1])
+    expected = IndicatorEngine().compute(sample_data).iloc[-1]
+    for column, value in latest.items():
+        assert value == pytest.approx(expected[column], rel=1e-8), column
+
+def test_rolling_window_mean_and_std():
+    window = RollingWindow(3)
+    for value in [1.0, 2.0]:
+        window.push(value)
+    assert np.isnan(window.mean())
+    window.push(3.0)
+    window.push(10.0)
+    assert window.mean() == pytest.approx(5.0)
+    assert window.std() == pytest.approx(pd.Series([2.0, 3.0, 10.0]).std())
+
+def test_rolling_extremum_tracks_window():
+    lows = RollingExtremum(3, "min")
+    highs = RollingExtremum(3, "max")
+    values = [5.0, 3.0, 4.0, 6.0, 7.0, 1.0]
+    result_min, result_max = [], []
+    for value in values:
+        lows.push(value)
+        highs.push(value)
+        result_min.append(lows.value())
+        result_max.append(highs.value())
+    np.testing.assert_array_equal(result_min, [np.nan, np.nan, 3.0, 3.0, 4.0, 1.0])
+    np.testing.assert_array_equal(result_max, [np.nan, np.nan, 5.0, 6.0, 7.0, 7.0])
+
+def test_streaming_obv():
+    obv = StreamingOBV()
+    results = [obv.update({"close": close, "volume": volume}) for close, volume in [(10, 100), (11, 150), (11, 200), (9, 250)]]
+    assert results == [0.0, 150.0, 150.0, -100.0]
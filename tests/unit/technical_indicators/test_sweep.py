@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+import pandas as pd
+from analysis.technical_indicators import (
+    kernels,
+    calculate_rsi,
+    calculate_atr,
+    calculate_adx,
+    calculate_bollinger_bands,
+    calculate_rsi_multi,
+    calculate_atr_multi,
+    calculate_adx_multi,
+    calculate_bollinger_bands_multi,
+)
+
+PERIODS = [1, 2, 5, 14, 30, 200]
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(21)
+    close = 60000 + np.cumsum(rng.normal(0, 50, 150))
+    close[60:64] = close[59]
+    return pd.DataFrame({
+        "high": close + rng.random(150) * 40 + 5,
+        "low": close - rng.random(150) * 40 - 5,
+        "close": close,
+    }, index=pd.RangeIndex(100, 250))
+
+def assert_matches(expected, actual):
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+def test_rsi_sweep_matches_single_period_calls(sample_data):
+    result = calculate_rsi_multi(sample_data, PERIODS)
+    assert list(result.columns) == [f"rsi_{period}" for period in PERIODS]
+    assert result.index.equals(sample_data.index)
+    for period in PERIODS:
+        assert_matches(calculate_rsi(sample_data, period), result[f"rsi_{period}"])
+
+def test_atr_sweep_matches_single_period_calls(sample_data):
+    result = calculate_atr_multi(sample_data, PERIODS)
+    for period in PERIODS:
+        assert_matches(calculate_atr(sample_data, period), result[f"atr_{period}"])
+
+def test_adx_sweep_matches_single_period_calls(sample_data):
+    result = calculate_adx_multi(sample_data, PERIODS)
+    for period in PERIODS:
+        assert_matches(calculate_adx(sample_data, period), result[f"adx_{period}"])
+
+@pytest.mark.parametrize("use_kernels", [False, True])
+def test_bollinger_sweep_matches_single_window_calls(monkeypatch, sample_data, use_kernels):
+    monkeypatch.setattr(kernels, "USE_KERNELS", use_kernels)
+    windows = [2, 20, 50]
+    result = calculate_bollinger_bands_multi(sample_data, windows)
+    for window in windows:
+        monkeypatch.setattr(kernels, "USE_KERNELS", False)
+        upper, lower = calculate_bollinger_bands(sample_data, window)
+        assert_matches(upper, result[f"bollinger_upper_{window}"])
+        assert_matches(lower, result[f"bollinger_lower_{window}"])
+
+def test_sweep_handles_nan_closes(sample_data):
+    sample_data.iloc[[10, 11, 90], sample_data.columns.get_loc("close")] = np.nan
+    result = calculate_rsi_multi(sample_data, [3, 14])
+    for period in (3, 14):
+        assert_matches(calculate_rsi(sample_data, period), result[f"rsi_{period}"])
+
+def test_sweep_rejects_invalid_periods(sample_data):
+    assert calculate_rsi_multi(sample_data, [0, 14]) is None
+    assert calculate_atr_multi(sample_data, []) is None
@@ -22,6 +22,20 @@ def test_calculate_obv(sample_data):
     assert obv is not None, "OBV should not be None"
     assert len(obv) == len(sample_data), "OBV length should match data length"
 
+def test_calculate_obv_values():
+    data = pd.DataFrame({
+        "close": [10, 11, 11, 9, 12],
+        "volume": [100, 150, 200, 250, 300]
+    })
+    obv = calculate_obv(data)
+    assert obv.tolist() == [0, 150, 150, -100, 200]
+
+def test_calculate_obv_keeps_non_range_index():
+    data = pd.DataFrame({"close": [10.0, 9.0, 12.0], "volume": [1.0, 2.0, 3.0]}, index=[30, 31, 32])
+    obv = calculate_obv(data)
+    assert obv.index.tolist() == [30, 31, 32]
+    assert obv.tolist() == [0.0, -2.0, 1.0]
+
 def test_calculate_order_book_imbalance(sample_order_book):
     imbalance = calculate_order_book_imbalance(sample_order_book)
     assert imbalance is not None, "Order book imbalance should not be None"
@@ -0,0 +1,109 @@
+import os
+import pytest
+import numpy as np
+import pandas as pd
+from utils.candle_archive import CandleArchive, export_store_to_archive
+
+def make_frame(start, periods, freq="6h", offset=0.0):
+    open_time = pd.date_range(start, periods=periods, freq=freq)
+    close = np.arange(periods, dtype=float) + 100 + offset
+    return pd.DataFrame({
+        "open_time": open_time,
+        "open": close - 1,
+        "high": close + 1,
+        "low": close - 2,
+        "close": close,
+        "volume": np.full(periods, 10.0),
+        "close_time": open_time + pd.Timedelta(freq) - pd.Timedelta("1ms"),
+    })
+
+@pytest.fixture
+def archive(tmp_path):
+    return CandleArchive(root=str(tmp_path / "archive"))
+
+def test_write_partitions_by_day(archive):
+    assert archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 8)) == 8
+    assert archive.days("BTCUSDT", "6h") == ["2024-01-01", "2024-01-02"]
+
+def test_read_arrays_is_memory_mapped_and_projected(archive):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 4))
+    arrays = archive.read_arrays("BTCUSDT", "6h", columns=["open_time", "close"])
+    assert set(arrays) == {"open_time", "close"}
+    assert isinstance(arrays["close"], np.memmap)
+    assert arrays["close"].dtype == np.float64
+    assert arrays["open_time"].dtype == np.int64
+    np.testing.assert_array_equal(arrays["close"], [100.0, 101.0, 102.0, 103.0])
+
+def test_read_arrays_filters_time_range_across_days(archive):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 12))
+    arrays = archive.read_arrays("BTCUSDT", "6h", start="2024-01-01 18:00", end="2024-01-03", columns=["close"])
+    np.testing.assert_array_equal(arrays["close"], [103.0, 104.0, 105.0, 106.0, 107.0])
+
+def test_rewriting_overlapping_candles_replaces_them(archive):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 4))
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01 12:00", 2, offset=50.0))
+    frame = archive.read_frame("BTCUSDT", "6h")
+    assert frame["close"].tolist() == [100.0, 101.0, 150.0, 151.0]
+    assert frame["open_time"].dtype == "datetime64[ns]"
+
+def test_write_rejects_partial_columns_for_existing_partition(archive):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 4))
+    partial = make_frame("2024-01-01 12:00", 4, offset=50.0)[["open_time", "close"]]
+
+    with pytest.raises(ValueError, match="Cannot merge columns"):
+        archive.write("BTCUSDT", "6h", partial)
+
+    # Nothing was written, not even the new day the partial frame reaches
+    assert archive.days("BTCUSDT", "6h") == ["2024-01-01"]
+    frame = archive.read_frame("BTCUSDT", "6h")
+    assert frame["close"].tolist() == [100.0, 101.0, 102.0, 103.0]
+
+def test_interrupted_write_keeps_the_previous_partition(archive, monkeypatch):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 4))
+    save = np.save
+    saved = []
+
+    def crash_after_two_columns(path, values):
+        if len(saved) == 2:
+            raise OSError("disk full")
+        saved.append(path)
+        save(path, values)
+
+    monkeypatch.setattr(np, "save", crash_after_two_columns)
+    with pytest.raises(OSError):
+        archive.write("BTCUSDT", "6h", make_frame("2024-01-01 12:00", 2, offset=50.0))
+    monkeypatch.setattr(np, "save", save)
+
+    frame = archive.read_frame("BTCUSDT", "6h")
+    assert frame["close"].tolist() == [100.0, 101.0, 102.0, 103.0]
+    assert archive.write("BTCUSDT", "6h", make_frame("2024-01-01 12:00", 2, offset=50.0)) == 4
+    assert archive.read_frame("BTCUSDT", "6h")["close"].tolist() == [100.0, 101.0, 150.0, 151.0]
+
+def test_partition_swapped_out_by_an_interrupted_write_is_still_read(archive):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 4))
+    # The state a crash between the two renames of a rewrite leaves behind
+    path = archive._partition_dir("BTCUSDT", "6h", "2024-01-01")
+    os.rename(path, archive._partition_dir("BTCUSDT", "6h", ".2024-01-01.old"))
+
+    assert archive.days("BTCUSDT", "6h") == ["2024-01-01"]
+    assert archive.read_frame("BTCUSDT", "6h")["close"].tolist() == [100.0, 101.0, 102.0, 103.0]
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-02", 1))
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01 18:00", 1, offset=50.0))
+    assert sorted(os.listdir(os.path.dirname(path))) == ["2024-01-01", "2024-01-02"]
+    assert archive.read_frame("BTCUSDT", "6h")["close"].tolist() == [100.0, 101.0, 102.0, 150.0, 100.0]
+
+def test_fetch_historical_data_returns_latest_window(archive):
+    archive.write("BTCUSDT", "6h", make_frame("2024-01-01", 12))
+    frame = archive.fetch_historical_data("BTCUSDT", interval="6h", limit=5)
+    assert frame["close"].tolist() == [107.0, 108.0, 109.0, 110.0, 111.0]
+    assert archive.fetch_historical_data("ETHUSDT", interval="6h") is None
+
+def test_export_store_to_archive(archive):
+    class FakeStore:
+        def load(self, symbol, interval, limit):
+            return [[0, 1.0, 2.0, 0.5, 1.5, 10.0, 899_999, 15.0, 3, 5.0, 7.5, "0"]] if symbol == "BTCUSDT" else []
+
+    assert export_store_to_archive(FakeStore(), archive, ["BTCUSDT", "ETHUSDT"], "15m") == 1
+    arrays = archive.read_arrays("BTCUSDT", "15m")
+    assert arrays["number_of_trades"].tolist() == [3]
+    assert arrays["close"].tolist() == [1.5]
@@ -0,0 +1,36 @@
+import pytest
+from database.migrate import apply_migrations
+from utils.candle_store import CandleStore
+
+def make_kline(open_time, close="101.0"):
+    return [open_time, "100.0", "102.0", "99.0", close, "10.0", open_time + 899_999, "1000.0", 5, "5.0", "500.0", "0"]
+
+@pytest.fixture
+def store(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    apply_migrations(db_path)
+    with CandleStore(db_path) as candle_store:
+        yield candle_store
+
+def test_upsert_and_load_round_trip(store):
+    klines = [make_kline(i * 900_000) for i in range(5)]
+    assert store.upsert("BTCUSDT", "15m", klines) == 5
+
+    loaded = store.load("BTCUSDT", "15m", 3)
+    assert [row[0] for row in loaded] == [2 * 900_000, 3 * 900_000, 4 * 900_000]
+    assert loaded[0][4] == 101.0
+    assert len(loaded[0]) == 12
+
+def test_upsert_replaces_existing_candle(store):
+    store.upsert("BTCUSDT", "15m", [make_kline(0, close="101.0")])
+    store.upsert("BTCUSDT", "15m", [make_kline(0, close="105.0")])
+    loaded = store.load("BTCUSDT", "15m", 10)
+    assert len(loaded) == 1
+    assert loaded[0][4] == 105.0
+
+def test_last_open_time_and_count_are_scoped_by_symbol_and_interval(store):
+    store.upsert("BTCUSDT", "15m", [make_kline(i * 900_000) for i in range(4)])
+    store.upsert("ETHUSDT", "15m", [make_kline(10 * 900_000)])
+    assert store.last_open_time("BTCUSDT", "15m") == 3 * 900_000
+    assert store.last_open_time("BTCUSDT", "1h") is None
+    assert store.count_between("BTCUSDT", "15m", 900_000, 3 * 900_000) == 2
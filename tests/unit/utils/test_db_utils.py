@@ -36,4 +36,77 @@ def test_insert_into_history(temp_db, mocker):
     assert row is not None, "Row should not be None"
     assert row[1] == symbol, "Symbol should match"
     assert row[2] == analysis, "Analysis should match"
-    assert row[3] == img, "Image should match"
\ No newline at end of file
+    assert row[3] == img, "Image should match"
+
+@pytest.fixture
+def migrated_db(tmp_path):
+    from database.migrate import apply_migrations
+
+    db_path = str(tmp_path / "history.db")
+    apply_migrations(db_path)
+    return db_path
+
+
+def test_history_repository_batches_writes(migrated_db):
+    from utils.db_utils import HistoryRepository
+
+    repository = HistoryRepository(migrated_db)
+    repository.add("BTCUSDT", "BTC analysis", "btc.png")
+    repository.add("ETHUSDT", "ETH analysis", "eth.png")
+    assert repository.fetch() == []
+
+    assert repository.flush() == 2
+    rows = repository.fetch(symbol="ETHUSDT")
+    assert [(row[1], row[2], row[3]) for row in rows] == [("ETHUSDT", "ETH analysis", "eth.png")]
+    assert repository._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    repository.close()
+
+
+def test_history_repository_date_filter_uses_index(migrated_db):
+    from utils.db_utils import HistoryRepository
+
+    with HistoryRepository(migrated_db) as repository:
+        repository._conn.executemany(
+            "INSERT INTO history (symbol, analysis, img, timestamp) VALUES (?, ?, ?, ?)",
+            [("BTCUSDT", "a", "a.png", "2024-01-01 10:00:00"), ("BTCUSDT", "b", "b.png", "2024-01-02 10:00:00"),
+             ("ETHUSDT", "c", "c.png", "2024-01-02 11:00:00")],
+        )
+        rows = repository.fetch(symbol="BTCUSDT", since="2024-01-02 00:00:00")
+        assert [row[2] for row in rows] == ["b"]
+        assert [row[2] for row in repository.fetch(since="2024-01-02 00:00:00")] == ["b", "c"]
+
+        plan = repository._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM history WHERE symbol = ? AND timestamp >= ?", ("BTCUSDT", "2024")
+        ).fetchall()
+        assert any("idx_history_symbol_timestamp" in row[-1] for row in plan)
+
+
+def test_indicator_snapshots_bulk_insert_and_query(migrated_db):
+    from utils.db_utils import IndicatorSnapshotRepository
+
+    repository = IndicatorSnapshotRepository(migrated_db)
+    first_run = [
+        {"symbol": "BTCUSDT", "price": 100.0, "rsi": 25.0, "adx": 30.0, "coingecko_price": "N/A", "liquidity": None},
+        {"symbol": "ETHUSDT", "price": 10.0, "rsi": 55.0, "adx": 20.0},
+    ]
+    assert repository.insert_many(first_run, run_at="2024-01-01 00:00:00") == 2
+    assert repository.insert_many([{"symbol": "ETHUSDT", "rsi": 28.0}], run_at="2024-01-08 00:00:00") == 1
+
+    oversold = repository.find("rsi", below=30, since="2024-01-02 00:00:00")
+    assert [(row["symbol"], row["rsi"]) for row in oversold] == [("ETHUSDT", 28.0)]
+    btc = repository.find("rsi", below=30, symbol="BTCUSDT")[0]
+    assert btc["coingecko_price"] is None and btc["liquidity"] is None and btc["adx"] == 30.0
+
+    with pytest.raises(ValueError):
+        repository.find("rsi; DROP TABLE history", below=30)
+    repository.close()
+
+
+def test_indicator_snapshots_closed_when_insert_raises(migrated_db):
+    from utils.db_utils import IndicatorSnapshotRepository
+
+    with pytest.raises(KeyError):
+        with IndicatorSnapshotRepository(migrated_db) as repository:
+            repository.insert_many([{"price": 100.0}])
+    with pytest.raises(sqlite3.ProgrammingError):
+        repository.find("rsi")
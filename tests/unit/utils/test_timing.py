@@ -0,0 +1,19 @@
+from utils.timing import StageTimer
+
+def test_stage_timer_accumulates_per_stage():
+    timer = StageTimer()
+    with timer.measure("klines"):
+        pass
+    timer.record("klines", 0.5)
+    timer.record("depth", 0.25)
+
+    summary = timer.summary()
+    assert summary["klines"]["count"] == 2
+    assert summary["klines"]["total"] >= 0.5
+    assert summary["depth"] == {"count": 1, "total": 0.25, "avg": 0.25}
+
+def test_stage_timer_reset():
+    timer = StageTimer()
+    timer.record("klines", 1.0)
+    timer.reset()
+    assert timer.summary() == {}
@@ -0,0 +1,208 @@
+import os
+import shutil
+import argparse
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+from config.settings import CANDLE_ARCHIVE_DIR
+import logging
+
+logger = logging.getLogger()
+
+MS_PER_DAY = 86_400_000
+
+ARCHIVE_COLUMNS = {
+    "open_time": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+    "close_time": np.int64,
+    "quote_asset_volume": np.float64,
+    "number_of_trades": np.int64,
+}
+
+
+def _to_epoch_ms(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ms]").astype(np.int64)
+    return values.astype(np.int64)
+
+
+class CandleArchive:
+    def __init__(self, root=CANDLE_ARCHIVE_DIR):
+        self.root = root
+
+    def _partition_dir(self, symbol, interval, day):
+        return os.path.join(self.root, symbol, interval, day)
+
+    def _partition_path(self, symbol, interval, day):
+        # A write interrupted between its two renames leaves only the previous partition, kept as .<day>.old
+        path = self._partition_dir(symbol, interval, day)
+        previous = self._partition_dir(symbol, interval, f".{day}.old")
+        return previous if not os.path.isdir(path) and os.path.isdir(previous) else path
+
+    def days(self, symbol, interval):
+        base = os.path.join(self.root, symbol, interval)
+        if not os.path.isdir(base):
+            return []
+        days = set()
+        for name in os.listdir(base):
+            if not os.path.isdir(os.path.join(base, name)) or name.endswith(".tmp"):
+                continue
+            days.add(name[1:-len(".old")] if name.startswith(".") else name)
+        return sorted(days)
+
+    def _stored_columns(self, path):
+        return [column for column in ARCHIVE_COLUMNS if os.path.exists(os.path.join(path, f"{column}.npy"))]
+
+    def _load_partition(self, path, columns, mmap_mode="r"):
+        return {column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode=mmap_mode) for column in columns}
+
+    def write(self, symbol, interval, data):
+        if data is None or len(data["open_time"]) == 0:
+            return 0
+
+        columns = [column for column in ARCHIVE_COLUMNS if column in data]
+        arrays = {column: np.asarray(data[column]) for column in columns}
+        for column in ("open_time", "close_time"):
+            if column in arrays:
+                arrays[column] = _to_epoch_ms(arrays[column])
+
+        day_index = arrays["open_time"] // MS_PER_DAY
+        days = {
+            day_number: datetime.fromtimestamp(int(day_number) * 86_400, tz=timezone.utc).strftime("%Y-%m-%d")
+            for day_number in np.unique(day_index)
+        }
+        # Every column file of a partition must keep the same row count, so a merge needs the stored columns
+        for day in days.values():
+            path = self._partition_path(symbol, interval, day)
+            if os.path.exists(os.path.join(path, "open_time.npy")) and self._stored_columns(path) != columns:
+                raise ValueError(
+                    f"Cannot merge columns {columns} into {symbol} {interval} {day}, "
+                    f"which stores {self._stored_columns(path)}"
+                )
+
+        written = 0
+        for day_number, day in days.items():
+            mask = day_index == day_number
+            written += self._write_partition(symbol, interval, day, {column: arrays[column][mask] for column in columns})
+        return written
+
+    def _write_partition(self, symbol, interval, day, arrays):
+        path = self._partition_dir(symbol, interval, day)
+        staging = self._partition_dir(symbol, interval, f".{day}.tmp")
+        previous = self._partition_dir(symbol, interval, f".{day}.old")
+        if os.path.isdir(previous):
+            # Left by an interrupted write; it is still the partition unless the new one was already swapped in
+            if os.path.isdir(path):
+                shutil.rmtree(previous)
+            else:
+                os.rename(previous, path)
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        if os.path.exists(os.path.join(path, "open_time.npy")):
+            existing = self._load_partition(path, arrays.keys(), mmap_mode=None)
+            arrays = {column: np.concatenate([existing[column], arrays[column]]) for column in arrays}
+
+        # Keep the most recently written row for each open_time, in time order
+        reversed_times = arrays["open_time"][::-1]
+        _, first_seen = np.unique(reversed_times, return_index=True)
+        keep = len(reversed_times) - 1 - first_seen
+
+        # All columns are written to a staging directory that replaces the partition as a whole,
+        # so a crash never leaves column files with different row counts
+        for column, values in arrays.items():
+            values = np.ascontiguousarray(values[keep], dtype=ARCHIVE_COLUMNS[column])
+            np.save(os.path.join(staging, f"{column}.npy"), values)
+        if os.path.isdir(path):
+            os.rename(path, previous)
+            os.rename(staging, path)
+            shutil.rmtree(previous)
+        else:
+            os.rename(staging, path)
+        return len(keep)
+
+    def read_arrays(self, symbol, interval, start=None, end=None, columns=None):
+        start_ms = int(pd.Timestamp(start).value // 1_000_000) if start is not None else None
+        end_ms = int(pd.Timestamp(end).value // 1_000_000) if end is not None else None
+
+        parts = []
+        for day in self.days(symbol, interval):
+            day_start = int(pd.Timestamp(day).value // 1_000_000)
+            if start_ms is not None and day_start + MS_PER_DAY <= start_ms:
+                continue
+            if end_ms is not None and day_start >= end_ms:
+                continue
+
+            path = self._partition_path(symbol, interval, day)
+            if columns is None:
+                columns = self._stored_columns(path)
+            open_time = np.load(os.path.join(path, "open_time.npy"), mmap_mode="r")
+            lo = np.searchsorted(open_time, start_ms, side="left") if start_ms is not None else 0
+            hi = np.searchsorted(open_time, end_ms, side="left") if end_ms is not None else len(open_time)
+            partition = self._load_partition(path, columns)
+            parts.append({column: values[lo:hi] for column, values in partition.items()})
+
+        if not parts:
+            return {column: np.empty(0, dtype=ARCHIVE_COLUMNS[column]) for column in (columns or ARCHIVE_COLUMNS)}
+        if len(parts) == 1:
+            # Single partition: the arrays are memory-mapped views, no data is copied
+            return parts[0]
+        return {column: np.concatenate([part[column] for part in parts]) for column in columns}
+
+    def read_frame(self, symbol, interval, start=None, end=None, columns=None):
+        arrays = self.read_arrays(symbol, interval, start=start, end=end, columns=columns)
+        frame = pd.DataFrame(arrays, copy=False)
+        for column in ("open_time", "close_time"):
+            if column in frame:
+                frame[column] = pd.to_datetime(frame[column], unit="ms")
+        return frame
+
+    def fetch_historical_data(self, symbol, interval="15m", limit=50):
+        days, collected = self.days(symbol, interval), 0
+        needed = []
+        for day in reversed(days):
+            needed.append(day)
+            collected += len(np.load(os.path.join(self._partition_path(symbol, interval, day), "open_time.npy"), mmap_mode="r"))
+            if collected >= limit:
+                break
+        if not needed:
+            logger.warning(f"No archived candles for {symbol} ({interval}).")
+            return None
+
+        frame = self.read_frame(symbol, interval, start=pd.Timestamp(min(needed)))
+        return frame.tail(limit).reset_index(drop=True)
+
+
+def export_store_to_archive(candle_store, archive, symbols, interval, limit=1_000_000):
+    exported = 0
+    for symbol in symbols:
+        klines = candle_store.load(symbol, interval, limit)
+        if not klines:
+            continue
+        # Stored klines keep the Binance column order, which ARCHIVE_COLUMNS follows
+        arrays = {
+            column: np.array([kline[position] for kline in klines], dtype=dtype)
+            for position, (column, dtype) in enumerate(ARCHIVE_COLUMNS.items())
+        }
+        exported += archive.write(symbol, interval, arrays)
+    return exported
+
+
+if __name__ == "__main__":
+    from config.settings import SYMBOLS_TO_MONITOR, CANDLESTICK_INTERVAL, SQLITE3_DATABASE_FILE
+    from utils.candle_store import CandleStore
+
+    parser = argparse.ArgumentParser(description="Export locally stored candles to the columnar archive.")
+    parser.add_argument("--interval", type=str, default=CANDLESTICK_INTERVAL)
+    parser.add_argument("--symbols", nargs="*", default=SYMBOLS_TO_MONITOR)
+    args = parser.parse_args()
+
+    store = CandleStore(SQLITE3_DATABASE_FILE)
+    count = export_store_to_archive(store, CandleArchive(), args.symbols, args.interval)
+    store.close()
+    print(f"Archived {count} candles under {CANDLE_ARCHIVE_DIR}.")
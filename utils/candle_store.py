@@ -0,0 +1,91 @@
+import sqlite3
+import threading
+from config.settings import SQLITE3_DATABASE_FILE
+import logging
+
+logger = logging.getLogger()
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "2h": 2 * 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "6h": 6 * 60 * 60_000,
+    "8h": 8 * 60 * 60_000,
+    "12h": 12 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+    "3d": 3 * 24 * 60 * 60_000,
+    "1w": 7 * 24 * 60 * 60_000,
+}
+
+STORED_COLUMNS = (
+    "open_time", "open", "high", "low", "close", "volume", "close_time",
+    "quote_asset_volume", "number_of_trades", "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume",
+)
+
+
+class CandleStore:
+    def __init__(self, db_path=SQLITE3_DATABASE_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # A single connection shared by the fetch worker threads, serialized by the lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+
+    def last_open_time(self, symbol, interval):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(open_time) FROM candles WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        return row[0] if row else None
+
+    def count_between(self, symbol, interval, start_open_time, end_open_time):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM candles WHERE symbol = ? AND interval = ? AND open_time >= ? AND open_time < ?",
+                (symbol, interval, start_open_time, end_open_time),
+            ).fetchone()
+        return row[0]
+
+    def upsert(self, symbol, interval, klines):
+        rows = [
+            (symbol, interval, int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]),
+             int(k[6]), float(k[7]), int(k[8]), float(k[9]), float(k[10]))
+            for k in klines
+        ]
+        if not rows:
+            return 0
+        columns = ", ".join(STORED_COLUMNS)
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO candles (symbol, interval, {columns}) "
+                    f"VALUES ({', '.join('?' * (len(STORED_COLUMNS) + 2))})",
+                    rows,
+                )
+        return len(rows)
+
+    def load(self, symbol, interval, limit):
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(STORED_COLUMNS)} FROM candles WHERE symbol = ? AND interval = ? "
+                "ORDER BY open_time DESC LIMIT ?",
+                (symbol, interval, limit),
+            ).fetchall()
+        # Restore the raw Binance kline layout, including the trailing "ignore" field
+        return [list(row) + ["0"] for row in reversed(rows)]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,5 +1,8 @@
 import sqlite3
+import threading
+from datetime import datetime, timezone
 from config.settings import SQLITE3_DATABASE_FILE
+from database.schema import SNAPSHOT_COLUMNS
 import logging
 
 logger = logging.getLogger()
@@ -17,3 +20,135 @@ def insert_into_history(symbol, analysis, img):
         logger.warning(f"SQLite error: {e}")
     finally:
         conn.close()
+
+
+class HistoryRepository:
+    def __init__(self, db_path=SQLITE3_DATABASE_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._pending = []
+        # One connection for the whole run instead of one per insert
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL lets the Supabase sync read while a run is writing; NORMAL sync is safe with WAL
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    def add(self, symbol, analysis, img):
+        with self._lock:
+            self._pending.append((symbol, analysis, img))
+
+    def insert_many(self, rows):
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self._lock:
+            with self._conn:
+                self._conn.executemany("INSERT INTO history (symbol, analysis, img) VALUES (?, ?, ?)", rows)
+        return len(rows)
+
+    def flush(self):
+        with self._lock:
+            rows, self._pending = self._pending, []
+        try:
+            return self.insert_many(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite error: {e}")
+            return 0
+
+    def fetch(self, symbol=None, since=None, until=None, limit=None):
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        query = "SELECT id, symbol, analysis, img, timestamp FROM history"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY timestamp, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _to_real(value):
+    # CoinGecko fields fall back to "N/A" and liquidity may be None; both are stored as NULL
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if value != value else value
+
+
+class IndicatorSnapshotRepository:
+    def __init__(self, db_path=SQLITE3_DATABASE_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+
+    def insert_many(self, snapshots, run_at=None):
+        run_at = run_at or datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (run_at, snapshot["symbol"], *(_to_real(snapshot.get(column)) for column in SNAPSHOT_COLUMNS))
+            for snapshot in snapshots
+        ]
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT INTO indicator_snapshots (run_at, symbol, {', '.join(SNAPSHOT_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * (len(SNAPSHOT_COLUMNS) + 2))})",
+                        rows,
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite error: {e}")
+            return 0
+        return len(rows)
+
+    def find(self, column, below=None, above=None, since=None, until=None, symbol=None):
+        if column not in SNAPSHOT_COLUMNS:
+            raise ValueError(f"Unknown indicator column: {column}")
+        clauses, params = [], []
+        for clause, value in ((f"{column} < ?", below), (f"{column} > ?", above), ("run_at >= ?", since),
+                              ("run_at < ?", until), ("symbol = ?", symbol)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        query = f"SELECT run_at, symbol, {', '.join(SNAPSHOT_COLUMNS)} FROM indicator_snapshots"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY run_at, symbol"
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            names = [description[0] for description in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,40 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class StageTimer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = defaultdict(float)
+        self._counts = defaultdict(int)
+
+    @contextmanager
+    def measure(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, elapsed):
+        with self._lock:
+            self._totals[stage] += elapsed
+            self._counts[stage] += 1
+
+    def summary(self):
+        with self._lock:
+            return {
+                stage: {
+                    "count": self._counts[stage],
+                    "total": round(total, 4),
+                    "avg": round(total / self._counts[stage], 4),
+                }
+                for stage, total in self._totals.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+            self._counts.clear()
@@ -1,6 +1,7 @@
 import json
 import ast
 import re
+from concurrent.futures import ThreadPoolExecutor
 from tiktoken import encoding_for_model
 import logging
 
@@ -10,10 +11,15 @@ def count_tokens(input_text, model="gpt-3.5-turbo"):
     encoding = encoding_for_model(model)
     return len(encoding.encode(input_text))
 
-def prepare_currency_data(symbols, binance_client, interval, limit=50):
+def prepare_currency_data(symbols, binance_client, interval, limit=50, max_workers=8):
     currency_data = {}
-    for symbol in symbols:
-        candles = binance_client.fetch_historical_data(symbol, interval=interval, limit=limit)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (symbol, executor.submit(binance_client.fetch_historical_data, symbol, interval=interval, limit=limit))
+            for symbol in symbols
+        ]
+    for symbol, future in futures:
+        candles = future.result()
         if candles is not None:
             currency_data[symbol] = candles.tail(30)
         else: